@@ -1,28 +1,42 @@
 """FastAPI backend for Literature Search Application"""
 
-from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Query
+from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import exists, func, select, tuple_
+from sqlalchemy.orm import Session, selectinload
+from typing import Any, Callable, List, NamedTuple, Optional
 from pathlib import Path
-import json
-
-from src.database.engine import get_db_session, init_db
-from src.database import models as db_models
+import hashlib
+import re
+import tempfile
+import threading
+import anyio
+import orjson
+import requests
+
+from src.database.engine import engine, get_db_session, init_db
+from src.database import fts, models as db_models, stats as library_stats
 from src.models import SearchQuery as SearchQueryModel, Source
 from src.search.orchestrator import SearchOrchestrator
+from src.search.openalex import OpenAlexProvider
+from src.search.semantic_scholar import SemanticScholarProvider
 from src.retrieval.pdf_retriever import PDFRetriever
 from src.auth.ucsb_auth import UCSBAuth
+from src.utils.config import Config
+from src.utils.cache import TTLCache
 
 from . import schemas
+from .responses import JSONCompressionMiddleware, OrjsonResponse, PdfFileResponse, etag_matches
 from .services import paper_service, pdf_service, visualization_service
 
 # Initialize FastAPI
 app = FastAPI(
     title="Literature Search API",
     description="API for academic literature search and management",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=OrjsonResponse
 )
 
 # CORS middleware
@@ -43,21 +57,210 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON payloads above 1 KB (paper lists, networks, visualizations)
+app.add_middleware(JSONCompressionMiddleware, minimum_size=1024, compresslevel=5)
+
+# Shared discovery providers, so their rate limiters apply across requests.
+# Embedding and PDF-parsing services need optional packages (fastembed,
+# pypdf, marker); they are warmed up after startup and injected with
+# get_semantic / get_pdf_extraction.
+openalex_provider = OpenAlexProvider()
+s2_provider = SemanticScholarProvider()
+
+# Semantic Scholar paper ID in a paper URL
+S2_PAPER_ID_RE = re.compile(r'/paper/([a-f0-9]+)')
+
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
     init_db()
+    print(f"✓ Database pool: {engine.pool.status()}")
+
+    # Load saved UCSB cookies once; testing them is a network round trip
+    app.state.ucsb_auth = UCSBAuth()
+    await run_in_threadpool(app.state.ucsb_auth.load_session)
+
+    # Sync handlers run in anyio's threadpool; raise its default cap of 40 threads
+    anyio.to_thread.current_default_thread_limiter().total_tokens = Config.API_THREADPOOL_SIZE
+
+    # Import optional services and load the embedding model off the request
+    # path; startup doesn't wait for it
+    threading.Thread(target=warm_optional_services, args=(app,), daemon=True).start()
     print("✓ FastAPI server started")
 
 
+@app.on_event("shutdown")
+def shutdown_event():
+    pdf_service.shutdown_executor()
+
+
+def warm_optional_services(app: FastAPI):
+    """Preload the semantic search and PDF extraction services into app.state"""
+    try:
+        from src.services.semantic_search import get_semantic_service
+
+        semantic = get_semantic_service()
+        list(semantic.model.embed(["warmup"]))
+        app.state.semantic = semantic
+        print("✓ Semantic search ready")
+    except Exception as e:
+        print(f"⚠ Semantic search not preloaded: {e}")
+
+    try:
+        from src.services.pdf_extraction import get_pdf_service
+
+        app.state.pdf_extraction = get_pdf_service()
+    except Exception as e:
+        print(f"⚠ PDF extraction not preloaded: {e}")
+
+
+def get_semantic(request: Request):
+    """Shared semantic search service, loaded on first use if not yet warm"""
+    semantic = getattr(request.app.state, "semantic", None)
+    if semantic is None:
+        try:
+            from src.services.semantic_search import get_semantic_service
+        except ImportError as e:
+            raise HTTPException(status_code=503, detail=f"Semantic search unavailable: {e}")
+        semantic = request.app.state.semantic = get_semantic_service()
+    return semantic
+
+
+def get_pdf_extraction(request: Request):
+    """Shared PDF extraction service, loaded on first use if not yet warm"""
+    pdf_extraction = getattr(request.app.state, "pdf_extraction", None)
+    if pdf_extraction is None:
+        try:
+            from src.services.pdf_extraction import get_pdf_service
+        except ImportError as e:
+            raise HTTPException(status_code=503, detail=f"PDF extraction unavailable: {e}")
+        pdf_extraction = request.app.state.pdf_extraction = get_pdf_service()
+    return pdf_extraction
+
+
+def get_ucsb_auth(request: Request) -> UCSBAuth:
+    """Shared UCSB auth manager, loaded from disk once per process"""
+    ucsb_auth = getattr(request.app.state, "ucsb_auth", None)
+    if ucsb_auth is None:
+        ucsb_auth = UCSBAuth()
+        ucsb_auth.load_session()
+        request.app.state.ucsb_auth = ucsb_auth
+    return ucsb_auth
+
+
+def get_ucsb_session(ucsb_auth: UCSBAuth = Depends(get_ucsb_auth)) -> Optional[requests.Session]:
+    """UCSB session for institutional access, or None when not authenticated"""
+    # A stat per request; the cookies are only re-read when the file changed
+    ucsb_auth.reload_if_changed()
+    return ucsb_auth.get_session() if ucsb_auth.is_authenticated else None
+
+
+# Short-lived cache for idempotent GET responses, cleared on every write
+RESPONSE_CACHE_TTL = 60
+response_cache = TTLCache(maxsize=1024, ttl=RESPONSE_CACHE_TTL)
+
+# Bumped whenever cached responses are dropped, so a payload computed from
+# data read before a write isn't stored after the write cleared the cache
+_response_generation = 0
+_response_generation_lock = threading.Lock()
+
+
+class UncachedPayload(NamedTuple):
+    """Payload for cached_response to serve without storing, e.g. one built from a failed fetch"""
+    payload: Any
+
+
+def cached_response(request: Request, compute: Callable[[], Any]) -> Response:
+    """
+    Serve an idempotent GET response from response_cache
+
+    Entries are keyed on the request path and query string. The ETag is
+    computed once when the entry is filled; clients must revalidate with
+    If-None-Match on every use and get a 304 back while it is unchanged, so
+    their own writes show up immediately.
+
+    Args:
+        request: Incoming request
+        compute: Builds the response payload on a cache miss, wrapped in
+            UncachedPayload if it must not be stored
+
+    Returns:
+        JSON response, or an empty 304 if the client copy is current
+    """
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+    entry = response_cache.get(key)
+    if entry is None:
+        generation = _response_generation
+        payload = compute()
+        cacheable = not isinstance(payload, UncachedPayload)
+        if not cacheable:
+            payload = payload.payload
+
+        payload = jsonable_encoder(payload)
+        digest = hashlib.sha1(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        entry = (payload, f'"{digest}"')
+        with _response_generation_lock:
+            if cacheable and generation == _response_generation:
+                response_cache.set(key, entry)
+
+    payload, etag = entry
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return OrjsonResponse(payload, headers=headers)
+
+
+def invalidate_cached_responses(db: Session):
+    """
+    Drop cached GET responses after the library has been modified
+
+    Also queues a refresh of the materialized visualization payloads and
+    drops the cached visualization responses again once they are rebuilt.
+    """
+    _drop_cached_responses()
+    visualization_service.schedule_refresh(
+        db.get_bind(), on_refreshed=clear_visualization_responses
+    )
+
+
+def clear_visualization_responses():
+    """Drop cached /api/visualize responses so they pick up refreshed payloads"""
+    _drop_cached_responses(lambda key: key[0].startswith("/api/visualize/"))
+
+
+def _drop_cached_responses(predicate: Optional[Callable[[Any], bool]] = None):
+    """Remove cached responses (all, or those matching predicate) and discard any still being computed"""
+    global _response_generation
+    with _response_generation_lock:
+        _response_generation += 1
+        if predicate is None:
+            response_cache.clear()
+        else:
+            response_cache.delete_where(predicate)
+
+
+# External search results, keyed on the search parameters. Searches are still
+# saved and recorded on a hit; only the provider round trips are skipped.
+SEARCH_CACHE_TTL = 300
+search_results_cache = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+
+
+# NOTE: The database layer uses a synchronous SQLAlchemy Session. Handlers that
+# only do blocking work are declared with plain `def` so FastAPI dispatches them
+# to its threadpool instead of running them on the event loop. Handlers that
+# need `await` push their blocking calls through `run_in_threadpool`.
+
 # =============================================================================
 # SEARCH ENDPOINTS
 # =============================================================================
 
 @app.post("/api/search", response_model=schemas.SearchResultResponse)
-async def search_papers(
+def search_papers(
     query: schemas.SearchRequest,
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    ucsb_session: Optional[requests.Session] = Depends(get_ucsb_session)
 ):
     """Execute a literature search"""
     try:
@@ -70,37 +273,36 @@ async def search_papers(
             year_end=query.year_end
         )
 
-        # Try to load UCSB auth for enhanced access to Scholar and WoS
-        ucsb_auth = UCSBAuth()
-        ucsb_session = None
-        if ucsb_auth.load_session():
-            ucsb_session = ucsb_auth.get_session()
-
-        # Execute search with UCSB session if available
-        orchestrator = SearchOrchestrator(ucsb_session=ucsb_session)
-        results = orchestrator.search(search_query)
-
-        # Save to database
-        saved_papers = []
-        for paper in results.papers:
-            db_paper = paper_service.save_paper(db, paper)
-            saved_papers.append(db_paper)
+        # Execute search with UCSB session if available, reusing a recent
+        # identical search
+        cache_key = (
+            query.query, tuple(query.sources), query.max_results,
+            query.year_start, query.year_end, ucsb_session is not None
+        )
+        results = search_results_cache.get(cache_key)
+        if results is None:
+            orchestrator = SearchOrchestrator(ucsb_session=ucsb_session)
+            results = orchestrator.search(search_query)
+            search_results_cache.set(cache_key, results)
 
-        # Save search history
+        # Save search history; it is committed together with the papers
         search_history = db_models.SearchHistory(
             query=query.query,
-            sources=json.dumps(query.sources),
-            filters=json.dumps({
+            sources=query.sources,
+            filters={
                 "year_start": query.year_start,
                 "year_end": query.year_end
-            }),
+            },
             results_count=len(results.papers)
         )
         db.add(search_history)
-        db.commit()
+
+        # Save to database
+        saved_papers = paper_service.save_papers_bulk(db, results.papers)
+        invalidate_cached_responses(db)
 
         return {
-            "papers": [paper_service.paper_to_schema(p) for p in saved_papers],
+            "papers": paper_service.papers_to_schema(saved_papers),
             "total_found": results.total_found,
             "search_time": results.search_time,
             "sources_searched": [s.value for s in results.sources_searched],
@@ -112,120 +314,169 @@ async def search_papers(
 
 
 @app.get("/api/search/history", response_model=List[schemas.SearchHistoryItem])
-async def get_search_history(
+def get_search_history(
+    request: Request,
     limit: int = Query(50, ge=1, le=500),
     db: Session = Depends(get_db_session)
 ):
     """Get search history"""
-    history = db.query(db_models.SearchHistory)\
-        .order_by(db_models.SearchHistory.searched_at.desc())\
-        .limit(limit)\
-        .all()
+    def build():
+        history = db.query(db_models.SearchHistory)\
+            .order_by(db_models.SearchHistory.searched_at.desc())\
+            .limit(limit)\
+            .all()
+        return [schemas.SearchHistoryItem.model_validate(h) for h in history]
 
-    return history
+    return cached_response(request, build)
 
 
 # =============================================================================
 # PAPER ENDPOINTS
 # =============================================================================
 
-@app.get("/api/papers", response_model=schemas.PaperListResponse)
-async def list_papers(
+# Built as plain dicts from column rows, skipping ORM loading and
+# response-model validation; the schema is still documented through responses=
+@app.get("/api/papers", response_model=None,
+         responses={200: {"model": schemas.PaperListResponse}})
+def list_papers(
+    request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     collection_id: Optional[int] = None,
     tag: Optional[str] = None,
     year: Optional[int] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db_session)
 ):
-    """List papers with pagination and filters"""
-    query = db.query(db_models.Paper)
-
-    # Apply filters
-    if collection_id:
-        query = query.filter(db_models.Paper.collections.any(id=collection_id))
-    if tag:
-        query = query.filter(db_models.Paper.tags.any(name=tag))
-    if year:
-        query = query.filter(db_models.Paper.year == year)
-
-    # Pagination
-    total = query.count()
-    papers = query.order_by(db_models.Paper.created_at.desc())\
-        .offset((page - 1) * page_size)\
-        .limit(page_size)\
-        .all()
+    """
+    List papers with pagination and filters
+
+    Pass the returned next_cursor back as cursor to fetch the following page
+    with an index seek; page-number pagination is kept for existing clients.
+    """
+    def build():
+        filtered = select(db_models.Paper.id)
+        stmt = select(*paper_service.PAPER_ROW_COLUMNS)
+
+        # Apply filters
+        conditions = []
+        if collection_id:
+            conditions.append(db_models.Paper.collections.any(id=collection_id))
+        if tag:
+            conditions.append(db_models.Paper.tags.any(name=tag))
+        if year:
+            conditions.append(db_models.Paper.year == year)
+        filtered = filtered.where(*conditions)
+        stmt = stmt.where(*conditions)\
+            .order_by(db_models.Paper.created_at.desc(), db_models.Paper.id.desc())
+
+        def count_filtered():
+            return db.scalar(select(func.count()).select_from(filtered.subquery()))
+
+        # Fetch one extra row to learn whether another page follows
+        if cursor:
+            try:
+                cursor_created_at, cursor_id = paper_service.decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            papers = db.execute(stmt.where(
+                tuple_(db_models.Paper.created_at, db_models.Paper.id) < (cursor_created_at, cursor_id)
+            ).limit(page_size + 1)).all()
+            total = count_filtered()
+        else:
+            # The window count is taken before OFFSET/LIMIT, so the total
+            # comes back with the page rows in one query
+            papers = db.execute(
+                stmt.add_columns(func.count().over().label("total"))
+                .offset((page - 1) * page_size)
+                .limit(page_size + 1)
+            ).all()
+            total = papers[0].total if papers else (count_filtered() if page > 1 else 0)
+
+        next_cursor = None
+        if len(papers) > page_size:
+            papers = papers[:page_size]
+            next_cursor = paper_service.encode_cursor(papers[-1])
 
-    return {
-        "papers": [paper_service.paper_to_schema(p) for p in papers],
-        "total": total,
-        "page": page,
-        "page_size": page_size,
-        "pages": (total + page_size - 1) // page_size
-    }
+        return {
+            "papers": paper_service.paper_rows_to_dicts(db, papers),
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "pages": (total + page_size - 1) // page_size,
+            "next_cursor": next_cursor
+        }
+
+    return cached_response(request, build)
 
 
 # NOTE: This route MUST be before /api/papers/{paper_id} to avoid "search" being treated as paper_id
 @app.get("/api/papers/search")
-async def full_text_search(
+def full_text_search(
     q: str = Query(..., min_length=1),
     limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db_session)
 ):
     """Full-text search across papers and PDFs"""
     results = paper_service.full_text_search(db, q, limit)
-    return {"results": [paper_service.paper_to_schema(p) for p in results]}
+    return {"results": paper_service.papers_to_schema(results)}
 
 
 @app.get("/api/papers/{paper_id}", response_model=schemas.Paper)
-async def get_paper(paper_id: int, db: Session = Depends(get_db_session)):
+def get_paper(paper_id: int, db: Session = Depends(get_db_session)):
     """Get paper details"""
-    paper = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
+    paper = db.query(db_models.Paper)\
+        .options(*paper_service.SCHEMA_LOAD_OPTIONS)\
+        .filter(db_models.Paper.id == paper_id)\
+        .first()
     if not paper:
         raise HTTPException(status_code=404, detail="Paper not found")
     return paper_service.paper_to_schema(paper)
 
 
 @app.delete("/api/papers/{paper_id}")
-async def delete_paper(paper_id: int, db: Session = Depends(get_db_session)):
+def delete_paper(paper_id: int, db: Session = Depends(get_db_session)):
     """Delete a paper"""
-    paper = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
-    if not paper:
+    if not paper_service.delete_paper(db, paper_id):
         raise HTTPException(status_code=404, detail="Paper not found")
 
-    db.delete(paper)
-    db.commit()
+    invalidate_cached_responses(db)
     return {"message": "Paper deleted"}
 
 
 @app.get("/api/papers/{paper_id}/pdf")
-async def get_paper_pdf(paper_id: int, db: Session = Depends(get_db_session)):
+def get_paper_pdf(request: Request, paper_id: int, db: Session = Depends(get_db_session)):
     """Get paper PDF"""
-    paper = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
-    if not paper or not paper.local_pdf_path:
+    local_pdf_path = db.query(db_models.Paper.local_pdf_path)\
+        .filter(db_models.Paper.id == paper_id)\
+        .scalar()
+    if not local_pdf_path:
         raise HTTPException(status_code=404, detail="PDF not found")
 
-    pdf_path = Path(paper.local_pdf_path)
-    if not pdf_path.exists():
+    pdf_path = Path(local_pdf_path)
+    try:
+        stat = pdf_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="PDF file not found")
 
-    return FileResponse(
+    # Downloaded PDFs only change when the file is replaced, so mtime and size
+    # identify the version; browsers revalidate with If-None-Match
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=86400"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    return PdfFileResponse(
         pdf_path,
         media_type="application/pdf",
-        filename=pdf_path.name
+        filename=pdf_path.name,
+        stat_result=stat,
+        headers=headers
     )
 
 
-@app.post("/api/papers/{paper_id}/extract-text")
-async def extract_pdf_text(paper_id: int, db: Session = Depends(get_db_session)):
-    """Extract text from PDF"""
-    paper = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
-    if not paper or not paper.local_pdf_path:
-        raise HTTPException(status_code=404, detail="PDF not found")
-
-    text, page_count = pdf_service.extract_text_from_pdf(paper.local_pdf_path)
-
-    # Save to database
+def save_pdf_text(db: Session, paper_id: int, text: str, page_count: int):
+    """Store extracted PDF text for a paper"""
     pdf_content = db.query(db_models.PDFContent)\
         .filter(db_models.PDFContent.paper_id == paper_id)\
         .first()
@@ -242,71 +493,59 @@ async def extract_pdf_text(paper_id: int, db: Session = Depends(get_db_session))
         db.add(pdf_content)
 
     db.commit()
-
-    return {"message": "Text extracted", "page_count": page_count, "text_length": len(text)}
+    invalidate_cached_responses(db)
 
 
-# =============================================================================
-# DOWNLOAD ENDPOINTS
-# =============================================================================
-
-@app.post("/api/download/{paper_id}")
-async def download_paper(paper_id: int, db: Session = Depends(get_db_session)):
-    """Download PDF for a paper"""
-    paper_db = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
-    if not paper_db:
-        raise HTTPException(status_code=404, detail="Paper not found")
+@app.post("/api/papers/{paper_id}/extract-text")
+async def extract_pdf_text(paper_id: int, db: Session = Depends(get_db_session)):
+    """Extract text from PDF"""
+    local_pdf_path = await run_in_threadpool(
+        lambda: db.query(db_models.Paper.local_pdf_path)
+            .filter(db_models.Paper.id == paper_id)
+            .scalar()
+    )
+    if not local_pdf_path:
+        raise HTTPException(status_code=404, detail="PDF not found")
 
-    # Convert to Paper model
-    paper = paper_service.db_to_paper_model(paper_db)
+    # Parse in the process pool; only the path crosses the process boundary
+    text, page_count = await pdf_service.extract_text_async(local_pdf_path)
 
-    # Try to load UCSB auth
-    ucsb_auth = UCSBAuth()
-    ucsb_session = None
-    if ucsb_auth.load_session():
-        ucsb_session = ucsb_auth.get_session()
+    # Save to database
+    await run_in_threadpool(save_pdf_text, db, paper_id, text, page_count)
 
-    # Download
-    retriever = PDFRetriever(ucsb_session=ucsb_session)
-    success, result = retriever.download_paper(paper)
+    return {"message": "Text extracted", "page_count": page_count, "text_length": len(text)}
 
-    if success:
-        # Update database
-        paper_db.local_pdf_path = result
-        db.commit()
-        return {"success": True, "path": result}
-    else:
-        return {"success": False, "error": result}
 
+# =============================================================================
+# DOWNLOAD ENDPOINTS
+# =============================================================================
 
+# Registered before /api/download/{paper_id}, which would otherwise match "batch"
 @app.post("/api/download/batch")
-async def batch_download(
+def batch_download(
     paper_ids: List[int],
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    ucsb_session: Optional[requests.Session] = Depends(get_ucsb_session)
 ):
     """Batch download PDFs"""
-    papers = db.query(db_models.Paper).filter(db_models.Paper.id.in_(paper_ids)).all()
+    papers = db.query(db_models.Paper)\
+        .options(selectinload(db_models.Paper.authors))\
+        .filter(db_models.Paper.id.in_(paper_ids))\
+        .all()
 
     # Convert to Paper models
     paper_models = [paper_service.db_to_paper_model(p) for p in papers]
 
-    # Try to load UCSB auth
-    ucsb_auth = UCSBAuth()
-    ucsb_session = None
-    if ucsb_auth.load_session():
-        ucsb_session = ucsb_auth.get_session()
-
     # Download
     retriever = PDFRetriever(ucsb_session=ucsb_session)
     results = retriever.download_papers(paper_models)
 
-    # Update database
+    # Update database; each result carries its position in paper_models
     for item in results['successful']:
-        paper_db = next((p for p in papers if p.title == item['paper'].title), None)
-        if paper_db:
-            paper_db.local_pdf_path = item['filepath']
+        papers[item['index']].local_pdf_path = item['filepath']
 
     db.commit()
+    invalidate_cached_responses(db)
 
     return {
         "successful": len(results['successful']),
@@ -315,19 +554,47 @@ async def batch_download(
     }
 
 
+@app.post("/api/download/{paper_id}")
+def download_paper(
+    paper_id: int,
+    db: Session = Depends(get_db_session),
+    ucsb_session: Optional[requests.Session] = Depends(get_ucsb_session)
+):
+    """Download PDF for a paper"""
+    paper_db = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
+    if not paper_db:
+        raise HTTPException(status_code=404, detail="Paper not found")
+
+    # Convert to Paper model
+    paper = paper_service.db_to_paper_model(paper_db)
+
+    # Download
+    retriever = PDFRetriever(ucsb_session=ucsb_session)
+    success, result = retriever.download_paper(paper)
+
+    if success:
+        # Update database
+        paper_db.local_pdf_path = result
+        db.commit()
+        invalidate_cached_responses(db)
+        return {"success": True, "path": result}
+    else:
+        return {"success": False, "error": result}
+
+
 # =============================================================================
 # COLLECTIONS ENDPOINTS
 # =============================================================================
 
 @app.get("/api/collections", response_model=List[schemas.Collection])
-async def list_collections(db: Session = Depends(get_db_session)):
+def list_collections(db: Session = Depends(get_db_session)):
     """List all collections"""
     collections = db.query(db_models.Collection).all()
     return collections
 
 
 @app.post("/api/collections", response_model=schemas.Collection)
-async def create_collection(
+def create_collection(
     collection: schemas.CollectionCreate,
     db: Session = Depends(get_db_session)
 ):
@@ -343,21 +610,16 @@ async def create_collection(
 
 
 @app.post("/api/collections/{collection_id}/papers/{paper_id}")
-async def add_paper_to_collection(
+def add_paper_to_collection(
     collection_id: int,
     paper_id: int,
     db: Session = Depends(get_db_session)
 ):
     """Add paper to collection"""
-    collection = db.query(db_models.Collection).filter(db_models.Collection.id == collection_id).first()
-    paper = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
-
-    if not collection or not paper:
+    if not paper_service.add_to_collection(db, collection_id, paper_id):
         raise HTTPException(status_code=404, detail="Collection or paper not found")
 
-    if paper not in collection.papers:
-        collection.papers.append(paper)
-        db.commit()
+    invalidate_cached_responses(db)
 
     return {"message": "Paper added to collection"}
 
@@ -367,30 +629,39 @@ async def add_paper_to_collection(
 # =============================================================================
 
 @app.get("/api/visualize/timeline")
-async def get_timeline_data(
+def get_timeline_data(
+    request: Request,
     collection_id: Optional[int] = None,
     db: Session = Depends(get_db_session)
 ):
     """Get timeline visualization data"""
-    return visualization_service.get_timeline_data(db, collection_id)
+    return cached_response(
+        request, lambda: visualization_service.get_cached_visualization(db, "timeline", collection_id)
+    )
 
 
 @app.get("/api/visualize/network")
-async def get_citation_network(
+def get_citation_network(
+    request: Request,
     collection_id: Optional[int] = None,
     db: Session = Depends(get_db_session)
 ):
     """Get citation network data"""
-    return visualization_service.get_citation_network(db, collection_id)
+    return cached_response(
+        request, lambda: visualization_service.get_cached_visualization(db, "network", collection_id)
+    )
 
 
 @app.get("/api/visualize/topics")
-async def get_topic_clusters(
+def get_topic_clusters(
+    request: Request,
     collection_id: Optional[int] = None,
     db: Session = Depends(get_db_session)
 ):
     """Get topic clustering data"""
-    return visualization_service.get_topic_clusters(db, collection_id)
+    return cached_response(
+        request, lambda: visualization_service.get_cached_visualization(db, "topics", collection_id)
+    )
 
 
 # =============================================================================
@@ -398,10 +669,11 @@ async def get_topic_clusters(
 # =============================================================================
 
 @app.post("/api/auth/import-cookies")
-async def import_cookies(file: UploadFile = File(...)):
+async def import_cookies(
+    file: UploadFile = File(...),
+    ucsb_auth: UCSBAuth = Depends(get_ucsb_auth)
+):
     """Import UCSB cookies"""
-    import tempfile
-
     # Save uploaded file temporarily
     with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as tmp:
         content = await file.read()
@@ -409,8 +681,8 @@ async def import_cookies(file: UploadFile = File(...)):
         tmp_path = Path(tmp.name)
 
     try:
-        ucsb_auth = UCSBAuth()
-        success = ucsb_auth.import_cookies_netscape(tmp_path)
+        # Cookie import tests the session over the network, keep it off the event loop
+        success = await run_in_threadpool(ucsb_auth.import_cookies_netscape, tmp_path)
 
         return {
             "success": success,
@@ -421,17 +693,14 @@ async def import_cookies(file: UploadFile = File(...)):
 
 
 @app.get("/api/auth/status")
-async def auth_status():
+def auth_status(ucsb_auth: UCSBAuth = Depends(get_ucsb_auth)):
     """Get UCSB authentication status"""
-    ucsb_auth = UCSBAuth()
-    ucsb_auth.load_session()
     return ucsb_auth.get_status()
 
 
 @app.delete("/api/auth/clear")
-async def clear_auth():
+def clear_auth(ucsb_auth: UCSBAuth = Depends(get_ucsb_auth)):
     """Clear UCSB authentication"""
-    ucsb_auth = UCSBAuth()
     ucsb_auth.clear_session()
     return {"message": "Authentication cleared"}
 
@@ -441,7 +710,7 @@ async def clear_auth():
 # =============================================================================
 
 @app.get("/api/papers/{paper_id}/recommendations")
-async def get_paper_recommendations(
+def get_paper_recommendations(
     paper_id: int,
     limit: int = Query(10, ge=1, le=50),
     db: Session = Depends(get_db_session)
@@ -454,8 +723,6 @@ async def get_paper_recommendations(
 
     try:
         # Try Semantic Scholar first (best recommendations)
-        from src.search.semantic_scholar import SemanticScholarProvider
-        s2_provider = SemanticScholarProvider()
 
         # Use paper DOI or title to get S2 ID
         s2_id = None
@@ -463,9 +730,8 @@ async def get_paper_recommendations(
             s2_paper = s2_provider.get_paper_by_id(f"DOI:{paper.doi}")
             if s2_paper:
                 # Extract S2 ID from URL
-                import re
                 if s2_paper.url:
-                    match = re.search(r'/paper/([a-f0-9]+)', str(s2_paper.url))
+                    match = S2_PAPER_ID_RE.search(str(s2_paper.url))
                     if match:
                         s2_id = match.group(1)
 
@@ -474,14 +740,12 @@ async def get_paper_recommendations(
             recommendations = s2_provider.get_recommendations(s2_id, limit=limit)
 
         # Save recommendations to database
-        saved_recs = []
-        for rec_paper in recommendations:
-            db_paper = paper_service.save_paper(db, rec_paper)
-            saved_recs.append(db_paper)
+        saved_recs = paper_service.save_papers_bulk(db, recommendations)
+        invalidate_cached_responses(db)
 
         return {
             "paper_id": paper_id,
-            "recommendations": [paper_service.paper_to_schema(p) for p in saved_recs],
+            "recommendations": paper_service.papers_to_schema(saved_recs),
             "total": len(saved_recs),
             "source": "semantic_scholar"
         }
@@ -491,7 +755,7 @@ async def get_paper_recommendations(
 
 
 @app.get("/api/papers/{paper_id}/citations")
-async def get_paper_citations(
+def get_paper_citations(
     paper_id: int,
     limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db_session)
@@ -503,22 +767,18 @@ async def get_paper_citations(
 
     try:
         # Try OpenAlex for citation network
-        from src.search.openalex import OpenAlexProvider
-        openalex = OpenAlexProvider()
 
         citing_papers = []
         if paper.doi:
-            citing_papers = openalex.get_citations(f"https://doi.org/{paper.doi}", limit=limit)
+            citing_papers = openalex_provider.get_citations(f"https://doi.org/{paper.doi}", limit=limit)
 
         # Save citing papers
-        saved_citations = []
-        for citing_paper in citing_papers:
-            db_paper = paper_service.save_paper(db, citing_paper)
-            saved_citations.append(db_paper)
+        saved_citations = paper_service.save_papers_bulk(db, citing_papers)
+        invalidate_cached_responses(db)
 
         return {
             "paper_id": paper_id,
-            "citations": [paper_service.paper_to_schema(p) for p in saved_citations],
+            "citations": paper_service.papers_to_schema(saved_citations),
             "total": len(saved_citations),
             "source": "openalex"
         }
@@ -528,7 +788,7 @@ async def get_paper_citations(
 
 
 @app.get("/api/papers/{paper_id}/references")
-async def get_paper_references(
+def get_paper_references(
     paper_id: int,
     limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db_session)
@@ -540,22 +800,18 @@ async def get_paper_references(
 
     try:
         # Try OpenAlex for references
-        from src.search.openalex import OpenAlexProvider
-        openalex = OpenAlexProvider()
 
         references = []
         if paper.doi:
-            references = openalex.get_references(f"https://doi.org/{paper.doi}", limit=limit)
+            references = openalex_provider.get_references(f"https://doi.org/{paper.doi}", limit=limit)
 
         # Save references
-        saved_refs = []
-        for ref_paper in references:
-            db_paper = paper_service.save_paper(db, ref_paper)
-            saved_refs.append(db_paper)
+        saved_refs = paper_service.save_papers_bulk(db, references)
+        invalidate_cached_responses(db)
 
         return {
             "paper_id": paper_id,
-            "references": [paper_service.paper_to_schema(p) for p in saved_refs],
+            "references": paper_service.papers_to_schema(saved_refs),
             "total": len(saved_refs),
             "source": "openalex"
         }
@@ -565,7 +821,7 @@ async def get_paper_references(
 
 
 @app.get("/api/papers/{paper_id}/related")
-async def get_related_papers(
+def get_related_papers(
     paper_id: int,
     limit: int = Query(10, ge=1, le=50),
     db: Session = Depends(get_db_session)
@@ -577,23 +833,19 @@ async def get_related_papers(
 
     try:
         # Use OpenAlex concept-based similarity
-        from src.search.openalex import OpenAlexProvider
-        openalex = OpenAlexProvider()
 
         related_papers = []
         if paper.doi:
             openalex_id = f"https://doi.org/{paper.doi}"
-            related_papers = openalex.get_related_papers(openalex_id, limit=limit)
+            related_papers = openalex_provider.get_related_papers(openalex_id, limit=limit)
 
         # Save related papers
-        saved_related = []
-        for rel_paper in related_papers:
-            db_paper = paper_service.save_paper(db, rel_paper)
-            saved_related.append(db_paper)
+        saved_related = paper_service.save_papers_bulk(db, related_papers)
+        invalidate_cached_responses(db)
 
         return {
             "paper_id": paper_id,
-            "related_papers": [paper_service.paper_to_schema(p) for p in saved_related],
+            "related_papers": paper_service.papers_to_schema(saved_related),
             "total": len(saved_related),
             "source": "openalex"
         }
@@ -603,7 +855,7 @@ async def get_related_papers(
 
 
 @app.get("/api/papers/{paper_id}/network")
-async def get_citation_network(
+def get_citation_network(
     paper_id: int,
     depth: int = Query(1, ge=1, le=2),
     db: Session = Depends(get_db_session)
@@ -614,8 +866,6 @@ async def get_citation_network(
         raise HTTPException(status_code=404, detail="Paper not found")
 
     try:
-        from src.search.openalex import OpenAlexProvider
-        openalex = OpenAlexProvider()
 
         # Build network
         network = {
@@ -634,10 +884,14 @@ async def get_citation_network(
         if paper.doi:
             openalex_id = f"https://doi.org/{paper.doi}"
 
-            # Get forward citations (papers citing this)
-            citing = openalex.get_citations(openalex_id, limit=20)
-            for citing_paper in citing[:10]:  # Limit for visualization
-                db_paper = paper_service.save_paper(db, citing_paper)
+            # Fetch forward citations and references concurrently (10 each for visualization)
+            citing, refs = openalex_provider.get_citations_and_references(openalex_id, limit=10)
+
+            # Save both directions in one transaction; results keep input order
+            saved = paper_service.save_papers_bulk(db, citing + refs)
+
+            # Papers citing this one
+            for db_paper in saved[:len(citing)]:
                 network["citations"].append({
                     "id": db_paper.id,
                     "title": db_paper.title,
@@ -645,10 +899,8 @@ async def get_citation_network(
                     "citations": db_paper.citations
                 })
 
-            # Get backward citations (papers cited by this)
-            refs = openalex.get_references(openalex_id, limit=20)
-            for ref_paper in refs[:10]:  # Limit for visualization
-                db_paper = paper_service.save_paper(db, ref_paper)
+            # Papers cited by this one
+            for db_paper in saved[len(citing):]:
                 network["references"].append({
                     "id": db_paper.id,
                     "title": db_paper.title,
@@ -656,6 +908,8 @@ async def get_citation_network(
                     "citations": db_paper.citations
                 })
 
+            invalidate_cached_responses(db)
+
         # Build nodes and edges for graph visualization
         network["nodes"].append({"id": paper.id, "label": paper.title[:50] + "...", "type": "seed"})
 
@@ -685,12 +939,13 @@ async def summarize_papers(
     """Generate AI summaries for papers"""
     try:
         from src.services.llm_service import get_llm_service
-        import asyncio
 
         llm = get_llm_service()
 
-        # Get papers from database
-        papers = db.query(db_models.Paper).filter(db_models.Paper.id.in_(paper_ids)).all()
+        # Get papers from database (sync Session, so run it in the threadpool)
+        papers = await run_in_threadpool(
+            lambda: db.query(db_models.Paper).filter(db_models.Paper.id.in_(paper_ids)).all()
+        )
 
         if not papers:
             return {"summaries": []}
@@ -711,7 +966,7 @@ async def summarize_papers(
 
 
 @app.post("/api/ai/extract")
-async def extract_data(
+def extract_data(
     paper_id: int = Query(...),
     fields: List[str] = Query(...),
     db: Session = Depends(get_db_session)
@@ -747,7 +1002,7 @@ async def extract_data(
 
 
 @app.post("/api/ai/custom-column")
-async def extract_custom_column(
+def extract_custom_column(
     paper_ids: List[int],
     column_name: str,
     column_description: str,
@@ -781,7 +1036,7 @@ async def extract_custom_column(
 
 
 @app.post("/api/ai/compare")
-async def compare_papers(
+def compare_papers(
     paper_ids: List[int],
     aspect: str = "findings",
     db: Session = Depends(get_db_session)
@@ -815,111 +1070,110 @@ async def compare_papers(
 # SEMANTIC SEARCH
 # =============================================================================
 
-@app.post("/api/search/semantic")
-async def semantic_search(
+# Full-text matches passed on to the semantic rerank when no paper_ids are given
+SEMANTIC_CANDIDATES = 200
+
+
+@app.post("/api/search/semantic", response_model=None)
+def semantic_search(
     query: str,
     paper_ids: Optional[List[int]] = None,
     top_k: int = 20,
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    semantic=Depends(get_semantic)
 ):
     """Perform semantic search/reranking on papers"""
     try:
-        from src.services.semantic_search import get_semantic_service
-
-        semantic = get_semantic_service()
-
-        # Get papers to search
+        # Plain column rows: no ORM objects or per-paper dicts
+        stmt = select(
+            db_models.Paper.id, db_models.Paper.title, db_models.Paper.abstract,
+            db_models.Paper.year, db_models.Paper.citations
+        )
         if paper_ids:
-            papers = db.query(db_models.Paper).filter(db_models.Paper.id.in_(paper_ids)).all()
+            stmt = stmt.where(db_models.Paper.id.in_(paper_ids))
         else:
-            # Search all papers
-            papers = db.query(db_models.Paper).limit(500).all()
-
-        if not papers:
-            return {"results": []}
-
-        # Convert to dicts
-        paper_dicts = [
-            {
-                "id": p.id,
-                "title": p.title,
-                "abstract": p.abstract,
-                "year": p.year,
-                "citations": p.citations
-            }
-            for p in papers
-        ]
+            # Narrow the library to the best text matches with the full-text
+            # index, so the encoder only scores those; fall back to a capped
+            # scan when no paper shares a word with the query
+            candidate_ids = fts.search_paper_ids(
+                db, query, SEMANTIC_CANDIDATES, any_term=True
+            ) if fts.is_supported(db) else []
+            if candidate_ids:
+                stmt = stmt.where(db_models.Paper.id.in_(candidate_ids))
+            else:
+                stmt = stmt.limit(500)
+
+        rows = db.execute(stmt).all()
+        if not rows:
+            return OrjsonResponse({"results": []})
+
+        ids, titles, abstracts, years, citations = zip(*rows)
 
         # Semantic rerank
-        results = semantic.rerank_papers(query, paper_dicts, top_k=top_k)
+        results = semantic.rerank_texts(query, titles, abstracts, top_k=top_k)
 
-        return {
+        return OrjsonResponse({
             "results": [
                 {
-                    "paper_id": paper["id"],
-                    "title": paper["title"],
-                    "year": paper["year"],
-                    "citations": paper["citations"],
+                    "paper_id": ids[i],
+                    "title": titles[i],
+                    "year": years[i],
+                    "citations": citations[i],
                     "similarity_score": float(score)
                 }
-                for paper, score in results
+                for i, score in results
             ]
-        }
+        })
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/papers/{paper_id}/similar")
-async def find_similar_papers(
+def find_similar_papers(
     paper_id: int,
     top_k: int = 5,
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    semantic=Depends(get_semantic)
 ):
     """Find papers similar to a given paper"""
     try:
-        from src.services.semantic_search import get_semantic_service
-
-        semantic = get_semantic_service()
-
-        # Get target paper
-        paper = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
-        if not paper:
+        if not db.scalar(exists().where(db_models.Paper.id == paper_id).select()):
             raise HTTPException(status_code=404, detail="Paper not found")
 
-        # Get all other papers
-        all_papers = db.query(db_models.Paper).filter(db_models.Paper.id != paper_id).limit(500).all()
+        # Titles and abstracts are only read when the library changed since
+        # the index was last synced; fingerprint first so a write in between
+        # just triggers another sync next time
+        results = semantic.find_similar_by_id(
+            paper_id,
+            visualization_service.library_fingerprint(db, 0),
+            lambda: db.execute(
+                select(db_models.Paper.id, db_models.Paper.title, db_models.Paper.abstract)
+            ).all(),
+            top_k=top_k
+        )
 
-        # Convert to dicts
-        paper_dict = {
-            "id": paper.id,
-            "title": paper.title,
-            "abstract": paper.abstract
+        # Fetch the matches in one query
+        similar_ids = [similar_id for similar_id, _ in results]
+        papers_by_id = {
+            row.id: row
+            for row in db.execute(
+                select(db_models.Paper.id, db_models.Paper.title, db_models.Paper.year)
+                .where(db_models.Paper.id.in_(similar_ids))
+            )
         }
-        all_dicts = [
-            {
-                "id": p.id,
-                "title": p.title,
-                "abstract": p.abstract,
-                "year": p.year,
-                "citations": p.citations
-            }
-            for p in all_papers
-        ]
-
-        # Find similar
-        results = semantic.find_similar_papers(paper_dict, all_dicts, top_k=top_k)
 
         return {
             "paper_id": paper_id,
             "similar": [
                 {
-                    "paper_id": p["id"],
-                    "title": p["title"],
-                    "year": p["year"],
+                    "paper_id": similar_id,
+                    "title": papers_by_id[similar_id].title,
+                    "year": papers_by_id[similar_id].year,
                     "similarity_score": float(score)
                 }
-                for p, score in results
+                for similar_id, score in results
+                if similar_id in papers_by_id
             ]
         }
 
@@ -934,15 +1188,13 @@ async def find_similar_papers(
 # =============================================================================
 
 @app.get("/api/network/d3/{paper_id}")
-async def get_d3_network(
+def get_d3_network(
+    request: Request,
     paper_id: int,
     db: Session = Depends(get_db_session)
 ):
     """Get citation network in D3.js format"""
-    try:
-        from src.search.openalex import OpenAlexProvider
-        openalex = OpenAlexProvider()
-
+    def build():
         # Get paper
         paper = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
         if not paper:
@@ -951,42 +1203,61 @@ async def get_d3_network(
         # Build D3 format nodes and links
         nodes = [{"id": str(paper_id), "title": paper.title, "type": "seed", "citations": paper.citations or 0}]
         links = []
+        # A network missing what failed to load is served but not cached
+        complete = True
 
         # Get citations and references from OpenAlex if paper has DOI
         if paper.doi:
             openalex_id = f"https://doi.org/{paper.doi}"
 
-            # Get forward citations (papers citing this)
+            # Fetch forward citations and references concurrently
             try:
-                citing_papers = openalex.get_citations(openalex_id, limit=10)
-                for citing_paper in citing_papers:
-                    db_paper = paper_service.save_paper(db, citing_paper)
-                    nodes.append({
-                        "id": str(db_paper.id),
-                        "title": db_paper.title,
-                        "type": "citing",
-                        "citations": db_paper.citations or 0
-                    })
-                    links.append({"source": str(db_paper.id), "target": str(paper_id)})
+                citing_papers, ref_papers = openalex_provider.get_citations_and_references(
+                    openalex_id, limit=10, raise_errors=True
+                )
             except Exception as e:
-                print(f"Failed to get citations: {e}")
+                print(f"Failed to fetch citation network: {e}")
+                citing_papers, ref_papers = [], []
+                complete = False
 
-            # Get backward citations (papers cited by this)
+            # Save both directions in one transaction; results keep input order
+            library_before = visualization_service.library_fingerprint(db, 0)
             try:
-                ref_papers = openalex.get_references(openalex_id, limit=10)
-                for ref_paper in ref_papers:
-                    db_paper = paper_service.save_paper(db, ref_paper)
-                    nodes.append({
-                        "id": str(db_paper.id),
-                        "title": db_paper.title,
-                        "type": "reference",
-                        "citations": db_paper.citations or 0
-                    })
-                    links.append({"source": str(paper_id), "target": str(db_paper.id)})
+                saved = paper_service.save_papers_bulk(db, citing_papers + ref_papers)
             except Exception as e:
-                print(f"Failed to get references: {e}")
+                print(f"Failed to save citation network: {e}")
+                saved = []
+                complete = False
+            saved_citing = saved[:len(citing_papers)]
+            saved_refs = saved[len(citing_papers):]
+
+            # Papers citing this one
+            for db_paper in saved_citing:
+                nodes.append({
+                    "id": str(db_paper.id),
+                    "title": db_paper.title,
+                    "type": "citing",
+                    "citations": db_paper.citations or 0
+                })
+                links.append({"source": str(db_paper.id), "target": str(paper_id)})
 
-        return {
+            # Papers cited by this one
+            for db_paper in saved_refs:
+                nodes.append({
+                    "id": str(db_paper.id),
+                    "title": db_paper.title,
+                    "type": "reference",
+                    "citations": db_paper.citations or 0
+                })
+                links.append({"source": str(paper_id), "target": str(db_paper.id)})
+
+            # Only when the save stored something new. This also keeps
+            # cached_response from storing this payload; the next request
+            # finds nothing new to save and caches it.
+            if visualization_service.library_fingerprint(db, 0) != library_before:
+                invalidate_cached_responses(db)
+
+        payload = {
             "nodes": nodes,
             "links": links,
             "stats": {
@@ -994,7 +1265,10 @@ async def get_d3_network(
                 "total_links": len(links)
             }
         }
+        return payload if complete else UncachedPayload(payload)
 
+    try:
+        return cached_response(request, build)
     except HTTPException:
         raise
     except Exception as e:
@@ -1006,16 +1280,13 @@ async def get_d3_network(
 # =============================================================================
 
 @app.post("/api/papers/{paper_id}/extract-text")
-async def extract_paper_text(
+def extract_paper_text(
     paper_id: int,
-    db: Session = Depends(get_db_session)
+    db: Session = Depends(get_db_session),
+    pdf_svc=Depends(get_pdf_extraction)
 ):
     """Extract text from paper's PDF"""
     try:
-        from src.services.pdf_extraction import get_pdf_service
-
-        pdf_svc = get_pdf_service()
-
         # Get paper
         paper = db.query(db_models.Paper).filter(db_models.Paper.id == paper_id).first()
         if not paper:
@@ -1030,6 +1301,7 @@ async def extract_paper_text(
         # Save to database
         paper.pdf_content = result["text"]
         db.commit()
+        invalidate_cached_responses(db)
 
         # Extract sections
         sections = pdf_svc.extract_sections(result["text"])
@@ -1053,12 +1325,10 @@ async def extract_paper_text(
 # =============================================================================
 
 @app.get("/api/stats")
-async def get_stats(db: Session = Depends(get_db_session)):
+def get_stats(db: Session = Depends(get_db_session)):
     """Get application statistics"""
-    total_papers = db.query(db_models.Paper).count()
-    total_pdfs = db.query(db_models.Paper).filter(db_models.Paper.local_pdf_path.isnot(None)).count()
-    total_collections = db.query(db_models.Collection).count()
-    total_searches = db.query(db_models.SearchHistory).count()
+    # Trigger-maintained counters: a single-row read instead of four COUNT(*)s
+    total_papers, total_pdfs, total_collections, total_searches = library_stats.read_counts(db)
 
     return {
         "total_papers": total_papers,
@@ -1071,4 +1341,16 @@ async def get_stats(db: Session = Depends(get_db_session)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+
+    # One process per core; "auto" picks uvloop and httptools when installed
+    # (uvicorn[standard]) and falls back to asyncio/h11 otherwise
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=Config.API_WORKERS,
+        loop="auto",
+        http="auto",
+        limit_concurrency=Config.API_LIMIT_CONCURRENCY,
+        timeout_keep_alive=Config.API_KEEP_ALIVE
+    )
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""Response classes and middleware for the API"""
+
+from typing import Any, Optional
+
+import orjson
+from fastapi.responses import FileResponse, JSONResponse
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson, several times faster than stdlib json"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class PdfFileResponse(FileResponse):
+    """
+    File response for PDFs
+
+    Servers offering the ASGI pathsend extension are handed the path and can
+    sendfile(2) it; otherwise the file is streamed in 1 MiB chunks instead of
+    Starlette's 64 KiB, so a large PDF takes far fewer threadpool reads.
+    """
+
+    chunk_size = 1024 * 1024
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header covers an ETag
+
+    Handles the "*" wildcard, comma-separated lists and weak validators,
+    which is how browsers and proxies send the header back.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+class JSONCompressionMiddleware(GZipMiddleware):
+    """
+    Gzip API responses, passing PDF downloads through untouched
+
+    PDF streams are already compressed internally, so gzipping them costs CPU
+    without saving bytes.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith("/pdf"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -1,6 +1,6 @@
 """Pydantic schemas for API requests and responses"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -20,8 +20,7 @@ class AuthorBase(BaseModel):
 class Author(AuthorBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -58,8 +57,7 @@ class Paper(PaperBase):
     has_pdf: bool = False
     has_text: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PaperDetail(Paper):
@@ -75,6 +73,7 @@ class PaperListResponse(BaseModel):
     page: int
     page_size: int
     pages: int
+    next_cursor: Optional[str] = None
 
 
 # =============================================================================
@@ -82,6 +81,8 @@ class PaperListResponse(BaseModel):
 # =============================================================================
 
 class SearchRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     query: str = Field(..., min_length=1)
     sources: List[str] = ["pubmed", "arxiv", "crossref"]
     max_results: int = Field(50, ge=1, le=200)
@@ -103,12 +104,12 @@ class SearchResultResponse(BaseModel):
 class SearchHistoryItem(BaseModel):
     id: int
     query: str
-    sources: Optional[str] = None
+    sources: Optional[List[str]] = None
+    filters: Optional[Dict[str, Any]] = None
     results_count: int
     searched_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -116,6 +117,8 @@ class SearchHistoryItem(BaseModel):
 # =============================================================================
 
 class CollectionBase(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     name: str
     description: Optional[str] = None
 
@@ -129,8 +132,7 @@ class Collection(CollectionBase):
     created_at: datetime
     paper_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -144,8 +146,7 @@ class TagBase(BaseModel):
 class Tag(TagBase):
     id: int
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -166,8 +167,7 @@ class Note(NoteBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # =============================================================================
@@ -1,15 +1,33 @@
 """Paper service for database operations"""
 
-import json
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
-
-from src.database import models as db_models
+import base64
+from datetime import datetime
+from typing import Dict, List, Tuple
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import or_, and_, case, cast, delete, exists, func, insert, select, Text
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.database import models as db_models, fts
 from src.models import Paper as PaperModel, Author as AuthorModel
 from backend import schemas
 
 
+# INSERT constructs supporting ON CONFLICT, by dialect name
+_DIALECT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+# Relationships read by paper_to_schema; pass to query.options() so a page of
+# papers loads them with one IN query each instead of one query per paper.
+# Only the key of the PDF content is needed to report has_text.
+SCHEMA_LOAD_OPTIONS = (
+    selectinload(db_models.Paper.authors),
+    selectinload(db_models.Paper.pdf_content).load_only(db_models.PDFContent.paper_id),
+)
+
+
 def save_paper(db: Session, paper: PaperModel) -> db_models.Paper:
     """
     Save paper to database
@@ -21,66 +39,304 @@ def save_paper(db: Session, paper: PaperModel) -> db_models.Paper:
     Returns:
         Database paper model
     """
-    try:
-        # Check if paper already exists
-        existing = None
-        if paper.doi:
-            existing = db.query(db_models.Paper).filter(db_models.Paper.doi == paper.doi).first()
-        if not existing and paper.pmid:
-            existing = db.query(db_models.Paper).filter(db_models.Paper.pmid == paper.pmid).first()
-        if not existing and paper.arxiv_id:
-            existing = db.query(db_models.Paper).filter(db_models.Paper.arxiv_id == paper.arxiv_id).first()
-
-        if existing:
-            # Update existing paper
-            update_paper(db, existing, paper)
-            return existing
-
-        # Create new paper
-        db_paper = db_models.Paper(
-            title=paper.title,
-            doi=paper.doi,
-            pmid=paper.pmid,
-            pmcid=paper.pmcid,
-            arxiv_id=paper.arxiv_id,
-            abstract=paper.abstract,
-            keywords=json.dumps(paper.keywords),
-            year=paper.year,
-            journal=paper.journal,
-            volume=paper.volume,
-            issue=paper.issue,
-            pages=paper.pages,
-            citations=paper.citations,
-            altmetric_score=paper.altmetric_score,
-            relevance_score=paper.relevance_score,
-            url=str(paper.url) if paper.url else None,
-            pdf_url=str(paper.pdf_url) if paper.pdf_url else None,
-            local_pdf_path=paper.local_pdf_path,
-            paper_type=paper.paper_type.value if paper.paper_type else None,
-            sources=json.dumps([s.value for s in paper.sources])
-        )
+    return save_papers_bulk(db, [paper])[0]
 
-        # Add authors (avoid duplicates by checking IDs)
-        existing_author_ids = set()
-        for author in paper.authors:
-            db_author = get_or_create_author(db, author)
-            if db_author.id not in existing_author_ids:
-                db_paper.authors.append(db_author)
-                existing_author_ids.add(db_author.id)
 
-        db.add(db_paper)
-        db.commit()
-        db.refresh(db_paper)
+def save_papers_bulk(db: Session, papers: List[PaperModel]) -> List[db_models.Paper]:
+    """
+    Save a batch of papers in a single transaction
+
+    Results sharing an identifier are merged, and stored papers are matched
+    by DOI, PMID or arXiv ID with one query for the whole batch. New papers
+    are written with one INSERT ... ON CONFLICT statement (see
+    _upsert_papers) and their author links with one executemany, and the
+    batch is committed once, along with anything else pending in the
+    session.
 
-        return db_paper
+    Args:
+        db: Database session
+        papers: Paper models from search
+
+    Returns:
+        Database paper models, in the same order as the input
+    """
+    if not papers:
+        return []
+
+    saved = []
+    new_papers = []  # (unsaved paper, its authors)
+    batch_papers = {}  # identifier -> paper created or matched earlier in this batch
+
+    try:
+        batch_papers.update(_find_stored_papers(db, papers))
+
+        for paper in papers:
+            keys = _identifier_keys(paper)
+
+            db_paper = next((batch_papers[k] for k in keys if k in batch_papers), None)
+            if db_paper is not None:
+                # Update existing paper (or merge into one new in this batch)
+                update_paper(db, db_paper, paper, commit=False)
+            else:
+                # Kept out of the session; only its column values are inserted
+                db_paper = _new_db_paper(paper)
+                new_papers.append((db_paper, paper.authors))
+
+            for key in keys:
+                batch_papers[key] = db_paper
+            saved.append(db_paper)
+
+        if new_papers:
+            paper_ids = _upsert_papers(db, [db_paper for db_paper, _ in new_papers])
+            for (db_paper, _), paper_id in zip(new_papers, paper_ids):
+                db_paper.id = paper_id
+            _link_authors(db, [(db_paper.id, authors) for db_paper, authors in new_papers])
+
+        # Read before commit expires the stored papers
+        ids = [db_paper.id for db_paper in saved]
+        db.commit()
 
     except Exception as e:
         db.rollback()
-        print(f"Error saving paper '{paper.title[:50]}...': {e}")
+        print(f"Error saving {len(papers)} papers: {e}")
         raise
 
+    # Load the batch in one query; commit expired the stored papers anyway
+    loaded = {
+        p.id: p for p in db.query(db_models.Paper)
+            .filter(db_models.Paper.id.in_(set(ids)))
+            .options(*SCHEMA_LOAD_OPTIONS)
+    }
+    return [loaded[paper_id] for paper_id in ids]
+
+
+def _identifier_keys(paper: PaperModel) -> List[tuple]:
+    """Unique identifiers of a paper as (kind, value) pairs"""
+    keys = []
+    if paper.doi:
+        keys.append(("doi", paper.doi))
+    if paper.pmid:
+        keys.append(("pmid", paper.pmid))
+    if paper.arxiv_id:
+        keys.append(("arxiv_id", paper.arxiv_id))
+    return keys
+
+
+def _find_stored_papers(db: Session, papers: List[PaperModel]) -> dict:
+    """
+    Stored papers sharing an identifier with any paper in a batch
+
+    Returns:
+        Mapping of (kind, value) identifier keys to database papers
+    """
+    identifiers = {"doi": set(), "pmid": set(), "arxiv_id": set()}
+    for paper in papers:
+        for kind, value in _identifier_keys(paper):
+            identifiers[kind].add(value)
+
+    conditions = [
+        getattr(db_models.Paper, kind).in_(values)
+        for kind, values in identifiers.items() if values
+    ]
+    if not conditions:
+        return {}
+
+    # PMID and arXiv ID aren't unique columns; keep the first stored match
+    stored = {}
+    for db_paper in db.query(db_models.Paper).filter(or_(*conditions)):
+        for kind in identifiers:
+            value = getattr(db_paper, kind)
+            if value in identifiers[kind]:
+                stored.setdefault((kind, value), db_paper)
+    return stored
+
+
+def _new_db_paper(paper: PaperModel) -> db_models.Paper:
+    """Build a new (unsaved) database paper from a search result, without authors"""
+    return db_models.Paper(
+        title=paper.title,
+        doi=paper.doi,
+        pmid=paper.pmid,
+        pmcid=paper.pmcid,
+        arxiv_id=paper.arxiv_id,
+        abstract=paper.abstract,
+        keywords=list(paper.keywords),
+        year=paper.year,
+        journal=paper.journal,
+        volume=paper.volume,
+        issue=paper.issue,
+        pages=paper.pages,
+        citations=paper.citations,
+        altmetric_score=paper.altmetric_score,
+        relevance_score=paper.relevance_score,
+        url=str(paper.url) if paper.url else None,
+        pdf_url=str(paper.pdf_url) if paper.pdf_url else None,
+        local_pdf_path=paper.local_pdf_path,
+        paper_type=paper.paper_type.value if paper.paper_type else None,
+        sources=[s.value for s in paper.sources]
+    )
+
+
+def _upsert_papers(db: Session, new_papers: List[db_models.Paper]) -> List[int]:
+    """
+    Insert papers with one INSERT ... ON CONFLICT (doi) DO UPDATE
+
+    The batch was already matched against stored papers, so a conflict means
+    another request stored the same DOI in the meantime. The stored row is
+    then merged the way update_paper would (sources excepted) instead of the
+    whole batch failing on the unique constraint.
+
+    Args:
+        db: Database session
+        new_papers: Unsaved papers from _new_db_paper
+
+    Returns:
+        Paper IDs, in the same order as new_papers
+    """
+    now = datetime.utcnow()
+    columns = [c.key for c in db_models.Paper.__table__.columns if c.key != "id"]
+    rows = []
+    for db_paper in new_papers:
+        row = {column: getattr(db_paper, column) for column in columns}
+        row["created_at"] = row["updated_at"] = now
+        rows.append(row)
+
+    dialect = db.get_bind().dialect.name
+    if dialect not in _DIALECT_INSERTS:
+        stmt = insert(db_models.Paper)
+    else:
+        stmt = _DIALECT_INSERTS[dialect](db_models.Paper)
+        stored, incoming = db_models.Paper, stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[db_models.Paper.doi],
+            set_={
+                "abstract": func.coalesce(func.nullif(stored.abstract, ""), incoming.abstract),
+                "citations": case(
+                    (incoming.citations > stored.citations, incoming.citations),
+                    else_=stored.citations
+                ),
+                "pdf_url": func.coalesce(func.nullif(stored.pdf_url, ""), incoming.pdf_url),
+                "local_pdf_path": func.coalesce(incoming.local_pdf_path, stored.local_pdf_path),
+                "updated_at": incoming.updated_at
+            }
+        )
+
+    result = db.execute(
+        stmt.returning(db_models.Paper.id, sort_by_parameter_order=True),
+        rows
+    )
+    return list(result.scalars())
+
+
+def _link_authors(db: Session, paper_authors: List[tuple]):
+    """
+    Link new papers to their authors, creating authors as needed
+
+    A "new" paper may be one another request stored first (see
+    _upsert_papers); links it already has are left as they are.
+
+    Args:
+        db: Database session
+        paper_authors: (paper ID, list of AuthorModel) pairs
+    """
+    author_ids = resolve_authors(db, [a for _, authors in paper_authors for a in authors])
+
+    links = {}
+    for paper_id, authors in paper_authors:
+        for author in authors:
+            author_id = author_ids[_author_keys(author)[0]]
+            if (paper_id, author_id) not in links:
+                links[(paper_id, author_id)] = {"paper_id": paper_id, "author_id": author_id}
+
+    # Keep the order authors were listed in
+    order = {}
+    for link in links.values():
+        link["author_order"] = order[link["paper_id"]] = order.get(link["paper_id"], -1) + 1
+
+    if links:
+        dialect = db.get_bind().dialect.name
+        if dialect in _DIALECT_INSERTS:
+            stmt = _DIALECT_INSERTS[dialect](db_models.paper_authors).on_conflict_do_nothing()
+        else:
+            stmt = insert(db_models.paper_authors)
+        db.execute(stmt, list(links.values()))
+
+
+def _author_keys(author: AuthorModel) -> List[tuple]:
+    """Keys an author is matched on, as (kind, value) pairs: ORCID first, then name"""
+    if author.orcid:
+        return [("orcid", author.orcid), ("name", author.name)]
+    return [("name", author.name)]
+
+
+def resolve_authors(db: Session, authors: List[AuthorModel]) -> Dict[tuple, int]:
+    """
+    Find or create the stored authors for a batch of authors
+
+    Stored authors are matched by ORCID, then by name, with one query for the
+    whole batch; the rest are inserted with one statement. Authors sharing a
+    key within the batch resolve to the same row.
+
+    Args:
+        db: Database session
+        authors: Authors from search results
+
+    Returns:
+        Mapping of every key from _author_keys to an author ID
+    """
+    if not authors:
+        return {}
+
+    orcids = {a.orcid for a in authors if a.orcid}
+    names = {a.name for a in authors}
+
+    stored = {}
+    rows = db.execute(
+        select(db_models.Author.id, db_models.Author.orcid, db_models.Author.name)
+        .where(or_(db_models.Author.orcid.in_(orcids), db_models.Author.name.in_(names)))
+        .order_by(db_models.Author.id)
+    )
+    for author_id, orcid, name in rows:
+        if orcid in orcids:
+            stored.setdefault(("orcid", orcid), author_id)
+        if name in names:
+            stored.setdefault(("name", name), author_id)
+
+    # Each distinct author gets one slot, shared by all of its keys, holding
+    # its ID; slots of new authors are filled in after the insert
+    slots = {}
+    new_authors = []  # (slot, author)
+    for author in authors:
+        keys = _author_keys(author)
+        slot = next((slots[key] for key in keys if key in slots), None)
+        if slot is None:
+            slot = [next((stored[key] for key in keys if key in stored), None)]
+            if slot[0] is None:
+                new_authors.append((slot, author))
+        for key in keys:
+            slots.setdefault(key, slot)
+
+    if new_authors:
+        result = db.execute(
+            insert(db_models.Author).returning(db_models.Author.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": author.name,
+                    "first_name": author.first_name,
+                    "last_name": author.last_name,
+                    "affiliation": author.affiliation,
+                    "orcid": author.orcid
+                }
+                for _, author in new_authors
+            ]
+        )
+        for (slot, _), author_id in zip(new_authors, result.scalars()):
+            slot[0] = author_id
 
-def update_paper(db: Session, db_paper: db_models.Paper, paper: PaperModel):
+    return {key: slot[0] for key, slot in slots.items()}
+
+
+def update_paper(db: Session, db_paper: db_models.Paper, paper: PaperModel, commit: bool = True):
     """Update existing paper with new data"""
     # Update fields that might have changed
     if paper.abstract and not db_paper.abstract:
@@ -96,79 +352,215 @@ def update_paper(db: Session, db_paper: db_models.Paper, paper: PaperModel):
         db_paper.local_pdf_path = paper.local_pdf_path
 
     # Merge sources
-    existing_sources = set(json.loads(db_paper.sources or "[]"))
+    existing_sources = set(db_paper.sources or [])
     new_sources = set([s.value for s in paper.sources])
-    db_paper.sources = json.dumps(list(existing_sources | new_sources))
+    db_paper.sources = list(existing_sources | new_sources)
 
-    db.commit()
+    if commit:
+        db.commit()
 
 
-def get_or_create_author(db: Session, author: AuthorModel) -> db_models.Author:
-    """Get existing author or create new one"""
-    # Try to find by ORCID first
-    if author.orcid:
-        db_author = db.query(db_models.Author).filter(db_models.Author.orcid == author.orcid).first()
-        if db_author:
-            return db_author
-
-    # Try to find by name
-    db_author = db.query(db_models.Author).filter(db_models.Author.name == author.name).first()
-    if db_author:
-        return db_author
-
-    # Create new author
-    db_author = db_models.Author(
-        name=author.name,
-        first_name=author.first_name,
-        last_name=author.last_name,
-        affiliation=author.affiliation,
-        orcid=author.orcid
+def delete_paper(db: Session, paper_id: int) -> bool:
+    """
+    Delete a paper and the rows that reference it
+
+    Issues DELETE statements directly rather than loading the paper and each
+    relationship just so the ORM can cascade.
+
+    Args:
+        db: Database session
+        paper_id: Paper to delete
+
+    Returns:
+        True if the paper existed
+    """
+    try:
+        for table in (db_models.paper_authors, db_models.collection_papers, db_models.paper_tags):
+            db.execute(delete(table).where(table.c.paper_id == paper_id))
+        db.execute(delete(db_models.Note).where(db_models.Note.paper_id == paper_id))
+        db.execute(delete(db_models.PDFContent).where(db_models.PDFContent.paper_id == paper_id))
+        result = db.execute(delete(db_models.Paper).where(db_models.Paper.id == paper_id))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return result.rowcount > 0
+
+
+def add_to_collection(db: Session, collection_id: int, paper_id: int) -> bool:
+    """
+    Add a paper to a collection without loading either
+
+    Args:
+        db: Database session
+        collection_id: Target collection
+        paper_id: Paper to add
+
+    Returns:
+        False if the collection or paper does not exist
+    """
+    collection_exists = db.scalar(
+        exists().where(db_models.Collection.id == collection_id).select()
+    )
+    paper_exists = db.scalar(exists().where(db_models.Paper.id == paper_id).select())
+    if not collection_exists or not paper_exists:
+        return False
+
+    link = db_models.collection_papers
+    already_linked = db.scalar(
+        exists().where(link.c.collection_id == collection_id, link.c.paper_id == paper_id).select()
     )
-    db.add(db_author)
-    db.commit()
-    db.refresh(db_author)
+    if not already_linked:
+        db.execute(insert(link).values(collection_id=collection_id, paper_id=paper_id))
+        db.commit()
+
+    return True
+
+
+def encode_cursor(db_paper: db_models.Paper) -> str:
+    """Opaque keyset cursor pointing just past a paper in newest-first order"""
+    raw = f"{db_paper.created_at.isoformat()}|{db_paper.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
 
-    return db_author
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor from encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, paper_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(paper_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def _schema_fields(db_paper: db_models.Paper) -> dict:
+    """Fields of the Paper response schema; authors stay ORM objects"""
+    return {
+        "id": db_paper.id,
+        "title": db_paper.title,
+        "doi": db_paper.doi,
+        "pmid": db_paper.pmid,
+        "pmcid": db_paper.pmcid,
+        "arxiv_id": db_paper.arxiv_id,
+        "abstract": db_paper.abstract,
+        "year": db_paper.year,
+        "journal": db_paper.journal,
+        "volume": db_paper.volume,
+        "issue": db_paper.issue,
+        "pages": db_paper.pages,
+        "citations": db_paper.citations,
+        "url": db_paper.url,
+        "pdf_url": db_paper.pdf_url,
+        "paper_type": db_paper.paper_type,
+        "authors": db_paper.authors,
+        "keywords": db_paper.keywords or [],
+        "sources": db_paper.sources or [],
+        "local_pdf_path": db_paper.local_pdf_path,
+        "relevance_score": db_paper.relevance_score,
+        "created_at": db_paper.created_at,
+        "updated_at": db_paper.updated_at,
+        "has_pdf": bool(db_paper.local_pdf_path),
+        "has_text": bool(db_paper.pdf_content)
+    }
+
+
+_paper_list_adapter = TypeAdapter(List[schemas.Paper])
 
 
 def paper_to_schema(db_paper: db_models.Paper) -> schemas.Paper:
     """Convert database paper to schema"""
-    return schemas.Paper(
-        id=db_paper.id,
-        title=db_paper.title,
-        doi=db_paper.doi,
-        pmid=db_paper.pmid,
-        pmcid=db_paper.pmcid,
-        arxiv_id=db_paper.arxiv_id,
-        abstract=db_paper.abstract,
-        year=db_paper.year,
-        journal=db_paper.journal,
-        volume=db_paper.volume,
-        issue=db_paper.issue,
-        pages=db_paper.pages,
-        citations=db_paper.citations,
-        url=db_paper.url,
-        pdf_url=db_paper.pdf_url,
-        paper_type=db_paper.paper_type,
-        authors=[schemas.Author(
-            id=a.id,
-            name=a.name,
-            first_name=a.first_name,
-            last_name=a.last_name,
-            affiliation=a.affiliation,
-            orcid=a.orcid
-        ) for a in db_paper.authors],
-        keywords=json.loads(db_paper.keywords or "[]"),
-        sources=json.loads(db_paper.sources or "[]"),
-        local_pdf_path=db_paper.local_pdf_path,
-        relevance_score=db_paper.relevance_score,
-        created_at=db_paper.created_at,
-        updated_at=db_paper.updated_at,
-        has_pdf=bool(db_paper.local_pdf_path),
-        has_text=bool(db_paper.pdf_content)
+    return schemas.Paper.model_validate(_schema_fields(db_paper), from_attributes=True)
+
+
+def papers_to_schema(db_papers: List[db_models.Paper]) -> List[schemas.Paper]:
+    """Convert database papers to schemas in a single validator call"""
+    return _paper_list_adapter.validate_python(
+        [_schema_fields(p) for p in db_papers], from_attributes=True
     )
 
 
+# Columns of the Paper response schema, for list endpoints that build their
+# JSON straight from rows instead of ORM objects and schema validation
+PAPER_ROW_COLUMNS = (
+    db_models.Paper.id, db_models.Paper.title, db_models.Paper.doi, db_models.Paper.pmid,
+    db_models.Paper.pmcid, db_models.Paper.arxiv_id, db_models.Paper.abstract,
+    db_models.Paper.year, db_models.Paper.journal, db_models.Paper.volume,
+    db_models.Paper.issue, db_models.Paper.pages, db_models.Paper.citations,
+    db_models.Paper.url, db_models.Paper.pdf_url, db_models.Paper.paper_type,
+    db_models.Paper.keywords, db_models.Paper.sources, db_models.Paper.local_pdf_path,
+    db_models.Paper.relevance_score, db_models.Paper.created_at, db_models.Paper.updated_at,
+    exists().where(db_models.PDFContent.paper_id == db_models.Paper.id).label("has_text"),
+)
+
+_AUTHOR_COLUMNS = (
+    db_models.Author.id, db_models.Author.name, db_models.Author.first_name,
+    db_models.Author.last_name, db_models.Author.affiliation, db_models.Author.orcid,
+)
+
+
+def paper_rows_to_dicts(db: Session, rows) -> List[dict]:
+    """
+    Convert PAPER_ROW_COLUMNS rows to Paper schema dicts
+
+    Authors for the whole page are read in one query; fields are filled the
+    same way paper_to_schema fills them, without model validation.
+
+    Args:
+        db: Database session
+        rows: Result rows selected with PAPER_ROW_COLUMNS
+
+    Returns:
+        List of dicts matching schemas.Paper
+    """
+    authors = {row.id: [] for row in rows}
+    if authors:
+        author_rows = db.execute(
+            select(db_models.paper_authors.c.paper_id, *_AUTHOR_COLUMNS)
+            .join(db_models.Author, db_models.Author.id == db_models.paper_authors.c.author_id)
+            .where(db_models.paper_authors.c.paper_id.in_(authors))
+            .order_by(db_models.paper_authors.c.author_order, db_models.Author.id)
+        )
+        for paper_id, *author in author_rows:
+            authors[paper_id].append(dict(zip(("id", "name", "first_name", "last_name",
+                                               "affiliation", "orcid"), author)))
+
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "doi": row.doi,
+            "pmid": row.pmid,
+            "pmcid": row.pmcid,
+            "arxiv_id": row.arxiv_id,
+            "abstract": row.abstract,
+            "year": row.year,
+            "journal": row.journal,
+            "volume": row.volume,
+            "issue": row.issue,
+            "pages": row.pages,
+            "citations": row.citations or 0,
+            "url": row.url,
+            "pdf_url": row.pdf_url,
+            "paper_type": row.paper_type,
+            "authors": authors[row.id],
+            "keywords": row.keywords or [],
+            "sources": row.sources or [],
+            "local_pdf_path": row.local_pdf_path,
+            "relevance_score": row.relevance_score,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "has_pdf": bool(row.local_pdf_path),
+            "has_text": bool(row.has_text)
+        }
+        for row in rows
+    ]
+
+
 def db_to_paper_model(db_paper: db_models.Paper) -> PaperModel:
     """Convert database paper to Paper model for downloading"""
     from src.models import Author as AuthorModel, Source, PaperType
@@ -190,7 +582,7 @@ def db_to_paper_model(db_paper: db_models.Paper) -> PaperModel:
         pdf_url=db_paper.pdf_url,
         local_pdf_path=db_paper.local_pdf_path,
         paper_type=PaperType(db_paper.paper_type) if db_paper.paper_type else PaperType.UNKNOWN,
-        sources=[Source(s) for s in json.loads(db_paper.sources or "[]")],
+        sources=[Source(s) for s in db_paper.sources or []],
         authors=[AuthorModel(
             name=a.name,
             first_name=a.first_name,
@@ -198,7 +590,7 @@ def db_to_paper_model(db_paper: db_models.Paper) -> PaperModel:
             affiliation=a.affiliation,
             orcid=a.orcid
         ) for a in db_paper.authors],
-        keywords=json.loads(db_paper.keywords or "[]")
+        keywords=db_paper.keywords or []
     )
 
 
@@ -206,6 +598,10 @@ def full_text_search(db: Session, query: str, limit: int = 50) -> List[db_models
     """
     Full-text search across papers
 
+    Uses the FTS5 index over titles, abstracts, keywords and PDF text,
+    ranked by BM25, or the tsvector GIN indexes on Postgres. Other databases
+    fall back to substring matching.
+
     Args:
         db: Database session
         query: Search query
@@ -214,30 +610,33 @@ def full_text_search(db: Session, query: str, limit: int = 50) -> List[db_models
     Returns:
         List of matching papers
     """
-    # Simple search for now - can be enhanced with FTS5
+    if not fts.is_supported(db):
+        return _like_search(db, query, limit)
+
+    paper_ids = fts.search_paper_ids(db, query, limit)
+    papers = db.query(db_models.Paper)\
+        .options(*SCHEMA_LOAD_OPTIONS)\
+        .filter(db_models.Paper.id.in_(paper_ids))\
+        .all()
+
+    # Restore rank order
+    by_id = {p.id: p for p in papers}
+    return [by_id[paper_id] for paper_id in paper_ids if paper_id in by_id]
+
+
+def _like_search(db: Session, query: str, limit: int) -> List[db_models.Paper]:
+    """Substring search for databases without a full-text index"""
     search_term = f"%{query}%"
 
-    results = db.query(db_models.Paper).filter(
-        or_(
+    # One scan over papers and their PDF text
+    return db.query(db_models.Paper)\
+        .options(*SCHEMA_LOAD_OPTIONS)\
+        .outerjoin(db_models.PDFContent)\
+        .filter(or_(
             db_models.Paper.title.ilike(search_term),
             db_models.Paper.abstract.ilike(search_term),
-            db_models.Paper.keywords.ilike(search_term)
-        )
-    ).limit(limit).all()
-
-    # Also search PDF content if available
-    pdf_results = db.query(db_models.Paper).join(
-        db_models.PDFContent
-    ).filter(
-        db_models.PDFContent.full_text.ilike(search_term)
-    ).limit(limit).all()
-
-    # Combine and deduplicate
-    seen_ids = set()
-    combined = []
-    for paper in results + pdf_results:
-        if paper.id not in seen_ids:
-            combined.append(paper)
-            seen_ids.add(paper.id)
-
-    return combined[:limit]
\ No newline at end of file
+            cast(db_models.Paper.keywords, Text).ilike(search_term),
+            db_models.PDFContent.full_text.ilike(search_term)
+        ))\
+        .limit(limit)\
+        .all()
@@ -1,45 +1,205 @@
 """PDF text extraction service"""
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, List, Optional, Tuple
+import hashlib
+import multiprocessing
+import os
 import re
+import threading
+import zlib
+
+from src.utils.config import Config
+
+# Documents at least this long are split across the pool's workers; each
+# task opens its own copy, since PyMuPDF documents can't be shared between
+# threads. Shorter ones aren't worth the extra opens.
+PARALLEL_MIN_PAGES = 48
+MIN_PAGES_PER_TASK = 16
+
+# Extracted text, keyed by PDF path, size and mtime so a PDF is only parsed
+# again when the file changes
+TEXT_CACHE_DIR = Config.CACHE_DIR / "pdf_text"
+
+# PDF parsing is CPU-bound; run it in worker processes so it neither holds
+# the GIL nor ties up request threads. Created on first use.
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Get the shared extraction process pool"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Spawn rather than fork: the server process has live threads
+            # and database connections that must not be copied
+            _executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _executor
+
+
+def shutdown_executor():
+    """Stop the extraction process pool"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+async def extract_text_async(pdf_path: str,
+                             max_pages: Optional[int] = None) -> Tuple[str, int]:
+    """
+    Extract text from PDF file in the shared process pool
+
+    Awaits the worker without holding a thread, so any number of requests
+    can wait on extraction while the pool runs one PDF per core.
+
+    Args:
+        pdf_path: Path to PDF file (only the path is sent to the worker)
+        max_pages: Only extract the first N pages
 
+    Returns:
+        Tuple of (extracted_text, page_count)
+    """
+    # A cache hit skips the worker round trip (and starting the pool)
+    cached = await asyncio.to_thread(get_cached_text, pdf_path, max_pages)
+    if cached is not None:
+        return cached
+
+    page_count = await asyncio.to_thread(get_pdf_page_count, pdf_path)
+    pages = min(page_count, max_pages or page_count)
+    if pages >= PARALLEL_MIN_PAGES and (os.cpu_count() or 1) > 1:
+        text = await _extract_pages_parallel(pdf_path, pages)
+        await asyncio.to_thread(_cache_text, pdf_path, max_pages, text, page_count)
+        return text, page_count
+
+    future = _get_executor().submit(extract_text_from_pdf, pdf_path, max_pages)
+    return await asyncio.wrap_future(future)
+
+
+async def _extract_pages_parallel(pdf_path: str, pages: int) -> str:
+    """Extract the first pages of a PDF as page ranges spread over the pool"""
+    executor = _get_executor()
+    chunk = max(MIN_PAGES_PER_TASK, -(-pages // (os.cpu_count() or 1)))
+    parts = await asyncio.gather(*(
+        asyncio.wrap_future(executor.submit(
+            _extract_page_range, pdf_path, start, min(start + chunk, pages)
+        ))
+        for start in range(0, pages, chunk)
+    ))
+    full_text = "\n\n".join(text for part in parts for text in part)
+    return await asyncio.to_thread(clean_extracted_text, full_text)
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Raw text of pages [start, stop), run in a worker process"""
+    with open_pdf(pdf_path) as doc:
+        return [doc[page_num].get_text() for page_num in range(start, stop)]
+
+
+@contextmanager
+def open_pdf(pdf_path) -> Iterator:
+    """
+    Open a PDF with PyMuPDF, closing it however the block exits
 
-def extract_text_from_pdf(pdf_path: str) -> Tuple[str, int]:
+    Raises:
+        ImportError: If PyMuPDF is not installed
     """
-    Extract text from PDF file
+    import pymupdf  # PyMuPDF (fitz)
+
+    doc = pymupdf.open(pdf_path)
+    try:
+        yield doc
+    finally:
+        doc.close()
+
+
+def extract_text_from_pdf(pdf_path: str, max_pages: Optional[int] = None) -> Tuple[str, int]:
+    """
+    Extract text from PDF file, reusing the cached text if the file is unchanged
 
     Args:
         pdf_path: Path to PDF file
+        max_pages: Only extract the first N pages (page_count is still the total)
 
     Returns:
         Tuple of (extracted_text, page_count)
     """
+    cache_path = _text_cache_path(pdf_path, max_pages)
+    if cache_path is not None:
+        cached = _read_cached_text(cache_path)
+        if cached is not None:
+            return cached
+
+    text, page_count = _parse_pdf_text(pdf_path, max_pages)
+
+    if cache_path is not None:
+        _write_cached_text(cache_path, text, page_count)
+    return text, page_count
+
+
+def _cache_text(pdf_path: str, max_pages: Optional[int], text: str, page_count: int):
+    """Store text extracted outside extract_text_from_pdf"""
+    cache_path = _text_cache_path(pdf_path, max_pages)
+    if cache_path is not None:
+        _write_cached_text(cache_path, text, page_count)
+
+
+def get_cached_text(pdf_path: str, max_pages: Optional[int] = None) -> Optional[Tuple[str, int]]:
+    """Cached (text, page_count) for a PDF, or None if it hasn't been extracted"""
+    cache_path = _text_cache_path(pdf_path, max_pages)
+    return _read_cached_text(cache_path) if cache_path is not None else None
+
+
+def _text_cache_path(pdf_path: str, max_pages: Optional[int]) -> Optional[Path]:
+    """Cache file for a PDF's current version, or None if the file can't be read"""
     try:
-        import pymupdf  # PyMuPDF (fitz)
+        stat = os.stat(pdf_path)
+    except OSError:
+        return None
 
-        pdf_file = Path(pdf_path)
-        if not pdf_file.exists():
-            raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    key = f"{os.path.abspath(pdf_path)}|{stat.st_size}|{stat.st_mtime_ns}|{max_pages or 0}"
+    return TEXT_CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.txt.z"
 
-        doc = pymupdf.open(pdf_file)
-        text_parts = []
-        page_count = len(doc)
 
-        for page_num in range(page_count):
-            page = doc[page_num]
-            text = page.get_text()
-            text_parts.append(text)
+def _read_cached_text(cache_path: Path) -> Optional[Tuple[str, int]]:
+    """Read a cache file written by _write_cached_text"""
+    try:
+        data = zlib.decompress(cache_path.read_bytes()).decode("utf-8")
+        page_count, _, text = data.partition("\n")
+        return text, int(page_count)
+    except (OSError, zlib.error, UnicodeDecodeError, ValueError):
+        return None
 
-        doc.close()
 
-        # Combine all pages
-        full_text = "\n\n".join(text_parts)
+def _write_cached_text(cache_path: Path, text: str, page_count: int):
+    """Store the page count and text, zlib-compressed"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent workers never read a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(zlib.compress(f"{page_count}\n{text}".encode("utf-8")))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
 
-        # Clean up text
-        full_text = clean_extracted_text(full_text)
+def _parse_pdf_text(pdf_path: str, max_pages: Optional[int]) -> Tuple[str, int]:
+    """Extract and clean the text of a PDF file"""
+    try:
+        pdf_file = Path(pdf_path)
+        if not pdf_file.exists():
+            raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-        return full_text, page_count
+        with open_pdf(pdf_file) as doc:
+            return _document_text(doc, max_pages), len(doc)
 
     except ImportError:
         # Fallback to PyPDF2 if pymupdf not available
@@ -50,7 +210,7 @@ def extract_text_from_pdf(pdf_path: str) -> Tuple[str, int]:
             text_parts = []
             page_count = len(reader.pages)
 
-            for page in reader.pages:
+            for page in reader.pages[:max_pages]:
                 text = page.extract_text()
                 text_parts.append(text)
 
@@ -66,6 +226,23 @@ def extract_text_from_pdf(pdf_path: str) -> Tuple[str, int]:
         raise Exception(f"Failed to extract text from PDF: {e}")
 
 
+def _document_text(doc, max_pages: Optional[int]) -> str:
+    """Cleaned text of the first max_pages pages of an open document"""
+    page_count = len(doc)
+    text_parts = [
+        doc[page_num].get_text()
+        for page_num in range(min(page_count, max_pages or page_count))
+    ]
+    return clean_extracted_text("\n\n".join(text_parts))
+
+
+# Patterns for clean_extracted_text. Runs of spaces are matched from two
+# up, so the common single space between words isn't replaced by itself.
+_BLANK_LINES = re.compile(r'\n\s*\n\s*\n+')
+_PAGE_NUMBER_LINE = re.compile(r'\n\s*\d+\s*\n')
+_SPACE_RUNS = re.compile(r' {2,}')
+
+
 def clean_extracted_text(text: str) -> str:
     """
     Clean extracted text
@@ -77,13 +254,13 @@ def clean_extracted_text(text: str) -> str:
         Cleaned text
     """
     # Remove excessive whitespace
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+    text = _BLANK_LINES.sub('\n\n', text)
 
     # Remove page numbers (common pattern)
-    text = re.sub(r'\n\s*\d+\s*\n', '\n', text)
+    text = _PAGE_NUMBER_LINE.sub('\n', text)
 
     # Remove excessive spaces
-    text = re.sub(r' +', ' ', text)
+    text = _SPACE_RUNS.sub(' ', text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
@@ -102,23 +279,8 @@ def extract_metadata_from_pdf(pdf_path: str) -> dict:
         Dictionary of metadata
     """
     try:
-        import pymupdf
-
-        doc = pymupdf.open(pdf_path)
-        metadata = doc.metadata
-
-        doc.close()
-
-        return {
-            'title': metadata.get('title', ''),
-            'author': metadata.get('author', ''),
-            'subject': metadata.get('subject', ''),
-            'keywords': metadata.get('keywords', ''),
-            'creator': metadata.get('creator', ''),
-            'producer': metadata.get('producer', ''),
-            'creation_date': metadata.get('creationDate', ''),
-            'mod_date': metadata.get('modDate', '')
-        }
+        with open_pdf(pdf_path) as doc:
+            return _metadata_dict(doc.metadata)
 
     except ImportError:
         try:
@@ -145,18 +307,64 @@ def extract_metadata_from_pdf(pdf_path: str) -> dict:
         return {}
 
 
+def _metadata_dict(metadata: dict) -> dict:
+    """Normalize PyMuPDF document metadata"""
+    return {
+        'title': metadata.get('title', ''),
+        'author': metadata.get('author', ''),
+        'subject': metadata.get('subject', ''),
+        'keywords': metadata.get('keywords', ''),
+        'creator': metadata.get('creator', ''),
+        'producer': metadata.get('producer', ''),
+        'creation_date': metadata.get('creationDate', ''),
+        'mod_date': metadata.get('modDate', '')
+    }
+
+
 def get_pdf_page_count(pdf_path: str) -> int:
     """Get number of pages in PDF"""
     try:
-        import pymupdf
-        doc = pymupdf.open(pdf_path)
-        count = len(doc)
-        doc.close()
-        return count
+        with open_pdf(pdf_path) as doc:
+            return len(doc)
     except:
         try:
             from PyPDF2 import PdfReader
             reader = PdfReader(pdf_path)
             return len(reader.pages)
         except:
-            return 0
\ No newline at end of file
+            return 0
+
+
+def analyze_pdf(pdf_path: str, max_pages: Optional[int] = None) -> Tuple[str, int, dict]:
+    """
+    Extract text, page count and metadata, opening the PDF once
+
+    Calling extract_text_from_pdf, get_pdf_page_count and
+    extract_metadata_from_pdf in turn parses the file three times. The text
+    cache is used and filled as by extract_text_from_pdf.
+
+    Args:
+        pdf_path: Path to PDF file
+        max_pages: Maximum pages to extract (None for all)
+
+    Returns:
+        Tuple of (extracted_text, page_count, metadata)
+    """
+    cache_path = _text_cache_path(pdf_path, max_pages)
+
+    try:
+        with open_pdf(pdf_path) as doc:
+            metadata = _metadata_dict(doc.metadata)
+            cached = _read_cached_text(cache_path) if cache_path is not None else None
+            if cached is not None:
+                return cached[0], cached[1], metadata
+            text, page_count = _document_text(doc, max_pages), len(doc)
+    except ImportError:
+        text, page_count = extract_text_from_pdf(pdf_path, max_pages)
+        return text, page_count, extract_metadata_from_pdf(pdf_path)
+    except Exception as e:
+        raise Exception(f"Failed to extract text from PDF: {e}")
+
+    if cache_path is not None:
+        _write_cached_text(cache_path, text, page_count)
+    return text, page_count, metadata
@@ -1,10 +1,16 @@
 """Visualization data generation service"""
 
 from collections import Counter, defaultdict
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import heapq
+from itertools import combinations
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
+from sqlalchemy import case, func, true
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-import json
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
+import threading
 
 from src.database import models as db_models
 from backend import schemas
@@ -21,11 +27,9 @@ def get_timeline_data(db: Session, collection_id: Optional[int] = None) -> schem
     Returns:
         Timeline data with papers grouped by year
     """
-    query = db.query(
-        db_models.Paper.year,
-        func.count(db_models.Paper.id).label('count'),
-        func.group_concat(db_models.Paper.id).label('paper_ids')
-    )
+    # Plain (year, id) rows grouped in one pass; no group_concat string to
+    # build and split, and it works on any database
+    query = db.query(db_models.Paper.year, db_models.Paper.id)
 
     if collection_id:
         query = query.join(db_models.Paper.collections).filter(
@@ -33,19 +37,16 @@ def get_timeline_data(db: Session, collection_id: Optional[int] = None) -> schem
         )
 
     query = query.filter(db_models.Paper.year.isnot(None))
-    query = query.group_by(db_models.Paper.year)
-    query = query.order_by(db_models.Paper.year)
-
-    results = query.all()
-
-    timeline_data = []
-    for year, count, paper_ids_str in results:
-        paper_ids = [int(pid) for pid in paper_ids_str.split(',')] if paper_ids_str else []
-        timeline_data.append(schemas.TimelineDataPoint(
-            year=year,
-            count=count,
-            papers=paper_ids
-        ))
+    query = query.order_by(db_models.Paper.year, db_models.Paper.id)
+
+    papers_by_year = defaultdict(list)
+    for year, paper_id in query:
+        papers_by_year[year].append(paper_id)
+
+    timeline_data = [
+        schemas.TimelineDataPoint(year=year, count=len(paper_ids), papers=paper_ids)
+        for year, paper_ids in papers_by_year.items()
+    ]
 
     # Get year range
     years = [d.year for d in timeline_data]
@@ -72,7 +73,10 @@ def get_citation_network(db: Session, collection_id: Optional[int] = None) -> sc
     Returns:
         Network data with nodes and links
     """
-    query = db.query(db_models.Paper)
+    query = db.query(
+        db_models.Paper.id, db_models.Paper.title,
+        db_models.Paper.year, db_models.Paper.citations
+    )
 
     if collection_id:
         query = query.join(db_models.Paper.collections).filter(
@@ -93,42 +97,42 @@ def get_citation_network(db: Session, collection_id: Optional[int] = None) -> sc
         # Determine group based on year decade
         decade = (paper.year // 10 * 10) if paper.year else 2020
 
-        nodes.append(schemas.NetworkNode(
-            id=node_id,
-            label=paper.title[:50] + "..." if len(paper.title) > 50 else paper.title,
-            size=int(min(paper.citations / 10 + 5, 30)),  # Scale by citations
-            group=str(decade)
-        ))
+        nodes.append({
+            "id": node_id,
+            "label": paper.title[:50] + "..." if len(paper.title) > 50 else paper.title,
+            "size": int(min(paper.citations / 10 + 5, 30)),  # Scale by citations
+            "group": str(decade)
+        })
 
-    # Create links based on shared authors
+    # Create links based on shared authors; one query for every paper's
+    # author IDs instead of loading paper.authors per paper
     author_papers = defaultdict(list)
-    for paper in papers:
-        for author in paper.authors:
-            author_papers[author.id].append(paper.id)
+    link_table = db_models.paper_authors
+    author_rows = db.query(link_table.c.author_id, link_table.c.paper_id)\
+        .filter(link_table.c.paper_id.in_(paper_map))\
+        .order_by(link_table.c.paper_id)
+    for author_id, paper_id in author_rows:
+        author_papers[author_id].append(paper_id)
 
     # Connect papers with shared authors
     link_strengths = Counter()
-    for author_id, paper_ids in author_papers.items():
-        if len(paper_ids) > 1:
-            # Create links between all papers by this author
-            for i, pid1 in enumerate(paper_ids):
-                for pid2 in paper_ids[i+1:]:
-                    link_key = tuple(sorted([pid1, pid2]))
-                    link_strengths[link_key] += 1
+    for paper_ids in author_papers.values():
+        # Create links between all papers by this author; pairs of a sorted
+        # list come out already ordered, so they key the Counter directly
+        link_strengths.update(combinations(sorted(paper_ids), 2))
 
     # Add links
     for (pid1, pid2), strength in link_strengths.items():
         if pid1 in paper_map and pid2 in paper_map:
-            links.append(schemas.NetworkLink(
-                source=paper_map[pid1],
-                target=paper_map[pid2],
-                weight=min(strength / 2.0, 5.0)
-            ))
+            links.append({
+                "source": paper_map[pid1],
+                "target": paper_map[pid2],
+                "weight": min(strength / 2.0, 5.0)
+            })
 
-    return schemas.NetworkResponse(
-        nodes=nodes,
-        links=links
-    )
+    # Nodes and links are built as dicts and validated in one call, rather
+    # than constructing a model per node and link
+    return schemas.NetworkResponse.model_validate({"nodes": nodes, "links": links})
 
 
 def get_topic_clusters(db: Session, collection_id: Optional[int] = None) -> schemas.TopicResponse:
@@ -144,31 +148,23 @@ def get_topic_clusters(db: Session, collection_id: Optional[int] = None) -> sche
     Returns:
         Topic clusters
     """
-    query = db.query(db_models.Paper)
-
-    if collection_id:
-        query = query.join(db_models.Paper.collections).filter(
-            db_models.Collection.id == collection_id
-        )
-
-    papers = query.all()
-
-    # Extract keywords
+    all_paper_ids = []
     keyword_papers = defaultdict(list)
-    for paper in papers:
-        keywords = json.loads(paper.keywords or "[]")
-        for keyword in keywords:
-            keyword = keyword.lower().strip()
-            if keyword:
-                keyword_papers[keyword].append(paper.id)
+    for paper_id, keyword in _paper_keywords(db, collection_id):
+        if not all_paper_ids or all_paper_ids[-1] != paper_id:
+            all_paper_ids.append(paper_id)
+        keyword = keyword.lower().strip() if keyword else None
+        if keyword:
+            keyword_papers[keyword].append(paper_id)
 
-    # Create clusters from most common keywords
-    common_keywords = sorted(keyword_papers.items(), key=lambda x: len(x[1]), reverse=True)
+    # Create clusters from the 10 most common keywords; a heap selects them
+    # without sorting every keyword (ties keep first-seen order, as sorted did)
+    common_keywords = heapq.nlargest(10, keyword_papers.items(), key=lambda x: len(x[1]))
 
     clusters = []
     used_papers = set()
 
-    for cluster_id, (keyword, paper_ids) in enumerate(common_keywords[:10], 1):
+    for cluster_id, (keyword, paper_ids) in enumerate(common_keywords, 1):
         # Only include papers not already in a cluster
         unique_paper_ids = [pid for pid in paper_ids if pid not in used_papers]
 
@@ -184,8 +180,8 @@ def get_topic_clusters(db: Session, collection_id: Optional[int] = None) -> sche
             used_papers.update(unique_paper_ids)
 
     # Add "Other" cluster for remaining papers
-    if len(used_papers) < len(papers):
-        other_papers = [p.id for p in papers if p.id not in used_papers]
+    if len(used_papers) < len(all_paper_ids):
+        other_papers = [pid for pid in all_paper_ids if pid not in used_papers]
         clusters.append(schemas.TopicCluster(
             cluster_id=len(clusters) + 1,
             label="Other",
@@ -199,6 +195,52 @@ def get_topic_clusters(db: Session, collection_id: Optional[int] = None) -> sche
     )
 
 
+def _paper_keywords(db: Session, collection_id: Optional[int]) -> Iterator[Tuple[int, Optional[str]]]:
+    """
+    Stream (paper ID, keyword) rows in paper ID order
+
+    SQLite and Postgres unnest the keyword arrays in SQL (json_each /
+    json_array_elements_text), so only short rows cross into Python; other
+    databases stream (id, keywords) and unnest here. A paper without
+    keywords yields a single (id, None) row.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        elements = func.json_each(db_models.Paper.keywords).table_valued("value")
+    elif dialect == "postgresql":
+        # json_array_elements_text raises on a JSON null or scalar
+        arrays = case(
+            (func.json_typeof(db_models.Paper.keywords) == "array", db_models.Paper.keywords)
+        )
+        elements = func.json_array_elements_text(arrays).table_valued("value").lateral()
+    else:
+        elements = None
+
+    if elements is not None:
+        query = db.query(db_models.Paper.id, elements.c.value)\
+            .select_from(db_models.Paper)\
+            .outerjoin(elements, true())
+    else:
+        query = db.query(db_models.Paper.id, db_models.Paper.keywords)
+
+    if collection_id:
+        query = query.join(db_models.Paper.collections).filter(
+            db_models.Collection.id == collection_id
+        )
+
+    query = query.order_by(db_models.Paper.id).yield_per(1000)
+
+    if elements is not None:
+        yield from query
+        return
+
+    for paper_id, keywords in query:
+        if not keywords:
+            yield paper_id, None
+        for keyword in keywords or []:
+            yield paper_id, keyword
+
+
 def get_author_network(db: Session, collection_id: Optional[int] = None) -> schemas.NetworkResponse:
     """
     Generate author collaboration network
@@ -210,64 +252,205 @@ def get_author_network(db: Session, collection_id: Optional[int] = None) -> sche
     Returns:
         Network of authors and their collaborations
     """
-    query = db.query(db_models.Paper)
+    # (paper, author) pairs straight from the link table; no Paper or
+    # Author objects are loaded
+    link_table = db_models.paper_authors
+    query = db.query(link_table.c.paper_id, db_models.Author.id, db_models.Author.name)\
+        .join(db_models.Author, db_models.Author.id == link_table.c.author_id)
 
     if collection_id:
-        query = query.join(db_models.Paper.collections).filter(
-            db_models.Collection.id == collection_id
-        )
+        collection_link = db_models.collection_papers
+        query = query.join(
+            collection_link, collection_link.c.paper_id == link_table.c.paper_id
+        ).filter(collection_link.c.collection_id == collection_id)
 
-    papers = query.all()
+    query = query.order_by(link_table.c.paper_id, link_table.c.author_order, db_models.Author.id)
 
     nodes = []
     links = []
     author_map = {}
+    author_names = {}
     author_paper_count = Counter()
+    paper_authors = defaultdict(list)
 
     # Count papers per author
-    for paper in papers:
-        for author in paper.authors:
-            author_paper_count[author.id] += 1
+    for paper_id, author_id, name in query:
+        paper_authors[paper_id].append(author_id)
+        author_names.setdefault(author_id, name)
+        author_paper_count[author_id] += 1
 
     # Create author nodes
-    seen_authors = set()
-    for paper in papers:
-        for author in paper.authors:
-            if author.id not in seen_authors and author_paper_count[author.id] >= 2:
-                node_id = f"author_{author.id}"
-                author_map[author.id] = node_id
-
-                nodes.append(schemas.NetworkNode(
-                    id=node_id,
-                    label=author.name,
-                    size=min(author_paper_count[author.id] * 3, 30),
-                    group="author"
-                ))
-
-                seen_authors.add(author.id)
+    for author_id, name in author_names.items():
+        if author_paper_count[author_id] >= 2:
+            node_id = f"author_{author_id}"
+            author_map[author_id] = node_id
+
+            nodes.append({
+                "id": node_id,
+                "label": name,
+                "size": min(author_paper_count[author_id] * 3, 30),
+                "group": "author"
+            })
 
     # Create collaboration links
     collab_strengths = Counter()
-    for paper in papers:
-        author_ids = [a.id for a in paper.authors if a.id in author_map]
+    for paper_author_ids in paper_authors.values():
+        author_ids = sorted(aid for aid in paper_author_ids if aid in author_map)
 
-        if len(author_ids) > 1:
-            # Create links between all co-authors on this paper
-            for i, aid1 in enumerate(author_ids):
-                for aid2 in author_ids[i+1:]:
-                    link_key = tuple(sorted([aid1, aid2]))
-                    collab_strengths[link_key] += 1
+        # Create links between all co-authors on this paper
+        collab_strengths.update(combinations(author_ids, 2))
 
     # Add collaboration links
     for (aid1, aid2), strength in collab_strengths.items():
         if aid1 in author_map and aid2 in author_map:
-            links.append(schemas.NetworkLink(
-                source=author_map[aid1],
-                target=author_map[aid2],
-                weight=min(strength, 5.0)
-            ))
+            links.append({
+                "source": author_map[aid1],
+                "target": author_map[aid2],
+                "weight": min(strength, 5.0)
+            })
+
+    return schemas.NetworkResponse.model_validate({"nodes": nodes, "links": links})
+
 
-    return schemas.NetworkResponse(
-        nodes=nodes,
-        links=links
-    )
\ No newline at end of file
+# =============================================================================
+# MATERIALIZED PAYLOADS
+# =============================================================================
+
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="viz-refresh")
+_refresh_lock = threading.Lock()
+_refresh_pending = set()  # engines with a refresh queued but not started
+
+
+def _builders() -> Dict[str, Callable]:
+    return {
+        "timeline": get_timeline_data,
+        "network": get_citation_network,
+        "topics": get_topic_clusters,
+    }
+
+
+def _compute_payload(db: Session, kind: str, collection_id: int) -> dict:
+    return _builders()[kind](db, collection_id or None).model_dump(mode="json")
+
+
+def library_fingerprint(db: Session, collection_id: int) -> str:
+    """
+    Summarize the papers a payload is built from
+
+    Paper count plus latest update time, in one aggregate query. Adding,
+    removing or editing a paper changes it, including writes made outside
+    the API (e.g. the CLI).
+
+    Args:
+        db: Database session
+        collection_id: Collection to summarize, or 0 for the whole library
+
+    Returns:
+        Fingerprint string
+    """
+    query = db.query(func.count(db_models.Paper.id), func.max(db_models.Paper.updated_at))
+
+    if collection_id:
+        query = query.join(db_models.Paper.collections).filter(
+            db_models.Collection.id == collection_id
+        )
+
+    count, last_update = query.one()
+    return f"{count}:{last_update.isoformat() if last_update else ''}"
+
+
+def get_cached_visualization(db: Session, kind: str,
+                             collection_id: Optional[int] = None) -> dict:
+    """
+    Get a visualization payload from the materialized cache
+
+    Computes and stores it on first request; later requests are a row lookup
+    plus a fingerprint query. A row whose fingerprint no longer matches the
+    library is still returned while a background refresh runs.
+
+    Args:
+        db: Database session
+        kind: "timeline", "network" or "topics"
+        collection_id: Optional collection to filter by
+
+    Returns:
+        JSON-ready visualization payload
+    """
+    key = (kind, collection_id or 0)
+    row = db.get(db_models.VisualizationCache, key)
+    fingerprint = library_fingerprint(db, key[1])
+
+    if row is None:
+        payload = _compute_payload(db, kind, key[1])
+        db.merge(db_models.VisualizationCache(
+            kind=kind,
+            collection_id=key[1],
+            payload=payload,
+            fingerprint=fingerprint,
+            updated_at=datetime.utcnow()
+        ))
+        db.commit()
+        return payload
+
+    if row.fingerprint != fingerprint:
+        schedule_refresh(db.get_bind())
+
+    return row.payload
+
+
+def refresh_visualizations(db: Session):
+    """Recompute the materialized payloads whose papers have changed"""
+    fingerprints = {}
+    for row in db.query(db_models.VisualizationCache).all():
+        if row.collection_id not in fingerprints:
+            fingerprints[row.collection_id] = library_fingerprint(db, row.collection_id)
+        if row.fingerprint == fingerprints[row.collection_id]:
+            continue
+
+        row.payload = _compute_payload(db, row.kind, row.collection_id)
+        row.fingerprint = fingerprints[row.collection_id]
+        row.updated_at = datetime.utcnow()
+    db.commit()
+
+
+def schedule_refresh(bind: Engine, on_refreshed: Optional[Callable[[], None]] = None):
+    """
+    Refresh materialized payloads off the request path
+
+    Writes arriving while a refresh is queued share that refresh.
+
+    Args:
+        bind: Engine of the database that changed
+        on_refreshed: Called after the new payloads are committed
+    """
+    # An in-memory database lives on one shared connection (or one per
+    # thread), so a refresh in another thread would interleave with request
+    # transactions or miss the data entirely; refresh inline
+    if isinstance(bind.pool, (StaticPool, SingletonThreadPool)):
+        _run_refresh(bind, on_refreshed)
+        return
+
+    with _refresh_lock:
+        if bind in _refresh_pending:
+            return
+        _refresh_pending.add(bind)
+
+    _refresh_executor.submit(_run_refresh, bind, on_refreshed)
+
+
+def _run_refresh(bind: Engine, on_refreshed: Optional[Callable[[], None]]):
+    with _refresh_lock:
+        _refresh_pending.discard(bind)
+
+    db = Session(bind=bind)
+    try:
+        refresh_visualizations(db)
+    except Exception as e:
+        db.rollback()
+        print(f"⚠ Visualization refresh failed: {e}")
+        return
+    finally:
+        db.close()
+
+    if on_refreshed:
+        on_refreshed()
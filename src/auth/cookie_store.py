@@ -0,0 +1,82 @@
+"""JSON persistence and bulk merging for requests cookie jars"""
+
+from http.cookiejar import Cookie, CookieJar
+from typing import Iterable
+
+import orjson
+from requests.cookies import RequestsCookieJar
+
+
+def cookies_to_json(cookies: Iterable[Cookie]) -> bytes:
+    """
+    Serialize cookies as a JSON list of plain records
+
+    Keeps domain, path, secure and expiry alongside name and value, so a
+    reloaded cookie is only sent where the original would have been.
+
+    Args:
+        cookies: Cookie jar (or any iterable of cookies)
+
+    Returns:
+        JSON document
+    """
+    return orjson.dumps([
+        {
+            'name': cookie.name,
+            'value': cookie.value,
+            'domain': cookie.domain,
+            'path': cookie.path,
+            'secure': cookie.secure,
+            'expires': cookie.expires
+        }
+        for cookie in cookies
+    ])
+
+
+def add_cookies_from_json(jar: RequestsCookieJar, data: bytes):
+    """
+    Add cookies written by cookies_to_json to a jar
+
+    Args:
+        jar: Jar to add the cookies to
+        data: JSON document
+
+    Raises:
+        orjson.JSONDecodeError: If data is not valid JSON
+        KeyError: If a record has no name or value
+    """
+    for cookie in orjson.loads(data):
+        jar.set(
+            cookie['name'],
+            cookie['value'],
+            domain=cookie.get('domain', ''),
+            path=cookie.get('path', '/'),
+            secure=cookie.get('secure', False),
+            expires=cookie.get('expires')
+        )
+
+
+def merge_cookies(jar: RequestsCookieJar, cookies: Iterable[Cookie]):
+    """
+    Add cookies to a jar, replacing any with the same domain, path and name
+
+    Cookies go straight into the jar's domain -> path -> name dicts under
+    its lock (a whole path dict at a time when the source is a CookieJar),
+    rather than one set_cookie call per cookie. Values go in as stored;
+    unlike set_cookie, escaped quotes in quoted values are not stripped.
+
+    Args:
+        jar: Jar to add the cookies to
+        cookies: Cookie jar (or any iterable of cookies)
+    """
+    with jar._cookies_lock:
+        if isinstance(cookies, CookieJar):
+            for domain, paths in cookies._cookies.items():
+                jar_paths = jar._cookies.setdefault(domain, {})
+                for path, names in paths.items():
+                    jar_paths.setdefault(path, {}).update(names)
+        else:
+            for cookie in cookies:
+                jar._cookies.setdefault(cookie.domain, {}).setdefault(
+                    cookie.path, {}
+                )[cookie.name] = cookie
@@ -1,11 +1,13 @@
 """Simple session management for HTTP requests"""
 
-import pickle
 import json
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.auth.cookie_store import add_cookies_from_json, cookies_to_json
 from src.utils.config import Config
 
 
@@ -15,25 +17,43 @@ class SessionManager:
     def __init__(self, cache_dir: Optional[Path] = None):
         """Initialize session manager"""
         self.cache_dir = cache_dir or Config.CACHE_DIR
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = self._new_session()
+
+    @staticmethod
+    def _new_session() -> requests.Session:
+        """
+        Create a session sized for concurrent fetches
+
+        The default adapter keeps 10 connections per host, so threads
+        fetching many URLs from one host queue for a connection; a larger
+        pool keeps them all on keep-alive connections. Connection failures
+        are retried with backoff.
+        """
+        session = requests.Session()
+        session.headers.update({
             'User-Agent': 'LiteratureSearchBot/1.0 (Academic Research Tool)'
         })
 
-    def save_cookies(self, filename: str = "session_cookies.pkl"):
-        """Save session cookies to disk"""
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=128,
+            max_retries=Retry(total=3, backoff_factor=0.5)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def save_cookies(self, filename: str = "session_cookies.json"):
+        """Save session cookies to disk as a JSON list"""
         filepath = self.cache_dir / filename
-        with open(filepath, 'wb') as f:
-            pickle.dump(self.session.cookies, f)
+        filepath.write_bytes(cookies_to_json(self.session.cookies))
 
-    def load_cookies(self, filename: str = "session_cookies.pkl") -> bool:
+    def load_cookies(self, filename: str = "session_cookies.json") -> bool:
         """Load session cookies from disk"""
         filepath = self.cache_dir / filename
         if filepath.exists():
             try:
-                with open(filepath, 'rb') as f:
-                    cookies = pickle.load(f)
-                    self.session.cookies.update(cookies)
+                add_cookies_from_json(self.session.cookies, filepath.read_bytes())
                 return True
             except Exception as e:
                 print(f"Failed to load cookies: {e}")
@@ -49,7 +69,5 @@ class SessionManager:
 
     def clear_session(self):
         """Clear the current session"""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'LiteratureSearchBot/1.0 (Academic Research Tool)'
-        })
\ No newline at end of file
+        self.session.close()
+        self.session = self._new_session()
\ No newline at end of file
@@ -2,40 +2,165 @@
 
 import os
 import pickle
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 import http.cookiejar
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Callable, Optional, Set
+import orjson
 import requests
-from src.utils.config import Config
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
+from urllib3.util.retry import Retry
+from src.auth.cookie_store import add_cookies_from_json, cookies_to_json, merge_cookies
+
+
+# Only POSIX honours the permission bits we set on the config directory and
+# session file; elsewhere chmod is a wasted syscall
+_CHMOD_SUPPORTED = os.name == 'posix'
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
+PROXY_BASE = "https://proxy.library.ucsb.edu/login?url="
+
+
+def proxied_url(url) -> str:
+    """Convert a URL (str or pydantic HttpUrl) to UCSB proxy format"""
+    return f"{PROXY_BASE}{url}"
+
+
+# Proxy page phrases that indicate we're on campus/VPN, matched in one pass
+_VPN_INDICATORS = re.compile(
+    r'on campus|campus network|already on|no proxy needed|direct access',
+    re.IGNORECASE
+)
+
+# Words on the proxy login page that tell whether a session is logged in
+_LOGIN_PAGE_WORDS = re.compile(r'netid|password|logout|authenticated', re.IGNORECASE)
+
+# Cookie names that mark an authenticated proxy session
+_AUTH_COOKIE_NAMES = re.compile(r'ezproxy|session', re.IGNORECASE)
+
+
+def _find_phrases(response: requests.Response, pattern: re.Pattern,
+                  enough: Callable[[Set[str]], bool]) -> Set[str]:
+    """
+    Stream a response body, collecting the phrases of pattern it contains
+
+    Reads 8 KB at a time and stops as soon as enough(found) is true, so a
+    verdict near the top of a page doesn't download the rest. Consecutive
+    chunks overlap so phrases split across a boundary are still found.
+
+    Args:
+        response: Response requested with stream=True
+        pattern: Alternation of lowercase phrases, compiled case-insensitively
+        enough: Returns True once the phrases found settle the question
+
+    Returns:
+        Lowercased phrases found
+    """
+    if response.encoding is None:
+        response.encoding = 'utf-8'
+
+    overlap = max(len(phrase) for phrase in pattern.pattern.split('|')) - 1
+    found = set()
+    tail = ''
+    try:
+        for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
+            window = tail + chunk
+            found.update(match.group(0).lower() for match in pattern.finditer(window))
+            if enough(found):
+                break
+            tail = window[-overlap:]
+    finally:
+        response.close()
+    return found
+
+
+def _pooled_adapter() -> HTTPAdapter:
+    """
+    Adapter keeping up to 32 keep-alive connections per host, for 32 hosts
+
+    Repeated and concurrent requests through the library proxy reuse open
+    connections instead of paying a TCP/TLS handshake each; gateway errors
+    and dropped connections are retried with backoff. PDF downloads reach
+    many proxied publisher hosts, so pools for that many are kept.
+    """
+    return HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
 
 
 class UCSBAuth:
     """Manage UCSB library authentication via imported cookies"""
 
-    def __init__(self):
-        """Initialize UCSB authentication manager"""
-        # Create config directory
-        self.config_dir = Path.home() / ".config" / "litsearch"
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+    # Seconds a VPN probe result is reused by get_status
+    VPN_CHECK_TTL = 60.0
 
-        # Set restrictive permissions on config directory
-        try:
-            os.chmod(self.config_dir, 0o700)
-        except:
-            pass
+    # Saved cookies expiring later than this are trusted without a probe
+    COOKIE_EXPIRY_MARGIN = 300.0
+
+    def __init__(self):
+        """
+        Initialize UCSB authentication manager
 
-        self.cookies_file = self.config_dir / "ucsb_cookies.txt"
-        self.session_file = self.config_dir / "ucsb_session.pkl"
+        Nothing touches the filesystem or builds a session here; the config
+        directory and HTTP sessions are created on first use, so commands
+        that never exercise auth pay nothing for it.
+        """
+        self._config_path = Path.home() / ".config" / "litsearch"
+        self.cookies_file = self._config_path / "ucsb_cookies.txt"
+        self.session_file = self._config_path / "ucsb_session.json"
+        # Pickled cookie jar written by earlier versions; migrated on load
+        self.legacy_session_file = self._config_path / "ucsb_session.pkl"
 
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self._vpn_cache = (float("-inf"), False)  # (monotonic time, connected)
+        self._vpn_refresh = threading.Lock()  # held while a background probe runs
 
-        self.proxy_base = "https://proxy.library.ucsb.edu/login?url="
         self.is_authenticated = False
 
+        # mtime of the session file as last loaded or saved by this instance
+        self._session_mtime: Optional[int] = None
+
+    @cached_property
+    def config_dir(self) -> Path:
+        """Config directory, created with owner-only permissions on first access"""
+        self._config_path.mkdir(parents=True, exist_ok=True)
+
+        # Set restrictive permissions on config directory
+        if _CHMOD_SUPPORTED:
+            try:
+                os.chmod(self._config_path, 0o700)
+            except OSError:
+                pass
+
+        return self._config_path
+
+    @cached_property
+    def session(self) -> requests.Session:
+        """Session carrying the library cookies"""
+        session = requests.Session()
+        session.headers.update(_HEADERS)
+        adapter = _pooled_adapter()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @cached_property
+    def _probe_session(self) -> requests.Session:
+        """Cookie-free session for the VPN probe, kept so repeated status
+        checks reuse its connections"""
+        session = requests.Session()
+        session.headers.update(_HEADERS)
+        return session
+
     def import_cookies_netscape(self, cookies_file: Path) -> bool:
         """
         Import cookies from Netscape format (cookies.txt)
@@ -50,13 +175,15 @@ class UCSBAuth:
             raise FileNotFoundError(f"Cookie file not found: {cookies_file}")
 
         try:
-            # Create a cookie jar and load from Netscape format
+            # Create a cookie jar and load from Netscape format. The stdlib
+            # parser also handles #HttpOnly_ lines, and building its Cookie
+            # objects once is faster than a tab-split parser going through
+            # cookies.set per line
             cookie_jar = http.cookiejar.MozillaCookieJar()
             cookie_jar.load(str(cookies_file), ignore_discard=True, ignore_expires=True)
 
-            # Transfer cookies to requests session
-            for cookie in cookie_jar:
-                self.session.cookies.set_cookie(cookie)
+            # Transfer cookies to requests session in one merge
+            merge_cookies(self.session.cookies, cookie_jar)
 
             # Save session
             self._save_session()
@@ -86,23 +213,24 @@ class UCSBAuth:
         Returns:
             True if import successful
         """
-        import json
-
         if not cookies_file.exists():
             raise FileNotFoundError(f"Cookie file not found: {cookies_file}")
 
         try:
-            with open(cookies_file, 'r') as f:
-                cookies = json.load(f)
+            cookies = orjson.loads(cookies_file.read_bytes())
 
-            # Add cookies to session
-            for cookie in cookies:
-                self.session.cookies.set(
+            # Add cookies to session in one merge; records without a value
+            # are skipped, as cookies.set would have removed them
+            merge_cookies(self.session.cookies, (
+                create_cookie(
                     cookie.get('name'),
-                    cookie.get('value'),
+                    cookie['value'],
                     domain=cookie.get('domain'),
                     path=cookie.get('path', '/')
                 )
+                for cookie in cookies
+                if cookie.get('value') is not None
+            ))
 
             # Save and test
             self._save_session()
@@ -119,20 +247,31 @@ class UCSBAuth:
             print(f"✗ Failed to import cookies: {e}")
             return False
 
-    def load_session(self) -> bool:
+    def load_session(self, force: bool = False) -> bool:
         """
         Load previously saved session
 
+        The session is verified against the proxy unless every cookie has an
+        expiry at least COOKIE_EXPIRY_MARGIN seconds away.
+
+        Args:
+            force: Verify the session over the network regardless of expiry
+
         Returns:
             True if session loaded and valid
         """
         if not self.session_file.exists():
-            return False
+            return self._migrate_legacy_session()
 
         try:
+            self._session_mtime = self._session_file_mtime()
             with open(self.session_file, 'rb') as f:
-                cookies = pickle.load(f)
-                self.session.cookies.update(cookies)
+                add_cookies_from_json(self.session.cookies, f.read())
+
+            # Cookies that all outlive the margin need no round trip
+            if not force and self._cookies_outlive(self.COOKIE_EXPIRY_MARGIN):
+                self.is_authenticated = True
+                return True
 
             # Test if session is still valid
             if self.test_session():
@@ -147,14 +286,87 @@ class UCSBAuth:
             print(f"⚠ Failed to load session: {e}")
             return False
 
+    def _cookies_outlive(self, seconds: float) -> bool:
+        """
+        Whether every session cookie expires more than seconds from now
+
+        A cookie without an expiry lives until the server drops it, so its
+        presence (or an empty jar) means the session must be tested.
+        """
+        expiries = [cookie.expires for cookie in self.session.cookies]
+        if not expiries or None in expiries:
+            return False
+        return min(expiries) - time.time() >= seconds
+
+    def _migrate_legacy_session(self) -> bool:
+        """
+        Convert a pickled session file from an earlier version to JSON
+
+        Unpickles the user's own file once, rewrites it as JSON and removes
+        the pickle, so later loads never unpickle.
+
+        Returns:
+            True if a session was migrated and is valid
+        """
+        if not self.legacy_session_file.exists():
+            return False
+
+        try:
+            with open(self.legacy_session_file, 'rb') as f:
+                self.session.cookies.update(pickle.load(f))
+        except Exception as e:
+            print(f"⚠ Failed to load session: {e}")
+            return False
+
+        self._save_session()
+        if self.session_file.exists():
+            self.legacy_session_file.unlink()
+
+        if self.test_session():
+            self.is_authenticated = True
+            return True
+        self.clear_session()
+        return False
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the saved session if the file changed since it was last read
+
+        Lets a long-lived instance pick up cookies imported or cleared by
+        another process without re-reading the file on every request.
+
+        Returns:
+            True if the session was reloaded
+        """
+        mtime = self._session_file_mtime()
+        if mtime == self._session_mtime:
+            return False
+
+        self.session.cookies.clear()
+        self.is_authenticated = False
+        self._session_mtime = mtime
+        if mtime is not None:
+            self.load_session()
+        return True
+
+    def _session_file_mtime(self) -> Optional[int]:
+        """Modification time of the session file, or None if it doesn't exist"""
+        try:
+            return self.session_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
     def _save_session(self):
         """Save session cookies to disk"""
         try:
+            self.config_dir  # created on first save
             with open(self.session_file, 'wb') as f:
-                pickle.dump(self.session.cookies, f)
+                f.write(cookies_to_json(self.session.cookies))
 
             # Set restrictive permissions
-            os.chmod(self.session_file, 0o600)
+            if _CHMOD_SUPPORTED:
+                os.chmod(self.session_file, 0o600)
+            self._session_mtime = self._session_file_mtime()
 
         except Exception as e:
             print(f"⚠ Failed to save session: {e}")
@@ -169,24 +381,36 @@ class UCSBAuth:
         try:
             # Try to access a known proxied URL
             test_url = "https://proxy.library.ucsb.edu/login"
-            response = self.session.get(test_url, timeout=10, allow_redirects=True)
+
+            # A HEAD that is redirected to a login form settles it without
+            # downloading a page; anything else needs the page body
+            probe = self.session.head(test_url, timeout=10, allow_redirects=False)
+            if (probe.status_code in (301, 302, 303, 307, 308)
+                    and 'login' in probe.headers.get('Location', '').lower()):
+                return False
+
+            response = self.session.get(test_url, timeout=10, allow_redirects=True, stream=True)
 
             # Check if we're logged in (not redirected to login page)
-            # If authenticated, we should see "logout" or similar
-            content = response.text.lower()
+            # If authenticated, we should see "logout" or similar. A login
+            # form decides it as soon as it's seen; a logout link only counts
+            # if the rest of the page has no login form, so it reads on.
+            words = _find_phrases(
+                response, _LOGIN_PAGE_WORDS,
+                enough=lambda found: {'netid', 'password'} <= found
+            )
 
             # Simple heuristic: if we see login form, we're not authenticated
-            if 'netid' in content and 'password' in content:
+            if {'netid', 'password'} <= words:
                 return False
 
             # If we see logout or success indicators, we're authenticated
-            if 'logout' in content or 'authenticated' in content:
+            if 'logout' in words or 'authenticated' in words:
                 return True
 
             # Check cookies for UCSB-specific authentication cookies
             has_auth_cookies = any(
-                'ezproxy' in cookie.name.lower() or
-                'session' in cookie.name.lower()
+                _AUTH_COOKIE_NAMES.search(cookie.name)
                 for cookie in self.session.cookies
             )
 
@@ -205,35 +429,60 @@ class UCSBAuth:
         """
         return self.session
 
-    def get_proxied_url(self, url: str) -> str:
-        """
-        Convert URL to UCSB proxy format
-
-        Args:
-            url: Original URL
-
-        Returns:
-            Proxied URL
-        """
-        return f"{self.proxy_base}{url}"
+    # Convert URL to UCSB proxy format: get_proxied_url(url) -> proxied URL
+    get_proxied_url = staticmethod(proxied_url)
 
     def clear_session(self):
         """Clear saved session and cookies"""
         try:
             if self.session_file.exists():
                 self.session_file.unlink()
+            if self.legacy_session_file.exists():
+                self.legacy_session_file.unlink()
             if self.cookies_file.exists():
                 self.cookies_file.unlink()
 
             self.session.cookies.clear()
             self.is_authenticated = False
+            self._session_mtime = None
 
             print("✓ Session cleared")
 
         except Exception as e:
             print(f"⚠ Failed to clear session: {e}")
 
-    def check_vpn_connection(self) -> bool:
+    def check_vpn_connection(self, force: bool = False) -> bool:
+        """
+        Check if connected to UCSB VPN, reusing a recent probe result
+
+        Args:
+            force: Probe the network even if a recent result is cached
+
+        Returns:
+            True if VPN is connected
+        """
+        checked_at, connected = self._vpn_cache
+        if not force and time.monotonic() - checked_at < self.VPN_CHECK_TTL:
+            return connected
+
+        connected = self._probe_vpn_connection()
+        self._vpn_cache = (time.monotonic(), connected)
+        return connected
+
+    def _refresh_vpn_in_background(self):
+        """Re-probe the VPN on a daemon thread, unless a probe is already running"""
+        if not self._vpn_refresh.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                self.check_vpn_connection(force=True)
+            finally:
+                self._vpn_refresh.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _probe_vpn_connection(self) -> bool:
         """
         Check if connected to UCSB VPN by testing access to UCSB network
 
@@ -243,47 +492,38 @@ class UCSBAuth:
         try:
             # Test access to UCSB library proxy - when on VPN, this should respond differently
             # We'll check if we can reach a UCSB-specific IP range or service
-            test_session = requests.Session()
-            test_session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            })
-
-            # Try to access a resource that indicates UCSB network access
-            # The library proxy login page behavior differs when on VPN
-            response = test_session.get(
-                "https://www.library.ucsb.edu/",
-                timeout=5,
-                allow_redirects=True
-            )
+            test_session = self._probe_session
+            test_session.cookies.clear()  # Probe as a fresh visitor each time
+
+            # The probes are independent, so they run concurrently. The IP
+            # lookup is only consulted when the proxy page shows no indicator
+            # (the usual case off campus), so it is started up front too.
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                # The library proxy login page behavior differs when on VPN
+                # Check for VPN indicators - when on UCSB network, certain headers or redirects appear
+                # Also check if we can access proxy resources without authentication
+                proxy_future = pool.submit(
+                    test_session.get,
+                    "https://proxy.library.ucsb.edu/login",
+                    timeout=5,
+                    allow_redirects=True,
+                    stream=True
+                )
 
-            # Check for VPN indicators - when on UCSB network, certain headers or redirects appear
-            # Also check if we can access proxy resources without authentication
-            proxy_test = test_session.get(
-                "https://proxy.library.ucsb.edu/login",
-                timeout=5,
-                allow_redirects=True
-            )
+                ip_future = pool.submit(
+                    test_session.get, "https://api.ipify.org?format=json", timeout=5
+                )
+
+                proxy_test = proxy_future.result()
 
             # When on VPN, the proxy page should show we're already on campus network
-            content = proxy_test.text.lower()
-
-            # Look for indicators that we're on campus/VPN
-            vpn_indicators = [
-                'on campus',
-                'campus network',
-                'already on',
-                'no proxy needed',
-                'direct access'
-            ]
-
-            for indicator in vpn_indicators:
-                if indicator in content:
-                    return True
+            if _find_phrases(proxy_test, _VPN_INDICATORS, enough=bool):
+                return True
 
             # Alternative check: see if our IP is in UCSB range
             # UCSB IP ranges typically start with 128.111.x.x or 169.231.x.x
             try:
-                ip_response = test_session.get("https://api.ipify.org?format=json", timeout=5)
+                ip_response = ip_future.result()
                 ip_data = ip_response.json()
                 ip = ip_data.get('ip', '')
 
@@ -305,8 +545,14 @@ class UCSBAuth:
         Returns:
             Dictionary with status information
         """
-        # Check VPN connection
-        vpn_connected = self.check_vpn_connection()
+        if self.is_authenticated and self._cookies_outlive(self.COOKIE_EXPIRY_MARGIN):
+            # Cookies alone grant access, so don't block on the network:
+            # report the last VPN result and refresh it in the background
+            checked_at, vpn_connected = self._vpn_cache
+            if time.monotonic() - checked_at >= self.VPN_CHECK_TTL:
+                self._refresh_vpn_in_background()
+        else:
+            vpn_connected = self.check_vpn_connection()
 
         status = {
             'authenticated': self.is_authenticated or vpn_connected,
@@ -2,8 +2,9 @@
 """Main CLI entry point for literature search application"""
 
 import click
-import json
+import orjson
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 from rich.console import Console
@@ -12,14 +13,125 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich.syntax import Syntax
 
-from src.models import SearchQuery, Source, PaperType
+from src.models import Author, Paper, SearchQuery, SearchResult, Source, PaperType
 from src.search.orchestrator import SearchOrchestrator
 from src.retrieval.pdf_retriever import PDFRetriever
 from src.utils.config import Config
+from src.utils.result_cache import SearchResultCache
 
 console = Console()
 
 
+def _results_format(output: str, fmt: Optional[str]) -> str:
+    """Format for a results file: as given, else msgpack for a .msgpack suffix"""
+    if fmt:
+        return fmt
+    return 'msgpack' if Path(output).suffix == '.msgpack' else 'json'
+
+
+def _encode_value(value):
+    """Encode what the serializers don't handle natively: URLs, and datetimes for msgpack"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _write_results(path: Path, header: dict, papers: List[Paper], fmt: str):
+    """
+    Write search results as JSON or MessagePack, one paper at a time
+
+    Each paper is dumped and encoded on its own straight into the file, so
+    only one paper's dict and bytes are alive at once rather than the whole
+    result set twice over. The file is the header object with a "papers"
+    list appended; in JSON each paper takes one compact line.
+
+    Args:
+        path: Output file
+        header: Query, statistics and other top-level fields
+        papers: Papers to write
+        fmt: 'json' or 'msgpack'
+    """
+    with open(path, 'wb') as f:
+        if fmt == 'msgpack':
+            import msgpack
+            packer = msgpack.Packer(default=_encode_value)
+            f.write(packer.pack_map_header(len(header) + 1))
+            for key, value in header.items():
+                f.write(packer.pack(key))
+                f.write(packer.pack(value))
+            f.write(packer.pack('papers'))
+            f.write(packer.pack_array_header(len(papers)))
+            for paper in papers:
+                f.write(packer.pack(paper.model_dump()))
+            return
+
+        options = orjson.OPT_NON_STR_KEYS
+        # The indented header without its closing brace, then the papers
+        f.write(orjson.dumps(header, default=_encode_value, option=options | orjson.OPT_INDENT_2)[:-2])
+        f.write(b',\n  "papers": [')
+        for i, paper in enumerate(papers):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(orjson.dumps(paper.model_dump(), default=_encode_value, option=options))
+        f.write(b'\n  ]\n}\n' if papers else b']\n}\n')
+
+
+def _load_results(data: bytes) -> dict:
+    """Decode a results file written by search, JSON or MessagePack"""
+    # A JSON results file is an object; anything else is MessagePack
+    if data.lstrip()[:1] == b'{':
+        return orjson.loads(data)
+
+    import msgpack
+    return msgpack.unpackb(data, strict_map_key=False)
+
+
+def _surname(author: Author) -> str:
+    """Author's last name, as recorded by the source when it gave one"""
+    return author.last_name or author.name.split()[-1]
+
+
+def _format_authors(authors: List[Author]) -> str:
+    """Short author credit: the name, both surnames, or first surname et al."""
+    if not authors:
+        return "Unknown"
+    if len(authors) == 1:
+        return authors[0].name
+    if len(authors) == 2:
+        return f"{_surname(authors[0])} & {_surname(authors[1])}"
+    return f"{_surname(authors[0])} et al."
+
+
+def _papers_table(papers: List[Paper]) -> Table:
+    """
+    Table of papers for the terminal, one row per paper
+
+    Each row's cells are computed once up front and added as a tuple.
+    """
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("#", style="dim", width=3)
+    table.add_column("Title", width=50)
+    table.add_column("Authors", width=20)
+    table.add_column("Year", width=4)
+    table.add_column("Citations", width=8)
+    table.add_column("Type", width=10)
+
+    rows = [
+        (
+            str(i),
+            paper.title if len(paper.title) <= 47 else paper.title[:47] + "...",
+            _format_authors(paper.authors)[:20],
+            str(paper.year or ""),
+            str(paper.citations),
+            paper.paper_type.value
+        )
+        for i, paper in enumerate(papers, 1)
+    ]
+    for row in rows:
+        table.add_row(*row)
+
+    return table
+
+
 @click.group()
 @click.version_option(version="0.1.0")
 def cli():
@@ -41,18 +153,33 @@ def cli():
               help='Maximum results per source')
 @click.option('--year-start', type=int, help='Start year for filtering')
 @click.option('--year-end', type=int, help='End year for filtering')
-@click.option('--output', '-o', type=click.Path(), help='Output file (JSON)')
+@click.option('--output', '-o', type=click.Path(), help='Output file (JSON or MessagePack)')
+@click.option('--format', 'fmt', type=click.Choice(['json', 'msgpack']),
+              help='Output format (default: msgpack for .msgpack files, else JSON)')
 @click.option('--download/--no-download', default=False,
               help='Download PDFs automatically')
+@click.option('--no-cache', is_flag=True,
+              help='Query the sources without reading or storing cached results')
+@click.option('--refresh-cache', is_flag=True,
+              help='Query the sources and replace any cached results')
 def search(query: str, sources: tuple, max_results: int,
            year_start: Optional[int], year_end: Optional[int],
-           output: Optional[str], download: bool):
+           output: Optional[str], fmt: Optional[str], download: bool,
+           no_cache: bool, refresh_cache: bool):
     """
     Search for academic papers
 
     Example:
         litsearch search "machine learning healthcare" -n 20 --download
+        litsearch search "coral bleaching" -o results.msgpack
     """
+    if output and _results_format(output, fmt) == 'msgpack':
+        try:
+            import msgpack  # noqa: F401
+        except ImportError:
+            console.print("[red]MessagePack output needs msgpack: pip install msgpack[/red]")
+            return
+
     console.print(f"\n[bold cyan]🔍 Searching for:[/bold cyan] {query}")
     console.print(f"[dim]Sources: {', '.join(sources)}[/dim]\n")
 
@@ -74,17 +201,31 @@ def search(query: str, sources: tuple, max_results: int,
         year_end=year_end
     )
 
-    # Execute search
-    orchestrator = SearchOrchestrator()
+    # Reuse results of the same search from the last day; the orchestrator
+    # and its source clients are only built on a miss
+    cache = None if no_cache else SearchResultCache(Config.CACHE_DIR / "search_results.db")
+    cache_key = SearchResultCache.key(search_query.model_dump_json())
+    cached = cache.get(cache_key) if cache is not None and not refresh_cache else None
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Searching databases...", total=None)
-        results = orchestrator.search(search_query)
-        progress.remove_task(task)
+    if cached is not None:
+        results = SearchResult.model_validate_json(cached)
+        console.print("[dim]Using cached results (--refresh-cache to search again)[/dim]")
+    else:
+        # Execute search
+        orchestrator = SearchOrchestrator()
+
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            task = progress.add_task("Searching databases...", total=None)
+            results = orchestrator.search(search_query)
+            progress.remove_task(task)
+
+        # Don't pin a partial result set for a day
+        if cache is not None and not results.errors:
+            cache.set(cache_key, results.model_dump_json().encode())
 
     # Display results
     console.print(f"\n[bold green]✓ Found {len(results.papers)} unique papers[/bold green]")
@@ -109,41 +250,7 @@ def search(query: str, sources: tuple, max_results: int,
     if results.papers:
         console.print("\n[bold]Top Results:[/bold]")
 
-        papers_table = Table(show_header=True, header_style="bold magenta")
-        papers_table.add_column("#", style="dim", width=3)
-        papers_table.add_column("Title", width=50)
-        papers_table.add_column("Authors", width=20)
-        papers_table.add_column("Year", width=4)
-        papers_table.add_column("Citations", width=8)
-        papers_table.add_column("Type", width=10)
-
-        for i, paper in enumerate(results.papers[:10], 1):
-            # Truncate title if needed
-            title = paper.title
-            if len(title) > 47:
-                title = title[:47] + "..."
-
-            # Format authors
-            if paper.authors:
-                if len(paper.authors) == 1:
-                    authors = paper.authors[0].name
-                elif len(paper.authors) == 2:
-                    authors = f"{paper.authors[0].name.split()[-1]} & {paper.authors[1].name.split()[-1]}"
-                else:
-                    authors = f"{paper.authors[0].name.split()[-1]} et al."
-            else:
-                authors = "Unknown"
-
-            papers_table.add_row(
-                str(i),
-                title,
-                authors[:20],
-                str(paper.year or ""),
-                str(paper.citations),
-                paper.paper_type.value
-            )
-
-        console.print(papers_table)
+        console.print(_papers_table(results.papers[:10]))
 
     # Download PDFs if requested
     if download and results.papers:
@@ -170,16 +277,15 @@ def search(query: str, sources: tuple, max_results: int,
     # Save results if output specified
     if output:
         output_path = Path(output)
-        with open(output_path, 'w') as f:
-            # Convert to dict for JSON serialization
-            results_dict = {
-                'query': search_query.model_dump(),
-                'statistics': stats,
-                'papers': [p.model_dump() for p in results.papers],
-                'search_time': results.search_time,
-                'errors': results.errors
-            }
-            json.dump(results_dict, f, indent=2, default=str)
+        # Enums and year keys are encoded natively, URLs and datetimes by
+        # _encode_value; papers are streamed after the other fields
+        header = {
+            'query': search_query.model_dump(),
+            'statistics': stats,
+            'search_time': results.search_time,
+            'errors': results.errors
+        }
+        _write_results(output_path, header, results.papers, _results_format(output, fmt))
         console.print(f"\n[green]Results saved to: {output_path}[/green]")
 
 
@@ -195,28 +301,35 @@ def download(results_file: str, max_papers: int, concurrent: int):
 
     Example:
         litsearch download results.json -n 20
+        litsearch download results.msgpack
     """
     # Load results
-    with open(results_file) as f:
-        data = json.load(f)
+    try:
+        data = _load_results(Path(results_file).read_bytes())
+    except ImportError:
+        console.print("[red]Reading MessagePack results needs msgpack: pip install msgpack[/red]")
+        return
 
     papers_data = data.get('papers', [])
     if not papers_data:
         console.print("[red]No papers found in results file[/red]")
         return
 
-    # Convert to Paper objects
-    from src.models import Paper
-    papers = []
-    for paper_dict in papers_data[:max_papers]:
-        try:
-            # Handle datetime strings
-            if 'retrieved_at' in paper_dict:
-                paper_dict['retrieved_at'] = paper_dict['retrieved_at'].split('T')[0]
-            papers.append(Paper(**paper_dict))
-        except Exception as e:
-            console.print(f"[yellow]Warning: Could not load paper: {e}[/yellow]")
-            continue
+    # Convert to Paper objects in one validation pass (retrieved_at parses
+    # as written); only a file with bad records is re-read paper by paper
+    # so the rest still load
+    from pydantic import TypeAdapter, ValidationError
+    papers_data = papers_data[:max_papers]
+    try:
+        papers = TypeAdapter(List[Paper]).validate_python(papers_data)
+    except ValidationError:
+        papers = []
+        for paper_dict in papers_data:
+            try:
+                papers.append(Paper(**paper_dict))
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not load paper: {e}[/yellow]")
+                continue
 
     console.print(f"\n[bold cyan]📥 Downloading {len(papers)} papers...[/bold cyan]")
 
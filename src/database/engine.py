@@ -1,37 +1,117 @@
 """Database engine and session management"""
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 from contextlib import contextmanager
 from pathlib import Path
 
 from src.utils.config import Config
-from .models import Base
+from .models import Base, VisualizationCache
+from . import fts, stats  # noqa: F401 - creates the FTS5 index and counters alongside the tables
 
 # Create database directory
 db_dir = Config.BASE_DIR / "database"
 db_dir.mkdir(parents=True, exist_ok=True)
 
 # Database URL
-DATABASE_URL = f"sqlite:///{db_dir / 'papers.db'}"
+DATABASE_URL = Config.DATABASE_URL or f"sqlite:///{db_dir / 'papers.db'}"
 
-# Create engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-    echo=Config.DEBUG
+
+def _json_dumps(value) -> str:
+    """Serialize a JSON column value"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _engine_options(url: str) -> dict:
+    """
+    Connection pool options for the given database URL
+
+    An in-memory SQLite database only exists on a single connection, so it
+    keeps StaticPool. Everything else gets an explicitly sized QueuePool so
+    concurrent requests don't stall on the default 5 + 10 connections.
+    """
+    options = {
+        "echo": Config.DEBUG,
+        # JSON columns (paper keywords/sources, search filters, visualization
+        # payloads) are encoded and decoded with orjson instead of stdlib json
+        "json_serializer": _json_dumps,
+        "json_deserializer": orjson.loads,
+    }
+
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+        if ":memory:" in url or url.rstrip("/") == "sqlite:":
+            options["poolclass"] = StaticPool
+            return options
+
+    options.update(
+        poolclass=QueuePool,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_timeout=Config.DB_POOL_TIMEOUT,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+    return options
+
+
+# Per-connection settings for a SQLite file: WAL lets searches read while a
+# batch of papers is written, and with it synchronous=NORMAL only syncs at
+# checkpoints rather than on every commit. Temp tables, a 64 MB page cache
+# and 256 MB of memory-mapped reads keep the FTS and visualization queries
+# off the disk where possible. foreign_keys is left alone: enforcing it is
+# a behaviour change for existing databases, not a tuning knob.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
 )
 
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply _SQLITE_PRAGMAS to a new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# Create engine
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+
+# An in-memory database has no journal file to put in WAL mode
+if engine.dialect.name == "sqlite" and engine.pool.__class__ is not StaticPool:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
 def init_db():
     """Initialize database tables"""
+    # Materialized visualization payloads are disposable; rebuild the table
+    # rather than migrate it when its columns have changed
+    cache_table = VisualizationCache.__table__
+    inspector = inspect(engine)
+    if inspector.has_table(cache_table.name):
+        columns = {column["name"] for column in inspector.get_columns(cache_table.name)}
+        if columns != set(cache_table.columns.keys()):
+            cache_table.drop(bind=engine)
+
     Base.metadata.create_all(bind=engine)
-    print(f"✓ Database initialized at {db_dir / 'papers.db'}")
+
+    # create_all skips tables that already exist; add indexes defined since
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    print(f"✓ Database initialized at {engine.url.render_as_string(hide_password=True)}")
 
 
 @contextmanager
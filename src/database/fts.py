@@ -0,0 +1,194 @@
+"""Full-text index over papers: SQLite FTS5, or GIN tsvector indexes on Postgres"""
+
+import re
+from typing import List
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from .models import Base
+
+FTS_TABLE = "papers_fts"
+
+# The index keeps its own copy of the text so it can span papers and
+# pdf_content; triggers keep it in step with both tables.
+_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, abstract, keywords, full_text,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER papers_fts_insert AFTER INSERT ON papers BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, abstract, keywords, full_text)
+        VALUES (
+            new.id, new.title, new.abstract, new.keywords,
+            (SELECT full_text FROM pdf_content WHERE paper_id = new.id)
+        );
+    END
+    """,
+    f"""
+    CREATE TRIGGER papers_fts_update AFTER UPDATE OF title, abstract, keywords ON papers BEGIN
+        UPDATE {FTS_TABLE}
+        SET title = new.title, abstract = new.abstract, keywords = new.keywords
+        WHERE rowid = new.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER papers_fts_delete AFTER DELETE ON papers BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER pdf_content_fts_insert AFTER INSERT ON pdf_content BEGIN
+        UPDATE {FTS_TABLE} SET full_text = new.full_text WHERE rowid = new.paper_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER pdf_content_fts_update AFTER UPDATE OF full_text ON pdf_content BEGIN
+        UPDATE {FTS_TABLE} SET full_text = new.full_text WHERE rowid = new.paper_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER pdf_content_fts_delete AFTER DELETE ON pdf_content BEGIN
+        UPDATE {FTS_TABLE} SET full_text = NULL WHERE rowid = old.paper_id;
+    END
+    """,
+]
+
+# Postgres indexes the same document expression the search queries use, so
+# the planner can answer @@ from the GIN index without a stored column.
+_PG_DOCUMENT = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || "
+    "coalesce(abstract, '') || ' ' || coalesce(keywords::text, ''))"
+)
+_PG_PDF_DOCUMENT = "to_tsvector('english', coalesce(full_text, ''))"
+_PG_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_papers_fulltext ON papers USING GIN ({_PG_DOCUMENT})",
+    f"CREATE INDEX IF NOT EXISTS ix_pdf_content_fulltext ON pdf_content USING GIN ({_PG_PDF_DOCUMENT})",
+]
+
+_BACKFILL = f"""
+    INSERT INTO {FTS_TABLE}(rowid, title, abstract, keywords, full_text)
+    SELECT p.id, p.title, p.abstract, p.keywords, c.full_text
+    FROM papers p LEFT JOIN pdf_content c ON c.paper_id = p.id
+"""
+
+
+def is_supported(db: Session) -> bool:
+    """Whether the session is bound to a database with a full-text index"""
+    return db.get_bind().dialect.name in ("sqlite", "postgresql")
+
+
+def install(target, connection, **kw):
+    """
+    Create the FTS5 table and its triggers, indexing any existing papers
+
+    On Postgres, creates GIN expression indexes instead. Runs after
+    Base.metadata.create_all; a no-op on other databases or when the index
+    already exists.
+    """
+    if connection.dialect.name == "postgresql":
+        for statement in _PG_DDL:
+            connection.execute(text(statement))
+        return
+
+    if connection.dialect.name != "sqlite":
+        return
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE}
+    ).first()
+    if exists:
+        return
+
+    for statement in _DDL:
+        connection.execute(text(statement))
+    connection.execute(text(_BACKFILL))
+
+
+event.listen(Base.metadata, "after_create", install)
+
+
+def uninstall(target, connection, **kw):
+    """Drop the table with the rest of the schema (Base.metadata.drop_all)"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {FTS_TABLE}"))
+
+
+event.listen(Base.metadata, "after_drop", uninstall)
+
+
+def build_match_query(query: str, any_term: bool = False) -> str:
+    """
+    Turn free text into an FTS5 MATCH expression
+
+    Each word becomes a quoted prefix term so user input can't inject FTS5
+    syntax; terms are ANDed together, or ORed with any_term.
+
+    Args:
+        query: Free-text search query
+        any_term: Match papers containing any word rather than all of them
+
+    Returns:
+        MATCH expression, or an empty string if the query has no words
+    """
+    terms = re.findall(r"\w+", query)
+    return (" OR " if any_term else " ").join(f'"{term}"*' for term in terms)
+
+
+def search_paper_ids(db: Session, query: str, limit: int = 50,
+                     any_term: bool = False) -> List[int]:
+    """
+    Find papers matching a query, best match first (BM25 on SQLite,
+    ts_rank on Postgres)
+
+    Args:
+        db: Database session
+        query: Free-text search query
+        limit: Maximum results
+        any_term: Match papers containing any word rather than all of them
+
+    Returns:
+        Matching paper IDs in rank order
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        if any_term:
+            # Words only, so the to_tsquery operators can't come from user input
+            tsquery = "to_tsquery('english', :query)"
+            query = " | ".join(re.findall(r"\w+", query))
+            if not query:
+                return []
+        else:
+            tsquery = "plainto_tsquery('english', :query)"
+
+        # Each branch can use its own GIN index; a paper matching in both
+        # ranks by its better match
+        rows = db.execute(
+            text(
+                f"SELECT id FROM ("
+                f"SELECT id, ts_rank({_PG_DOCUMENT}, {tsquery}) AS rank FROM papers "
+                f"WHERE {_PG_DOCUMENT} @@ {tsquery} "
+                f"UNION ALL "
+                f"SELECT paper_id, ts_rank({_PG_PDF_DOCUMENT}, {tsquery}) FROM pdf_content "
+                f"WHERE {_PG_PDF_DOCUMENT} @@ {tsquery}"
+                f") AS matches "
+                f"GROUP BY id ORDER BY max(rank) DESC LIMIT :limit"
+            ),
+            {"query": query, "limit": limit}
+        )
+        return [row[0] for row in rows]
+
+    match = build_match_query(query, any_term)
+    if not match:
+        return []
+
+    rows = db.execute(
+        text(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match "
+            f"ORDER BY bm25({FTS_TABLE}) LIMIT :limit"
+        ),
+        {"match": match, "limit": limit}
+    )
+    return [row[0] for row in rows]
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table, UniqueConstraint, JSON, Index
 from sqlalchemy.orm import DeclarativeBase, relationship, Mapped, mapped_column
 
 
@@ -17,7 +17,9 @@ paper_authors = Table(
     Base.metadata,
     Column('paper_id', Integer, ForeignKey('papers.id'), primary_key=True),
     Column('author_id', Integer, ForeignKey('authors.id'), primary_key=True),
-    Column('author_order', Integer, default=0)
+    Column('author_order', Integer, default=0),
+    # The primary key serves paper -> authors; this serves author -> papers
+    Index('ix_paper_authors_author', 'author_id', 'paper_id')
 )
 
 collection_papers = Table(
@@ -25,20 +27,28 @@ collection_papers = Table(
     Base.metadata,
     Column('collection_id', Integer, ForeignKey('collections.id'), primary_key=True),
     Column('paper_id', Integer, ForeignKey('papers.id'), primary_key=True),
-    Column('added_at', DateTime, default=datetime.utcnow)
+    Column('added_at', DateTime, default=datetime.utcnow),
+    Index('ix_collection_papers_paper', 'paper_id', 'collection_id')
 )
 
 paper_tags = Table(
     'paper_tags',
     Base.metadata,
     Column('paper_id', Integer, ForeignKey('papers.id'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True)
+    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+    Index('ix_paper_tags_tag', 'tag_id', 'paper_id')
 )
 
 
 class Paper(Base):
     """Paper model"""
     __tablename__ = 'papers'
+    __table_args__ = (
+        # Newest-first listing and keyset pagination
+        Index('ix_papers_created_id', 'created_at', 'id'),
+        # The same listing filtered by year, read in order from the index
+        Index('ix_papers_year_created_id', 'year', 'created_at', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
 
@@ -51,7 +61,7 @@ class Paper(Base):
 
     # Content
     abstract: Mapped[Optional[str]] = mapped_column(Text)
-    keywords: Mapped[Optional[str]] = mapped_column(Text)  # JSON string
+    keywords: Mapped[Optional[List[str]]] = mapped_column(JSON)
 
     # Publication info
     year: Mapped[Optional[int]] = mapped_column(Integer, index=True)
@@ -74,7 +84,7 @@ class Paper(Base):
 
     # Metadata
     paper_type: Mapped[Optional[str]] = mapped_column(String(50))
-    sources: Mapped[Optional[str]] = mapped_column(Text)  # JSON string
+    sources: Mapped[Optional[List[str]]] = mapped_column(JSON)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -83,6 +93,7 @@ class Paper(Base):
     # Relationships
     authors: Mapped[List["Author"]] = relationship(
         secondary=paper_authors,
+        order_by=paper_authors.c.author_order,
         back_populates="papers"
     )
     collections: Mapped[List["Collection"]] = relationship(
@@ -150,12 +161,24 @@ class SearchHistory(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     query: Mapped[str] = mapped_column(Text, nullable=False)
-    sources: Mapped[Optional[str]] = mapped_column(Text)  # JSON string
-    filters: Mapped[Optional[str]] = mapped_column(Text)  # JSON string
+    sources: Mapped[Optional[List[str]]] = mapped_column(JSON)
+    filters: Mapped[Optional[dict]] = mapped_column(JSON)
     results_count: Mapped[int] = mapped_column(Integer, default=0)
     searched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
 
 
+class VisualizationCache(Base):
+    """Precomputed visualization payloads, refreshed after library writes"""
+    __tablename__ = 'visualization_cache'
+
+    kind: Mapped[str] = mapped_column(String(50), primary_key=True)
+    collection_id: Mapped[int] = mapped_column(Integer, primary_key=True)  # 0 = whole library
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False)
+    # Paper count and latest update the payload was built from
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64))
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
 class Tag(Base):
     """Tags for papers"""
     __tablename__ = 'tags'
@@ -0,0 +1,142 @@
+"""Library counters kept up to date by SQLite triggers"""
+
+from typing import Tuple
+from sqlalchemy import event, func, select, text
+from sqlalchemy.orm import Session
+
+from .models import Base, Paper, Collection, SearchHistory
+
+STATS_TABLE = "library_stats"
+
+# A single row (id = 1) of running totals; triggers adjust it on every
+# insert and delete, so reading the stats never scans the tables.
+_DDL = [
+    f"""
+    CREATE TABLE {STATS_TABLE} (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        total_papers INTEGER NOT NULL DEFAULT 0,
+        total_pdfs INTEGER NOT NULL DEFAULT 0,
+        total_collections INTEGER NOT NULL DEFAULT 0,
+        total_searches INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    f"""
+    CREATE TRIGGER library_stats_paper_insert AFTER INSERT ON papers BEGIN
+        UPDATE {STATS_TABLE}
+        SET total_papers = total_papers + 1,
+            total_pdfs = total_pdfs + (new.local_pdf_path IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER library_stats_paper_pdf AFTER UPDATE OF local_pdf_path ON papers BEGIN
+        UPDATE {STATS_TABLE}
+        SET total_pdfs = total_pdfs
+            + (new.local_pdf_path IS NOT NULL) - (old.local_pdf_path IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER library_stats_paper_delete AFTER DELETE ON papers BEGIN
+        UPDATE {STATS_TABLE}
+        SET total_papers = total_papers - 1,
+            total_pdfs = total_pdfs - (old.local_pdf_path IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER library_stats_collection_insert AFTER INSERT ON collections BEGIN
+        UPDATE {STATS_TABLE} SET total_collections = total_collections + 1 WHERE id = 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER library_stats_collection_delete AFTER DELETE ON collections BEGIN
+        UPDATE {STATS_TABLE} SET total_collections = total_collections - 1 WHERE id = 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER library_stats_search_insert AFTER INSERT ON search_history BEGIN
+        UPDATE {STATS_TABLE} SET total_searches = total_searches + 1 WHERE id = 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER library_stats_search_delete AFTER DELETE ON search_history BEGIN
+        UPDATE {STATS_TABLE} SET total_searches = total_searches - 1 WHERE id = 1;
+    END
+    """,
+]
+
+_BACKFILL = f"""
+    INSERT INTO {STATS_TABLE} (id, total_papers, total_pdfs, total_collections, total_searches)
+    SELECT 1,
+        (SELECT COUNT(*) FROM papers),
+        (SELECT COUNT(*) FROM papers WHERE local_pdf_path IS NOT NULL),
+        (SELECT COUNT(*) FROM collections),
+        (SELECT COUNT(*) FROM search_history)
+"""
+
+
+def install(target, connection, **kw):
+    """
+    Create the counters table and its triggers, seeded from existing rows
+
+    Runs after Base.metadata.create_all; a no-op on other databases or when
+    the table already exists.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": STATS_TABLE}
+    ).first()
+    if exists:
+        return
+
+    for statement in _DDL:
+        connection.execute(text(statement))
+    connection.execute(text(_BACKFILL))
+
+
+event.listen(Base.metadata, "after_create", install)
+
+
+def uninstall(target, connection, **kw):
+    """Drop the table with the rest of the schema (Base.metadata.drop_all)"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text(f"DROP TABLE IF EXISTS {STATS_TABLE}"))
+
+
+event.listen(Base.metadata, "after_drop", uninstall)
+
+
+def read_counts(db: Session) -> Tuple[int, int, int, int]:
+    """
+    Get library totals
+
+    Reads the trigger-maintained row on SQLite; elsewhere counts the tables
+    in a single query.
+
+    Args:
+        db: Database session
+
+    Returns:
+        (total_papers, total_pdfs, total_collections, total_searches)
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        row = db.execute(text(
+            f"SELECT total_papers, total_pdfs, total_collections, total_searches "
+            f"FROM {STATS_TABLE} WHERE id = 1"
+        )).first()
+        if row is not None:
+            return tuple(row)
+
+    # One round trip: each count is a scalar subquery of a single SELECT
+    return tuple(db.query(
+        select(func.count(Paper.id)).scalar_subquery(),
+        select(func.count(Paper.id))
+            .where(Paper.local_pdf_path.isnot(None))
+            .scalar_subquery(),
+        select(func.count(Collection.id)).scalar_subquery(),
+        select(func.count(SearchHistory.id)).scalar_subquery()
+    ).one())
@@ -2,9 +2,12 @@
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
+from urllib.parse import urlsplit
 from typing import Tuple, List, Optional, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.auth.ucsb_auth import proxied_url
 from src.models import Paper
 from src.utils.config import Config
 from src.utils.rate_limiter import RateLimiter
@@ -30,6 +33,13 @@ class PDFRetriever:
             self.session.headers.update({
                 'User-Agent': 'Mozilla/5.0 (Academic Literature Tool)'
             })
+            # One pool per publisher host, kept for the whole batch: requests
+            # keeps pools for only 10 hosts by default, so a batch spanning
+            # more would close and re-handshake connections as it went.
+            # Downloads are rate limited per host, so 4 connections each do.
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=4)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
 
         self.has_institutional_access = ucsb_session is not None
         self.rate_limiter = RateLimiter(calls_per_second=1)
@@ -78,7 +88,7 @@ class PDFRetriever:
         error_msg = f"All download strategies failed for: {paper.title}"
         return False, error_msg
 
-    def download_papers(self, papers: List[Paper], max_concurrent: int = 3) -> Dict:
+    def download_papers(self, papers: List[Paper], max_concurrent: int = 8) -> Dict:
         """
         Download multiple papers
 
@@ -87,7 +97,8 @@ class PDFRetriever:
             max_concurrent: Maximum concurrent downloads
 
         Returns:
-            Dictionary with download results
+            Dictionary with download results; each successful or failed item
+            carries the paper's position in ``papers`` as ``index``
         """
         results = {
             'successful': [],
@@ -98,27 +109,31 @@ class PDFRetriever:
         print(f"\nDownloading {len(papers)} papers...")
 
         with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-            future_to_paper = {
-                executor.submit(self.download_paper, paper): paper
-                for paper in papers
+            future_to_index = {
+                executor.submit(self.download_paper, paper): index
+                for index, paper in enumerate(papers)
             }
 
-            for future in as_completed(future_to_paper):
-                paper = future_to_paper[future]
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                paper = papers[index]
                 try:
                     success, result = future.result()
                     if success:
                         results['successful'].append({
+                            'index': index,
                             'paper': paper,
                             'filepath': result
                         })
                     else:
                         results['failed'].append({
+                            'index': index,
                             'paper': paper,
                             'error': result
                         })
                 except Exception as e:
                     results['failed'].append({
+                        'index': index,
                         'paper': paper,
                         'error': str(e)
                     })
@@ -214,21 +229,20 @@ class PDFRetriever:
         Returns:
             True if successful
         """
-        proxy_base = "https://proxy.library.ucsb.edu/login?url="
         urls_to_try = []
 
         # Strategy 1: DOI through proxy (most reliable)
         if paper.doi:
             doi_url = f"https://doi.org/{paper.doi}"
-            urls_to_try.append(f"{proxy_base}{doi_url}")
+            urls_to_try.append(proxied_url(doi_url))
 
         # Strategy 2: Direct PDF URL through proxy
         if paper.pdf_url:
-            urls_to_try.append(f"{proxy_base}{paper.pdf_url}")
+            urls_to_try.append(proxied_url(paper.pdf_url))
 
         # Strategy 3: Paper URL through proxy
         if paper.url:
-            urls_to_try.append(f"{proxy_base}{paper.url}")
+            urls_to_try.append(proxied_url(paper.url))
 
         # Strategy 4: Publisher-specific URLs through proxy
         if paper.doi:
@@ -240,27 +254,27 @@ class PDFRetriever:
                 # Nature
                 if prefix == '10.1038':
                     nature_url = f"https://www.nature.com/articles/{paper.doi}.pdf"
-                    urls_to_try.append(f"{proxy_base}{nature_url}")
+                    urls_to_try.append(proxied_url(nature_url))
 
                 # Elsevier/ScienceDirect
                 elif prefix == '10.1016':
                     sd_url = f"https://www.sciencedirect.com/science/article/pii/{doi_parts[1]}/pdfft"
-                    urls_to_try.append(f"{proxy_base}{sd_url}")
+                    urls_to_try.append(proxied_url(sd_url))
 
                 # Wiley
                 elif prefix == '10.1002':
                     wiley_url = f"https://onlinelibrary.wiley.com/doi/pdfdirect/{paper.doi}"
-                    urls_to_try.append(f"{proxy_base}{wiley_url}")
+                    urls_to_try.append(proxied_url(wiley_url))
 
                 # Springer
                 elif prefix == '10.1007':
                     springer_url = f"https://link.springer.com/content/pdf/{paper.doi}.pdf"
-                    urls_to_try.append(f"{proxy_base}{springer_url}")
+                    urls_to_try.append(proxied_url(springer_url))
 
                 # ACS
                 elif prefix == '10.1021':
                     acs_url = f"https://pubs.acs.org/doi/pdf/{paper.doi}"
-                    urls_to_try.append(f"{proxy_base}{acs_url}")
+                    urls_to_try.append(proxied_url(acs_url))
 
         # Try each URL
         for url in urls_to_try:
@@ -284,7 +298,8 @@ class PDFRetriever:
             True if successful
         """
         try:
-            self.rate_limiter.wait_if_needed("download")
+            # Rate limit per host, so downloads from different publishers overlap
+            self.rate_limiter.wait_if_needed(f"download:{urlsplit(url).netloc}")
             response = self.session.get(
                 url,
                 stream=True,
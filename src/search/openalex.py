@@ -1,7 +1,9 @@
 """OpenAlex search provider with official API"""
 
 import requests
-from typing import List, Optional
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 from src.models import Paper, SearchQuery, Source, Author, PaperType
 from src.search.base import BaseSearchProvider
 
@@ -26,6 +28,12 @@ class OpenAlexProvider(BaseSearchProvider):
         if email:
             self.headers['User-Agent'] = f'mailto:{email}'
 
+        # One keep-alive session shared by every request and thread, so the
+        # citation and reference lookups reuse TCP/TLS connections
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=20))
+
     def search(self, query: SearchQuery) -> List[Paper]:
         """
         Search OpenAlex using official API
@@ -62,10 +70,9 @@ class OpenAlexProvider(BaseSearchProvider):
                 params['filter'] = ','.join(filters)
 
             # Make request
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/works",
                 params=params,
-                headers=self.headers,
                 timeout=15
             )
             response.raise_for_status()
@@ -275,9 +282,8 @@ class OpenAlexProvider(BaseSearchProvider):
                 # Assume it's a DOI
                 paper_id = f'https://doi.org/{paper_id}'
 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/works/{paper_id}",
-                headers=self.headers,
                 timeout=15
             )
             response.raise_for_status()
@@ -287,13 +293,15 @@ class OpenAlexProvider(BaseSearchProvider):
             print(f"✗ Failed to get paper {paper_id}: {e}")
             return None
 
-    def get_citations(self, paper_id: str, limit: int = 100) -> List[Paper]:
+    def get_citations(self, paper_id: str, limit: int = 100,
+                      raise_errors: bool = False) -> List[Paper]:
         """
         Get papers that cite this paper
 
         Args:
             paper_id: OpenAlex work ID
             limit: Number of citations to retrieve
+            raise_errors: Raise request failures instead of returning no papers
 
         Returns:
             List of citing papers
@@ -309,10 +317,9 @@ class OpenAlexProvider(BaseSearchProvider):
                 'per-page': min(limit, 100)
             }
 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/works",
                 params=params,
-                headers=self.headers,
                 timeout=15
             )
             response.raise_for_status()
@@ -325,16 +332,20 @@ class OpenAlexProvider(BaseSearchProvider):
 
         except Exception as e:
             print(f"✗ Failed to get citations: {e}")
+            if raise_errors:
+                raise
 
         return papers
 
-    def get_references(self, paper_id: str, limit: int = 100) -> List[Paper]:
+    def get_references(self, paper_id: str, limit: int = 100,
+                       raise_errors: bool = False) -> List[Paper]:
         """
         Get papers that this paper cites
 
         Args:
             paper_id: OpenAlex work ID
             limit: Number of references to retrieve
+            raise_errors: Raise request failures instead of returning no papers
 
         Returns:
             List of referenced papers
@@ -350,10 +361,9 @@ class OpenAlexProvider(BaseSearchProvider):
                 'per-page': min(limit, 100)
             }
 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/works",
                 params=params,
-                headers=self.headers,
                 timeout=15
             )
             response.raise_for_status()
@@ -366,9 +376,29 @@ class OpenAlexProvider(BaseSearchProvider):
 
         except Exception as e:
             print(f"✗ Failed to get references: {e}")
+            if raise_errors:
+                raise
 
         return papers
 
+    def get_citations_and_references(self, paper_id: str, limit: int = 100,
+                                     raise_errors: bool = False) -> Tuple[List[Paper], List[Paper]]:
+        """
+        Get citing and referenced papers with both requests in flight at once
+
+        Args:
+            paper_id: OpenAlex work ID
+            limit: Number of papers to retrieve in each direction
+            raise_errors: Raise request failures instead of returning no papers
+
+        Returns:
+            Tuple of (citing papers, referenced papers)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            citing = executor.submit(self.get_citations, paper_id, limit, raise_errors)
+            references = executor.submit(self.get_references, paper_id, limit, raise_errors)
+            return citing.result(), references.result()
+
     def get_related_papers(self, paper_id: str, limit: int = 10) -> List[Paper]:
         """
         Get related papers using concept similarity
@@ -399,10 +429,9 @@ class OpenAlexProvider(BaseSearchProvider):
                 'per-page': limit
             }
 
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/works",
                 params=params,
-                headers=self.headers,
                 timeout=15
             )
             response.raise_for_status()
@@ -179,32 +179,33 @@ class SearchOrchestrator:
         Returns:
             Paper if found
         """
-        # Try to determine source from identifier
-        if identifier.startswith("10."):  # Likely a DOI
-            provider = self.providers.get(Source.CROSSREF)
-            if provider:
-                paper = provider.get_paper_by_id(identifier)
-                if paper:
-                    return paper
-
-        # Try numeric ID as PMID
+        # Candidate sources in priority order: whatever the identifier looks
+        # like (DOI, PMID, arXiv ID), then the hint
+        candidates = []
+        if identifier.startswith("10."):
+            candidates.append(Source.CROSSREF)
         if identifier.isdigit():
-            provider = self.providers.get(Source.PUBMED)
-            if provider:
-                paper = provider.get_paper_by_id(identifier)
-                if paper:
-                    return paper
-
-        # Try as arXiv ID
+            candidates.append(Source.PUBMED)
         if "arxiv" in identifier.lower() or identifier.count(".") == 1:
-            provider = self.providers.get(Source.ARXIV)
-            if provider:
-                paper = provider.get_paper_by_id(identifier)
+            candidates.append(Source.ARXIV)
+        if source:
+            candidates.append(source)
+
+        providers = [self.providers[s] for s in dict.fromkeys(candidates) if s in self.providers]
+        if not providers:
+            return None
+        if len(providers) == 1:
+            return providers[0].get_paper_by_id(identifier)
+
+        # Ask every candidate at once; the answer is still the first hit in
+        # priority order, but a miss no longer delays the next lookup
+        executor = ThreadPoolExecutor(max_workers=len(providers))
+        try:
+            futures = [executor.submit(p.get_paper_by_id, identifier) for p in providers]
+            for future in futures:
+                paper = future.result()
                 if paper:
                     return paper
-
-        # Try specific source if provided
-        if source and source in self.providers:
-            return self.providers[source].get_paper_by_id(identifier)
-
-        return None
\ No newline at end of file
+            return None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
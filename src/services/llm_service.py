@@ -89,7 +89,7 @@ Summary:"""
             return ""
 
     async def summarize_papers_batch(self, papers: List[Dict],
-                                    max_concurrent: int = 5) -> List[str]:
+                                    max_concurrent: int = 8) -> List[str]:
         """
         Summarize multiple papers concurrently
 
@@ -6,7 +6,6 @@ import re
 from pathlib import Path
 from typing import Optional, Dict, Any
 import requests
-from pypdf import PdfReader
 
 class PDFExtractionService:
     """Service for extracting text from PDFs with multiple methods"""
@@ -14,7 +13,9 @@ class PDFExtractionService:
     def __init__(self):
         """Initialize PDF extraction service"""
         self._marker_available = False
+        self._pymupdf_available = False
         self._check_marker()
+        self._check_pymupdf()
 
     def _check_marker(self):
         """Check if marker-pdf is available"""
@@ -24,7 +25,15 @@ class PDFExtractionService:
             print("✓ marker-pdf available for enhanced extraction")
         except ImportError:
             self._marker_available = False
-            print("⚠ marker-pdf not available, using pypdf fallback")
+            print("⚠ marker-pdf not available, using fast text extraction")
+
+    def _check_pymupdf(self):
+        """Check if PyMuPDF is available"""
+        try:
+            import pymupdf
+            self._pymupdf_available = True
+        except ImportError:
+            self._pymupdf_available = False
 
     def extract_from_file(self, pdf_path: str, use_marker: bool = True) -> Dict[str, Any]:
         """
@@ -43,7 +52,7 @@ class PDFExtractionService:
         if use_marker and self._marker_available:
             return self._extract_with_marker(pdf_path)
         else:
-            return self._extract_with_pypdf(pdf_path)
+            return self._extract_fast(pdf_path)
 
     def extract_from_url(self, url: str, use_marker: bool = True,
                         session: Optional[requests.Session] = None) -> Dict[str, Any]:
@@ -86,12 +95,50 @@ class PDFExtractionService:
                 os.unlink(temp_path)
 
             return result
+        elif self._pymupdf_available:
+            return self._extract_with_pymupdf(stream=pdf_content)
         else:
             return self._extract_with_pypdf_bytes(pdf_content)
 
+    def _extract_fast(self, pdf_path: str) -> Dict[str, Any]:
+        """Extract with PyMuPDF, or pypdf when it isn't installed"""
+        if self._pymupdf_available:
+            return self._extract_with_pymupdf(pdf_path)
+        return self._extract_with_pypdf(pdf_path)
+
+    def _extract_with_pymupdf(self, pdf_path: Optional[str] = None,
+                              stream: Optional[bytes] = None) -> Dict[str, Any]:
+        """Extract using PyMuPDF, which parses content streams in C"""
+        try:
+            import pymupdf
+
+            if stream is not None:
+                doc = pymupdf.open(stream=stream, filetype="pdf")
+            else:
+                doc = pymupdf.open(pdf_path)
+
+            with doc:
+                text = "\n\n".join(page.get_text("text") for page in doc)
+                pages = doc.page_count
+                metadata = doc.metadata or {}
+
+            text = self._clean_text(text)
+
+            return {
+                "text": text,
+                "pages": pages,
+                "method": "pymupdf",
+                "metadata": metadata
+            }
+
+        except Exception as e:
+            raise Exception(f"pymupdf extraction failed: {e}")
+
     def _extract_with_pypdf(self, pdf_path: str) -> Dict[str, Any]:
         """Extract using pypdf"""
         try:
+            from pypdf import PdfReader
+
             reader = PdfReader(pdf_path)
             text = ""
             for page in reader.pages:
@@ -115,6 +162,8 @@ class PDFExtractionService:
     def _extract_with_pypdf_bytes(self, pdf_bytes: bytes) -> Dict[str, Any]:
         """Extract from bytes using pypdf"""
         try:
+            from pypdf import PdfReader
+
             pdf_file = io.BytesIO(pdf_bytes)
             reader = PdfReader(pdf_file)
 
@@ -163,8 +212,8 @@ class PDFExtractionService:
             }
 
         except Exception as e:
-            print(f"⚠ marker extraction failed, falling back to pypdf: {e}")
-            return self._extract_with_pypdf(pdf_path)
+            print(f"⚠ marker extraction failed, falling back to fast extraction: {e}")
+            return self._extract_fast(pdf_path)
 
     def _clean_text(self, text: str) -> str:
         """Clean extracted text"""
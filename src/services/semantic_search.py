@@ -1,21 +1,29 @@
 """Semantic search service with embeddings and reranking"""
 
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Callable, Hashable, List, Tuple, Optional, Sequence
 from fastembed import TextEmbedding
-import json
 from pathlib import Path
 
+from src.utils.embedding_cache import (
+    EmbeddingCache, QueryResultCache, VectorIndex, content_hash, embed_by_length, normalize
+)
+
 class SemanticSearchService:
     """Service for semantic search and reranking using embeddings"""
 
+    # Texts per encoder call; batches are formed from length-sorted texts
+    ENCODE_BATCH_SIZE = 32
+
     def __init__(self, model_name: str = "BAAI/bge-small-en-v1.5"):
         """Initialize with embedding model"""
         self._model = None
         self._model_name = model_name
-        self._embedding_cache = {}
-        self._cache_file = Path.home() / ".config" / "litsearch" / "embedding_cache.json"
-        self._load_cache()
+        self._embedding_cache = EmbeddingCache(
+            Path.home() / ".config" / "litsearch" / "embeddings.db"
+        )
+        self._query_cache = QueryResultCache(maxsize=1000, threshold=0.87)
+        self._paper_index = VectorIndex()
 
     @property
     def model(self):
@@ -26,73 +34,50 @@ class SemanticSearchService:
             print(f"✓ Loaded {self._model_name}")
         return self._model
 
-    def _load_cache(self):
-        """Load embedding cache from disk"""
-        try:
-            if self._cache_file.exists():
-                with open(self._cache_file, 'r') as f:
-                    self._embedding_cache = json.load(f)
-        except Exception as e:
-            print(f"⚠ Failed to load embedding cache: {e}")
-            self._embedding_cache = {}
-
-    def _save_cache(self):
-        """Save embedding cache to disk"""
-        try:
-            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._cache_file, 'w') as f:
-                json.dump(self._embedding_cache, f)
-        except Exception as e:
-            print(f"⚠ Failed to save embedding cache: {e}")
-
     def get_embedding(self, text: str) -> np.ndarray:
         """Get embedding for text, using cache if available"""
-        # Create cache key from first 100 chars
-        cache_key = text[:100]
-
-        if cache_key in self._embedding_cache:
-            return np.array(self._embedding_cache[cache_key])
-
-        # Generate embedding
-        embeddings = list(self.model.embed([text]))
-        embedding = embeddings[0]
+        return self.get_embeddings_batch([text])[0]
 
-        # Cache it
-        self._embedding_cache[cache_key] = embedding.tolist()
-
-        # Periodically save cache
-        if len(self._embedding_cache) % 100 == 0:
-            self._save_cache()
+    def get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Get embeddings for multiple texts, encoding only cache misses"""
+        hashes = [content_hash(text) for text in texts]
+        cached = self._embedding_cache.get_many(hashes)
+
+        # Embed remaining texts in one batch
+        missing = {}
+        for doc_hash, text in zip(hashes, texts):
+            if doc_hash not in cached and doc_hash not in missing:
+                missing[doc_hash] = text
+
+        if missing:
+            new_embeddings = embed_by_length(
+                list(missing.values()),
+                lambda batch: self.model.embed(batch, batch_size=len(batch)),
+                batch_size=self.ENCODE_BATCH_SIZE
+            )
+            # Stored L2-normalized so scoring is a plain dot product
+            computed = {
+                doc_hash: normalize(embedding)
+                for doc_hash, embedding in zip(missing, new_embeddings)
+            }
+            self._embedding_cache.put_many(computed)
+            cached.update(computed)
+
+        return [cached[doc_hash] for doc_hash in hashes]
+
+    def score_texts(self, query_embedding: np.ndarray, texts: List[str]) -> np.ndarray:
+        """
+        Cosine similarity of each text to a query embedding
 
-        return embedding
+        Args:
+            query_embedding: Query vector
+            texts: Texts to score
 
-    def get_embeddings_batch(self, texts: List[str]) -> List[np.ndarray]:
-        """Get embeddings for multiple texts efficiently"""
-        # Check cache first
-        results = []
-        texts_to_embed = []
-        indices_to_embed = []
-
-        for i, text in enumerate(texts):
-            cache_key = text[:100]
-            if cache_key in self._embedding_cache:
-                results.append(np.array(self._embedding_cache[cache_key]))
-            else:
-                results.append(None)
-                texts_to_embed.append(text)
-                indices_to_embed.append(i)
-
-        # Embed remaining texts
-        if texts_to_embed:
-            new_embeddings = list(self.model.embed(texts_to_embed))
-
-            for idx, embedding in zip(indices_to_embed, new_embeddings):
-                results[idx] = embedding
-                cache_key = texts[idx][:100]
-                self._embedding_cache[cache_key] = embedding.tolist()
-
-        self._save_cache()
-        return results
+        Returns:
+            float32 array of scores, one per text
+        """
+        matrix = np.vstack(self.get_embeddings_batch(texts))
+        return matrix @ normalize(query_embedding)
 
     def cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors"""
@@ -123,33 +108,47 @@ class SemanticSearchService:
         if not papers:
             return []
 
-        # Get query embedding
-        query_embedding = self.get_embedding(query)
+        # Combine title and abstract for better matching
+        ranked = self.rerank_texts(
+            query,
+            titles=[paper.get('title') for paper in papers],
+            abstracts=[paper.get(text_field) or paper.get('abstract') for paper in papers],
+            top_k=top_k
+        )
+        return [(papers[i], score) for i, score in ranked]
+
+    def rerank_texts(self, query: str, titles: Sequence[Optional[str]],
+                     abstracts: Sequence[Optional[str]],
+                     top_k: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Rank candidates given as parallel title and abstract columns
 
-        # Get paper embeddings
-        paper_texts = []
-        for paper in papers:
-            # Combine title and abstract for better matching
-            title = paper.get('title', '')
-            abstract = paper.get(text_field, '') or paper.get('abstract', '')
-            text = f"{title} {abstract}".strip()
-            paper_texts.append(text if text else "No content available")
+        Args:
+            query: Search query
+            titles: Candidate titles
+            abstracts: Candidate abstracts, aligned with titles
+            top_k: Return only top k results (None for all)
 
-        paper_embeddings = self.get_embeddings_batch(paper_texts)
+        Returns:
+            List of (candidate index, similarity_score) tuples sorted by score
+        """
+        if not titles:
+            return []
 
-        # Calculate similarities
-        scored_papers = []
-        for paper, embedding in zip(papers, paper_embeddings):
-            similarity = self.cosine_similarity(query_embedding, embedding)
-            scored_papers.append((paper, similarity))
+        query_embedding = self.get_embedding(query)
+        paper_texts = [paper_text(title, abstract) for title, abstract in zip(titles, abstracts)]
 
-        # Sort by similarity
-        scored_papers.sort(key=lambda x: x[1], reverse=True)
+        # A near-identical query over the same candidates reuses its ranking
+        scope = content_hash("\n".join(paper_texts))
+        cached = self._query_cache.get(query_embedding, scope, top_k)
+        if cached is not None:
+            return cached
 
-        if top_k:
-            scored_papers = scored_papers[:top_k]
+        scores = self.score_texts(query_embedding, paper_texts)
+        scored = [(int(i), float(scores[i])) for i in _top_indices(scores, top_k)]
 
-        return scored_papers
+        self._query_cache.set(query_embedding, scope, top_k, scored)
+        return scored
 
     def hybrid_score(self, query: str, papers: List[dict],
                      keyword_weight: float = 0.3,
@@ -208,34 +207,72 @@ class SemanticSearchService:
             List of (similar_paper, similarity_score) tuples
         """
         # Create text from reference paper
-        title = paper.get('title', '')
-        abstract = paper.get('abstract', '')
-        ref_text = f"{title} {abstract}"
+        ref_text = paper_text(paper.get('title'), paper.get('abstract'))
 
         # Get reference embedding
         ref_embedding = self.get_embedding(ref_text)
 
-        # Get embeddings for all papers
-        paper_texts = []
-        for p in all_papers:
-            text = f"{p.get('title', '')} {p.get('abstract', '')}"
-            paper_texts.append(text)
+        # Candidate papers, excluding self
+        self_keys = {
+            (key, paper[key]) for key in ('id', 'paper_id') if paper.get(key) is not None
+        }
+        candidates = [
+            p for p in all_papers
+            if not any(p.get(key) == value for key, value in self_keys)
+        ]
+        if not candidates:
+            return []
+
+        paper_texts = [paper_text(p.get('title'), p.get('abstract')) for p in candidates]
+        scores = self.score_texts(ref_embedding, paper_texts)
+
+        return [(candidates[i], float(scores[i])) for i in _top_indices(scores, top_k)]
+
+    def find_similar_by_id(self, paper_id: int, library_version: Hashable,
+                           load_papers: Callable[[], Sequence[Tuple[int, Optional[str], Optional[str]]]],
+                           top_k: int = 5) -> List[Tuple[int, float]]:
+        """
+        Find the library papers most similar to a given paper
+
+        Searches the whole library through the persistent paper index. The
+        papers are only loaded when library_version differs from the last
+        sync, and then only new or changed ones are embedded.
+
+        Args:
+            paper_id: Reference paper ID
+            library_version: Changes whenever papers are added, removed or edited
+            load_papers: Returns (id, title, abstract) of every paper in the library
+            top_k: Number of similar papers to return
+
+        Returns:
+            List of (paper_id, similarity_score) tuples, best first
+        """
+        if not self._paper_index.is_current(library_version):
+            paper_texts = {
+                library_id: paper_text(title, abstract)
+                for library_id, title, abstract in load_papers()
+            }
+            self._paper_index.sync(paper_texts, self.get_embeddings_batch, version=library_version)
+
+        ref_embedding = self._paper_index.vector(paper_id)
+        if ref_embedding is None:
+            return []
+
+        return self._paper_index.search(ref_embedding, top_k, exclude=paper_id)
 
-        paper_embeddings = self.get_embeddings_batch(paper_texts)
 
-        # Calculate similarities (excluding self)
-        scored_papers = []
-        for p, embedding in zip(all_papers, paper_embeddings):
-            # Skip self
-            if p.get('id') == paper.get('id') or p.get('paper_id') == paper.get('paper_id'):
-                continue
+def paper_text(title: Optional[str], abstract: Optional[str]) -> str:
+    """Text embedded for a paper: its title and abstract"""
+    text = f"{title or ''} {abstract or ''}".strip()
+    return text if text else "No content available"
 
-            similarity = self.cosine_similarity(ref_embedding, embedding)
-            scored_papers.append((p, similarity))
 
-        # Sort and return top k
-        scored_papers.sort(key=lambda x: x[1], reverse=True)
-        return scored_papers[:top_k]
+def _top_indices(scores: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+    """Indices of the highest scores, best first, without sorting the rest"""
+    if top_k and top_k < len(scores):
+        candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        return candidates[np.argsort(-scores[candidates])]
+    return np.argsort(-scores)
 
 
 # Global instance
@@ -29,6 +29,21 @@ class Config:
     PAPERS_DIR: Path = Path(os.getenv("PAPERS_DIR", BASE_DIR / "papers"))
     OUTPUT_DIR: Path = Path(os.getenv("OUTPUT_DIR", BASE_DIR / "output"))
 
+    # Database connection pool
+    DATABASE_URL: Optional[str] = os.getenv("DATABASE_URL")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "3600"))
+
+    # Worker threads available to sync API handlers (anyio default is 40)
+    API_THREADPOOL_SIZE: int = int(os.getenv("API_THREADPOOL_SIZE", "100"))
+
+    # API server processes and connection limits
+    API_WORKERS: int = int(os.getenv("API_WORKERS", str(os.cpu_count() or 1)))
+    API_LIMIT_CONCURRENCY: int = int(os.getenv("API_LIMIT_CONCURRENCY", "1000"))
+    API_KEEP_ALIVE: int = int(os.getenv("API_KEEP_ALIVE", "30"))
+
     # Cache settings
     CACHE_EXPIRY_DAYS: int = int(os.getenv("CACHE_EXPIRY_DAYS", "30"))
 
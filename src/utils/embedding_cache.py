@@ -0,0 +1,348 @@
+"""Embedding caches for semantic search"""
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of the text an embedding was computed from"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def normalize(vector: np.ndarray) -> np.ndarray:
+    """L2-normalize a vector as float32"""
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Quantize a vector to int8 with a single scale factor
+
+    Args:
+        vector: Vector to quantize
+
+    Returns:
+        (int8 vector, scale) such that vector ≈ int8 vector * scale
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    peak = float(np.abs(vector).max()) if vector.size else 0.0
+    scale = peak / 127 if peak else 1.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+
+def dequantize(quantized: np.ndarray, scale: float) -> np.ndarray:
+    """Expand an int8 vector back to float32"""
+    return quantized.astype(np.float32) * np.float32(scale)
+
+
+def embed_by_length(texts: List[str],
+                    embed: Callable[[List[str]], Iterable[np.ndarray]],
+                    batch_size: int = 32) -> List[np.ndarray]:
+    """
+    Embed texts in batches of similar length
+
+    The encoder pads every batch to its longest text, so batching texts
+    sorted by length spends far less compute on padding than batching them
+    in arrival order.
+
+    Args:
+        texts: Texts to embed
+        embed: Encodes one batch of texts
+        batch_size: Texts per encoder call
+
+    Returns:
+        Embeddings in the same order as texts
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+
+    for start in range(0, len(order), batch_size):
+        batch = order[start:start + batch_size]
+        for i, vector in zip(batch, embed([texts[i] for i in batch])):
+            vectors[i] = vector
+
+    return vectors
+
+
+class EmbeddingCache:
+    """
+    Persistent store of document embeddings keyed by content hash
+
+    Vectors are kept as int8 blobs with a per-vector scale in a small SQLite
+    file, so they survive restarts and are shared by every worker on the
+    host. Reads expand them back to float32 for BLAS scoring; numpy has no
+    int8 matrix-vector kernel, so scoring on int8 directly would be slower.
+    """
+
+    # Stay under SQLite's bound-parameter limit on older builds
+    _LOOKUP_CHUNK = 500
+
+    def __init__(self, path: Path):
+        """
+        Initialize cache
+
+        Args:
+            path: SQLite file holding the embeddings
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings_q8 ("
+            "doc_hash TEXT PRIMARY KEY, scale REAL NOT NULL, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get_many(self, hashes: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up stored embeddings
+
+        Args:
+            hashes: Content hashes to fetch
+
+        Returns:
+            Mapping of hash to vector for the hashes that are cached
+        """
+        hashes = list(dict.fromkeys(hashes))
+        found = {}
+
+        with self._lock:
+            for start in range(0, len(hashes), self._LOOKUP_CHUNK):
+                chunk = hashes[start:start + self._LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT doc_hash, scale, vector FROM embeddings_q8 "
+                    f"WHERE doc_hash IN ({placeholders})",
+                    chunk
+                )
+                for doc_hash, scale, blob in rows:
+                    found[doc_hash] = dequantize(np.frombuffer(blob, dtype=np.int8), scale)
+
+        return found
+
+    def put_many(self, embeddings: Dict[str, np.ndarray]):
+        """
+        Store embeddings, replacing any existing vector for the same hash
+
+        Args:
+            embeddings: Mapping of content hash to vector
+        """
+        if not embeddings:
+            return
+
+        rows = []
+        for doc_hash, vector in embeddings.items():
+            quantized, scale = quantize(vector)
+            rows.append((doc_hash, scale, quantized.tobytes()))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings_q8 (doc_hash, scale, vector) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings_q8").fetchone()[0]
+
+
+class QueryResultCache:
+    """
+    LRU of reranked results, looked up by query-vector similarity
+
+    A query whose embedding is within the similarity threshold of a cached
+    query (same candidate set and top_k) reuses that query's ranking, so
+    repeated and paraphrased searches skip the rerank entirely.
+    """
+
+    def __init__(self, maxsize: int = 1000, threshold: float = 0.87):
+        """
+        Initialize cache
+
+        Args:
+            maxsize: Maximum number of cached queries
+            threshold: Minimum cosine similarity for a hit
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    def get(self, query_vec: np.ndarray, scope: Hashable,
+            top_k: Optional[int]) -> Optional[List[Tuple[int, float]]]:
+        """
+        Find the ranking of the most similar cached query
+
+        Args:
+            query_vec: Query embedding
+            scope: Identifies the candidate set the ranking was computed over
+            top_k: Number of results requested
+
+        Returns:
+            Cached (candidate index, score) pairs, or None on a miss
+        """
+        q = normalize(query_vec)
+
+        with self._lock:
+            keys = [
+                key for key, (_, entry_scope, entry_top_k, _) in self._entries.items()
+                if entry_scope == scope and entry_top_k == top_k
+            ]
+            if not keys:
+                return None
+
+            matrix = np.stack([self._entries[key][0] for key in keys])
+            sims = matrix @ q
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+
+            key = keys[best]
+            self._entries.move_to_end(key)
+            return self._entries[key][3]
+
+    def set(self, query_vec: np.ndarray, scope: Hashable, top_k: Optional[int],
+            results: List[Tuple[int, float]]):
+        """
+        Store a ranking, evicting the least recently used query when full
+
+        Args:
+            query_vec: Query embedding
+            scope: Identifies the candidate set the ranking was computed over
+            top_k: Number of results requested
+            results: (candidate index, score) pairs in rank order
+        """
+        with self._lock:
+            self._entries[self._next_key] = (normalize(query_vec), scope, top_k, results)
+            self._next_key += 1
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class VectorIndex:
+    """
+    In-memory nearest-neighbour index over normalized document embeddings
+
+    Rows are keyed by ID and content hash; sync() re-embeds only documents
+    that are new or whose text changed, and drops deleted ones. Search is an
+    exact scan as a single matrix-vector product over the whole corpus.
+
+    Each sync can record a version (e.g. a library fingerprint) so callers
+    can skip loading the documents at all while it is still current.
+    """
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self._ids = np.empty(0, dtype=np.int64)
+        self._hashes: Dict[int, str] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._version: Optional[Hashable] = None
+        self._lock = threading.Lock()
+        # Serializes syncs; held while embedding so searches aren't blocked
+        self._sync_lock = threading.Lock()
+
+    def is_current(self, version: Hashable) -> bool:
+        """Whether the last sync was for this version of the documents"""
+        with self._lock:
+            return self._version is not None and self._version == version
+
+    def sync(self, texts: Dict[int, str],
+             embed: Callable[[List[str]], List[np.ndarray]],
+             version: Optional[Hashable] = None):
+        """
+        Bring the index in line with the current documents
+
+        Args:
+            texts: Mapping of document ID to the text to embed
+            embed: Returns normalized embeddings for a list of texts
+            version: Identifies this set of documents, checked by is_current()
+        """
+        with self._sync_lock:
+            if version is not None and self.is_current(version):
+                return
+
+            hashes = {doc_id: content_hash(text) for doc_id, text in texts.items()}
+            current = self._hashes
+            if hashes == current:
+                with self._lock:
+                    self._version = version
+                return
+
+            added = [doc_id for doc_id, doc_hash in hashes.items() if current.get(doc_id) != doc_hash]
+            kept = [doc_id for doc_id in hashes if current.get(doc_id) == hashes[doc_id]]
+            new_rows = np.vstack(embed([texts[doc_id] for doc_id in added])) if added else None
+
+            with self._lock:
+                rows = []
+                if kept:
+                    position = {int(doc_id): i for i, doc_id in enumerate(self._ids)}
+                    rows.append(self._matrix[[position[doc_id] for doc_id in kept]])
+                if new_rows is not None:
+                    rows.append(new_rows)
+
+                self._ids = np.array(kept + added, dtype=np.int64)
+                self._matrix = np.vstack(rows).astype(np.float32, copy=False) if rows else None
+                self._hashes = hashes
+                self._version = version
+
+    def vector(self, doc_id: int) -> Optional[np.ndarray]:
+        """Stored embedding for a document, or None if it is not indexed"""
+        with self._lock:
+            matches = np.flatnonzero(self._ids == doc_id)
+            if not len(matches):
+                return None
+            return self._matrix[matches[0]]
+
+    def search(self, query_vec: np.ndarray, top_k: int,
+               exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Find the documents most similar to a vector
+
+        Args:
+            query_vec: Query embedding
+            top_k: Number of results
+            exclude: Document ID to leave out (e.g. the query document)
+
+        Returns:
+            (document ID, cosine similarity) pairs, best first
+        """
+        with self._lock:
+            if self._matrix is None:
+                return []
+
+            scores = self._matrix @ normalize(query_vec)
+            if exclude is not None:
+                scores[self._ids == exclude] = -np.inf
+
+            k = min(top_k, len(scores) - (1 if exclude in self._hashes else 0))
+            if k <= 0:
+                return []
+
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best])]
+            return [(int(self._ids[i]), float(scores[i])) for i in best]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ids)
@@ -2,6 +2,7 @@
 
 import time
 import asyncio
+import threading
 from typing import Optional
 from collections import defaultdict
 from datetime import datetime, timedelta
@@ -20,25 +21,28 @@ class RateLimiter:
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second if calls_per_second > 0 else 0
         self.last_call = defaultdict(float)
+        self._lock = threading.Lock()
 
     def wait_if_needed(self, key: str = "default"):
         """
         Wait if necessary to respect rate limit (synchronous)
 
+        Thread-safe: each caller reserves the next free slot for the key
+        under a lock, then sleeps until it outside the lock.
+
         Args:
             key: Identifier for the rate limit bucket
         """
         if self.min_interval <= 0:
             return
 
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call[key]
-
-        if time_since_last_call < self.min_interval:
-            sleep_time = self.min_interval - time_since_last_call
-            time.sleep(sleep_time)
+        with self._lock:
+            current_time = time.time()
+            slot = max(current_time, self.last_call[key] + self.min_interval)
+            self.last_call[key] = slot
 
-        self.last_call[key] = time.time()
+        if slot > current_time:
+            time.sleep(slot - current_time)
 
     async def async_wait_if_needed(self, key: str = "default"):
         """
@@ -0,0 +1,110 @@
+"""Persistent cache of search results across CLI invocations"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class SearchResultCache:
+    """
+    Serialized search results keyed by query, kept in a small SQLite file
+
+    Repeating a search within the TTL returns the stored results instead of
+    querying every source again, which also saves the upstream APIs' rate
+    limits. Entries past the TTL are dropped when read, and the least
+    recently used are evicted beyond maxsize.
+    """
+
+    def __init__(self, path: Path, ttl: float = 24 * 3600, maxsize: int = 500):
+        """
+        Initialize cache
+
+        Args:
+            path: SQLite file holding the results
+            ttl: Seconds an entry stays valid after it is stored
+            maxsize: Maximum number of stored results
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_cache ("
+            "key TEXT PRIMARY KEY, created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, payload BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Cache key for the parts that identify a search"""
+        return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get stored results
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Payload, or None on a miss or expired entry
+        """
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, payload FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            created_at, payload = row
+            if created_at + self.ttl < now:
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                payload = None
+            else:
+                self._conn.execute(
+                    "UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            self._conn.commit()
+
+        return payload
+
+    def set(self, key: str, payload: bytes):
+        """
+        Store results, evicting the least recently used entries when full
+
+        Args:
+            key: Cache key
+            payload: Serialized results
+        """
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, created_at, accessed_at, payload) "
+                "VALUES (?, ?, ?, ?)",
+                (key, now, now, payload)
+            )
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE key NOT IN "
+                "(SELECT key FROM search_cache ORDER BY accessed_at DESC LIMIT ?)",
+                (self.maxsize,)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
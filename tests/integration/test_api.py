@@ -4,6 +4,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from unittest.mock import Mock, patch
 import json
 
@@ -15,7 +16,12 @@ from src.models import Paper, Author, Source, SearchResult
 
 # Test database setup
 TEST_DATABASE_URL = "sqlite:///:memory:"
-test_engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
+# Handlers run in the threadpool, so share one connection across threads
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
 
@@ -264,6 +270,83 @@ class TestVisualizationEndpoints:
         assert response.status_code == 200  # Should return empty data
 
 
+class TestResponseCache:
+    """Test cached GET responses"""
+
+    def test_clients_revalidate_with_etag(self):
+        """Test responses must be revalidated and unchanged ones get a 304"""
+        response = client.get("/api/visualize/timeline")
+        assert response.headers["cache-control"] == "no-cache"
+
+        response = client.get(
+            "/api/visualize/timeline", headers={"If-None-Match": response.headers["etag"]}
+        )
+        assert response.status_code == 304
+
+    @patch('backend.main.visualization_service.schedule_refresh')
+    def test_write_during_compute_is_not_cached(self, mock_refresh):
+        """Test a payload computed across an invalidation isn't stored"""
+        from starlette.requests import Request
+        from backend.main import cached_response, invalidate_cached_responses, response_cache
+
+        request = Request({"type": "http", "method": "GET", "path": "/api/test",
+                           "query_string": b"", "headers": []})
+
+        def compute():
+            invalidate_cached_responses(Mock())
+            return {"stale": True}
+
+        response = cached_response(request, compute)
+
+        assert response.status_code == 200
+        assert response_cache.get(("/api/test", ())) is None
+
+
+class TestD3NetworkEndpoint:
+    """Test the D3 citation network endpoint"""
+
+    @staticmethod
+    def add_paper(doi):
+        """Store a paper directly and return its ID"""
+        from src.database import models as db_models
+
+        Base.metadata.create_all(bind=test_engine)
+        db = TestSessionLocal()
+        try:
+            paper = db_models.Paper(title="Seed", doi=doi)
+            db.add(paper)
+            db.commit()
+            return paper.id
+        finally:
+            db.close()
+
+    @patch('backend.main.invalidate_cached_responses')
+    @patch('backend.main.openalex_provider.get_citations_and_references', return_value=([], []))
+    def test_unchanged_network_is_cached(self, mock_fetch, mock_invalidate):
+        """Test a network that stored nothing new is cached without invalidating"""
+        paper_id = self.add_paper("10.1/d3-cached")
+
+        for _ in range(2):
+            response = client.get(f"/api/network/d3/{paper_id}")
+            assert response.status_code == 200
+
+        mock_fetch.assert_called_once()
+        mock_invalidate.assert_not_called()
+
+    @patch('backend.main.openalex_provider.get_citations_and_references',
+           side_effect=Exception("OpenAlex unavailable"))
+    def test_failed_fetch_is_not_cached(self, mock_fetch):
+        """Test a seed-only network from a failed fetch is refetched next time"""
+        paper_id = self.add_paper("10.1/d3-failed")
+
+        for _ in range(2):
+            response = client.get(f"/api/network/d3/{paper_id}")
+            assert response.status_code == 200
+            assert response.json()["stats"]["total_nodes"] == 1
+
+        assert mock_fetch.call_count == 2
+
+
 class TestAuthEndpoints:
     """Test authentication endpoints"""
 
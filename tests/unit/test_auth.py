@@ -3,9 +3,16 @@
 import pytest
 import json
 import pickle
+import requests
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
-from src.auth.ucsb_auth import UCSBAuth
+from src.auth.cookie_store import merge_cookies
+from src.auth.session_manager import SessionManager
+from src.auth.ucsb_auth import UCSBAuth, _LOGIN_PAGE_WORDS, _find_phrases
+from src.models import Paper
+from src.retrieval.pdf_retriever import PDFRetriever
 
 
 class TestUCSBAuthInit:
@@ -21,6 +28,17 @@ class TestUCSBAuthInit:
         assert auth.config_dir.exists()
         assert auth.config_dir.is_dir()
 
+    def test_init_is_lazy(self, tmp_path, monkeypatch):
+        """Test the config directory is only created when first used"""
+        monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+
+        auth = UCSBAuth()
+
+        assert not (tmp_path / ".config" / "litsearch").exists()
+        assert 'session' not in vars(auth)
+        auth._save_session()
+        assert auth.session_file.exists()
+
     def test_init_sets_session_headers(self):
         """Test that user agent is set"""
         auth = UCSBAuth()
@@ -106,6 +124,7 @@ class TestCookieImport:
 
         assert result is True
         assert auth.is_authenticated is True
+        assert auth.session.cookies.get('session', domain='.ucsb.edu') == 'abc123'
 
     def test_import_json_file_not_found(self):
         """Test JSON import with non-existent file"""
@@ -147,6 +166,62 @@ class TestSessionManagement:
         assert result is True
         assert 'test' in auth2.session.cookies
 
+    @patch.object(UCSBAuth, 'test_session', return_value=True)
+    def test_reload_if_changed(self, mock_test, tmp_path, monkeypatch):
+        """Test session file is only re-read after it changes"""
+        monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+
+        auth = UCSBAuth()
+        assert auth.reload_if_changed() is False
+
+        # Another process imports cookies
+        other = UCSBAuth()
+        other.session.cookies.set('test', 'value')
+        other._save_session()
+
+        assert auth.reload_if_changed() is True
+        assert auth.is_authenticated
+        assert 'test' in auth.session.cookies
+        assert auth.reload_if_changed() is False
+
+        # ...and later clears them
+        auth.session_file.unlink()
+        assert auth.reload_if_changed() is True
+        assert not auth.is_authenticated
+        assert len(auth.session.cookies) == 0
+
+    @patch.object(UCSBAuth, 'test_session', return_value=False)
+    def test_load_unexpired_session_skips_probe(self, mock_test, tmp_path, monkeypatch):
+        """Test cookies with a distant expiry are trusted without a network check"""
+        monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+
+        auth = UCSBAuth()
+        auth.session.cookies.set('ezproxy', 'abc', expires=int(time.time()) + 3600)
+        auth._save_session()
+
+        auth2 = UCSBAuth()
+        assert auth2.load_session() is True
+        mock_test.assert_not_called()
+
+        assert UCSBAuth().load_session(force=True) is False
+        mock_test.assert_called_once()
+
+    @patch.object(UCSBAuth, 'test_session', return_value=True)
+    def test_legacy_pickle_session_is_migrated(self, mock_test, tmp_path, monkeypatch):
+        """Test a pickled session from an earlier version is converted to JSON"""
+        monkeypatch.setattr(Path, 'home', lambda: tmp_path)
+
+        auth = UCSBAuth()
+        jar = requests.cookies.RequestsCookieJar()
+        jar.set('ezproxy', 'abc', domain='.ucsb.edu')
+        auth.config_dir.mkdir(exist_ok=True)
+        auth.legacy_session_file.write_bytes(pickle.dumps(jar))
+
+        assert auth.load_session() is True
+        assert auth.session.cookies.get('ezproxy') == 'abc'
+        assert not auth.legacy_session_file.exists()
+        assert json.loads(auth.session_file.read_text())[0]['domain'] == '.ucsb.edu'
+
     def test_load_session_no_file(self):
         """Test loading when no session file exists"""
         auth = UCSBAuth()
@@ -189,14 +264,29 @@ class TestSessionManagement:
         assert auth.is_authenticated is False
 
 
+def page_response(text):
+    """Response whose body streams back as a single chunk"""
+    response = MagicMock(text=text, encoding='utf-8')
+    response.iter_content.return_value = [text]
+    return response
+
+
+@pytest.fixture
+def inconclusive_head():
+    """HEAD probe that answers 200, so test_session goes on to read the page"""
+    with patch('requests.Session.head') as mock_head:
+        mock_head.return_value = MagicMock(status_code=200, headers={})
+        yield mock_head
+
+
+@pytest.mark.usefixtures("inconclusive_head")
 class TestSessionTesting:
     """Test session validation"""
 
     @patch('requests.Session.get')
     def test_session_test_authenticated(self, mock_get):
         """Test session test with authenticated session"""
-        mock_response = MagicMock()
-        mock_response.text = "<html>You are authenticated. <a href='/logout'>Logout</a></html>"
+        mock_response = page_response("<html>You are authenticated. <a href='/logout'>Logout</a></html>")
         mock_get.return_value = mock_response
 
         auth = UCSBAuth()
@@ -207,8 +297,7 @@ class TestSessionTesting:
     @patch('requests.Session.get')
     def test_session_test_not_authenticated(self, mock_get):
         """Test session test with login page"""
-        mock_response = MagicMock()
-        mock_response.text = "<html><form><input name='netid'/><input name='password'/></form></html>"
+        mock_response = page_response("<html><form><input name='netid'/><input name='password'/></form></html>")
         mock_get.return_value = mock_response
 
         auth = UCSBAuth()
@@ -219,8 +308,7 @@ class TestSessionTesting:
     @patch('requests.Session.get')
     def test_session_test_by_cookies(self, mock_get):
         """Test session validation by cookies"""
-        mock_response = MagicMock()
-        mock_response.text = "<html>Some content</html>"
+        mock_response = page_response("<html>Some content</html>")
         mock_get.return_value = mock_response
 
         auth = UCSBAuth()
@@ -251,6 +339,38 @@ class TestSessionTesting:
 
         assert result is False
 
+    @patch('requests.Session.get')
+    def test_session_test_redirect_to_login(self, mock_get, inconclusive_head):
+        """Test a HEAD redirected to the login form fails without fetching the page"""
+        inconclusive_head.return_value = MagicMock(
+            status_code=302, headers={'Location': 'https://login.ucsb.edu/login?service=proxy'}
+        )
+
+        auth = UCSBAuth()
+        result = auth.test_session()
+
+        assert result is False
+        mock_get.assert_not_called()
+
+
+class TestFindPhrases:
+    """Test streamed phrase scanning of response bodies"""
+
+    def test_phrase_split_across_chunks(self):
+        """Test phrases spanning a chunk boundary are found and reading stops early"""
+        chunks = ["<input name='Net", "ID'/><input name='pass", "word'/>", "<a>logout</a>"]
+        read = []
+        response = MagicMock(encoding='utf-8')
+        response.iter_content.return_value = (read.append(chunk) or chunk for chunk in chunks)
+
+        found = _find_phrases(
+            response, _LOGIN_PAGE_WORDS, enough=lambda found: {'netid', 'password'} <= found
+        )
+
+        assert found == {'netid', 'password'}
+        assert len(read) == 3
+        response.close.assert_called_once()
+
 
 class TestProxyURL:
     """Test proxy URL generation"""
@@ -282,6 +402,28 @@ class TestProxyURL:
 
         assert proxied == "https://proxy.library.ucsb.edu/login?url="
 
+    def test_get_proxied_url_accepts_http_url(self):
+        """Test pydantic HttpUrl fields (Paper.url, Paper.pdf_url) are converted"""
+        paper = Paper(title="x", url="https://www.nature.com/articles/abc")
+
+        proxied = UCSBAuth.get_proxied_url(paper.url)
+
+        assert proxied == "https://proxy.library.ucsb.edu/login?url=https://www.nature.com/articles/abc"
+
+    def test_retriever_proxies_paper_urls(self, tmp_path):
+        """Test the UCSB proxy download tries the DOI and the paper's own URLs"""
+        retriever = PDFRetriever(papers_dir=tmp_path)
+        paper = Paper(title="x", doi="10.1038/abc", url="https://www.nature.com/articles/abc")
+
+        with patch.object(retriever, '_download_url', return_value=False) as mock_download:
+            assert retriever._download_from_ucsb_proxy(paper, tmp_path / "x.pdf") is False
+
+        tried = [call.args[0] for call in mock_download.call_args_list]
+        assert tried[:2] == [
+            "https://proxy.library.ucsb.edu/login?url=https://doi.org/10.1038/abc",
+            "https://proxy.library.ucsb.edu/login?url=https://www.nature.com/articles/abc"
+        ]
+
 
 class TestStatus:
     """Test status reporting"""
@@ -328,6 +470,50 @@ class TestStatus:
 
         assert status['cookies_count'] == 2
 
+    @patch.object(UCSBAuth, '_probe_vpn_connection', return_value=True)
+    def test_vpn_check_is_cached(self, mock_probe):
+        """Test repeated status checks reuse the VPN probe result"""
+        auth = UCSBAuth()
+
+        assert auth.get_status()['vpn_connected'] is True
+        assert auth.get_status()['vpn_connected'] is True
+        assert mock_probe.call_count == 1
+
+        auth.check_vpn_connection(force=True)
+        assert mock_probe.call_count == 2
+
+    def test_authenticated_status_probes_vpn_in_background(self):
+        """Test unexpired cookies answer status without waiting on the VPN probe"""
+        auth = UCSBAuth()
+        auth.is_authenticated = True
+        auth.session.cookies.set('ezproxy', 'abc', expires=int(time.time()) + 3600)
+        release = threading.Event()
+
+        def slow_probe():
+            release.wait(5)
+            return True
+
+        with patch.object(auth, '_probe_vpn_connection', side_effect=slow_probe) as mock_probe:
+            status = auth.get_status()
+            assert status['access_method'] == 'cookies'
+            assert status['vpn_connected'] is False
+
+            auth.get_status()
+            release.set()
+            with auth._vpn_refresh:
+                pass
+
+        assert mock_probe.call_count == 1
+        assert auth.get_status()['access_method'] == 'both'
+
+    def test_vpn_detected_from_proxy_page(self):
+        """Test an on-campus phrase on the proxy page counts as VPN access"""
+        auth = UCSBAuth()
+        page = page_response("<p>You are ON CAMPUS - no login required</p>")
+
+        with patch.object(auth._probe_session, 'get', return_value=page):
+            assert auth.check_vpn_connection() is True
+
 
 class TestGetSession:
     """Test getting authenticated session"""
@@ -412,12 +598,12 @@ class TestEdgeCases:
         status = auth.get_status()
         assert status['cookies_count'] == 1
 
+    @pytest.mark.usefixtures("inconclusive_head")
     @patch('requests.Session.get')
     def test_ambiguous_authentication_status(self, mock_get):
         """Test when authentication status is ambiguous"""
-        mock_response = MagicMock()
         # Response with no clear indicators
-        mock_response.text = "<html><body>Welcome</body></html>"
+        mock_response = page_response("<html><body>Welcome</body></html>")
         mock_get.return_value = mock_response
 
         auth = UCSBAuth()
@@ -445,3 +631,43 @@ class TestEdgeCases:
             t.join()
 
         assert all(results)
+
+
+class TestSessionManagerCookies:
+    """Test SessionManager cookie persistence"""
+
+    def test_save_and_load_cookies(self, tmp_path):
+        """Test cookies round-trip with their domain and path"""
+        manager = SessionManager(cache_dir=tmp_path)
+        manager.session.cookies.set('ezproxy', 'abc', domain='.ucsb.edu', path='/login')
+        manager.save_cookies()
+
+        loaded = SessionManager(cache_dir=tmp_path)
+
+        assert loaded.load_cookies() is True
+        cookie = next(iter(loaded.session.cookies))
+        assert (cookie.name, cookie.value) == ('ezproxy', 'abc')
+        assert (cookie.domain, cookie.path) == ('.ucsb.edu', '/login')
+
+    def test_load_corrupt_cookies(self, tmp_path):
+        """Test an unreadable cookie file is reported, not raised"""
+        (tmp_path / "session_cookies.json").write_text("not json")
+
+        assert SessionManager(cache_dir=tmp_path).load_cookies() is False
+
+
+class TestMergeCookies:
+    """Test merging cookie jars"""
+
+    def test_merge_keeps_existing_cookies(self):
+        """Test merged cookies replace same-named ones and keep the rest"""
+        jar = requests.cookies.RequestsCookieJar()
+        jar.set('keep', '1', domain='.ucsb.edu', path='/')
+        jar.set('ezproxy', 'old', domain='.ucsb.edu', path='/')
+        source = requests.cookies.RequestsCookieJar()
+        source.set('ezproxy', 'new', domain='.ucsb.edu', path='/')
+        source.set('other', '2', domain='.example.com', path='/')
+
+        merge_cookies(jar, source)
+
+        assert {c.name: c.value for c in jar} == {'keep': '1', 'ezproxy': 'new', 'other': '2'}
@@ -0,0 +1,71 @@
+"""Tests for in-process caching utilities"""
+
+import time
+from src.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Test TTLCache class"""
+
+    def test_set_and_get(self):
+        """Test storing and retrieving a value"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", {"value": 1})
+
+        assert cache.get("key") == {"value": 1}
+        assert "key" in cache
+
+    def test_miss_returns_default(self):
+        """Test missing key returns default"""
+        cache = TTLCache()
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_entries_expire(self):
+        """Test entries are dropped after the TTL"""
+        cache = TTLCache(ttl=0.05)
+        cache.set("key", "value")
+
+        time.sleep(0.1)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted when full"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear_and_delete(self):
+        """Test invalidation"""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_delete_where(self):
+        """Test removing entries by key predicate"""
+        cache = TTLCache()
+        cache.set(("/api/visualize/timeline", ()), 1)
+        cache.set(("/api/papers", ()), 2)
+
+        cache.delete_where(lambda key: key[0].startswith("/api/visualize"))
+
+        assert cache.get(("/api/visualize/timeline", ())) is None
+        assert cache.get(("/api/papers", ())) == 2
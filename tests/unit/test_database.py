@@ -453,3 +453,102 @@ class TestEdgeCases:
 
         count = db_session.query(db_models.Paper).count()
         assert count == 100
+
+
+class TestFullTextIndex:
+    """Test FTS5 index maintained over papers and PDF content"""
+
+    def test_search_title_and_abstract(self, db_session):
+        """Test papers are indexed on insert"""
+        from src.database import fts
+
+        db_session.add_all([
+            db_models.Paper(title="Coral reef bleaching", abstract="Ocean warming"),
+            db_models.Paper(title="Forest fire regimes", abstract="Drought")
+        ])
+        db_session.commit()
+
+        ids = fts.search_paper_ids(db_session, "coral")
+        assert len(ids) == 1
+        assert db_session.get(db_models.Paper, ids[0]).title == "Coral reef bleaching"
+
+        # Prefix and stemmed matches
+        assert fts.search_paper_ids(db_session, "warm") == ids
+
+    def test_index_follows_updates_and_pdf_text(self, db_session):
+        """Test triggers keep the index in sync"""
+        from src.database import fts
+
+        paper = db_models.Paper(title="Original title")
+        db_session.add(paper)
+        db_session.commit()
+
+        paper.title = "Renamed title"
+        db_session.add(db_models.PDFContent(paper_id=paper.id, full_text="kelp forests"))
+        db_session.commit()
+
+        assert fts.search_paper_ids(db_session, "original") == []
+        assert fts.search_paper_ids(db_session, "renamed") == [paper.id]
+        assert fts.search_paper_ids(db_session, "kelp") == [paper.id]
+
+        db_session.delete(paper.pdf_content)
+        db_session.commit()
+        assert fts.search_paper_ids(db_session, "kelp") == []
+
+        db_session.delete(paper)
+        db_session.commit()
+        assert fts.search_paper_ids(db_session, "renamed") == []
+
+    def test_query_syntax_is_escaped(self, db_session):
+        """Test FTS5 operators in user input are treated as plain words"""
+        from src.database import fts
+
+        assert fts.build_match_query('coral AND "reef') == '"coral"* "AND"* "reef"*'
+        assert fts.search_paper_ids(db_session, '"*)') == []
+
+
+class TestLibraryStats:
+    """Test trigger-maintained library counters"""
+
+    def test_counts_follow_inserts_updates_and_deletes(self, db_session):
+        """Test triggers keep the totals in step with the tables"""
+        from src.database import stats
+
+        assert stats.read_counts(db_session) == (0, 0, 0, 0)
+
+        paper = db_models.Paper(title="Paper", local_pdf_path="/tmp/paper.pdf")
+        db_session.add_all([
+            paper,
+            db_models.Paper(title="No PDF"),
+            db_models.Collection(name="Reading list"),
+            db_models.SearchHistory(query="coral", results_count=1)
+        ])
+        db_session.commit()
+        assert stats.read_counts(db_session) == (2, 1, 1, 1)
+
+        paper.local_pdf_path = None
+        db_session.commit()
+        assert stats.read_counts(db_session) == (2, 0, 1, 1)
+
+        db_session.delete(paper)
+        db_session.commit()
+        assert stats.read_counts(db_session) == (1, 0, 1, 1)
+
+
+class TestFullTextSearch:
+    """Test the full-text index"""
+
+    def test_any_term_matches_papers_with_some_words(self, db_session):
+        """Test any_term ORs the query words while the default ANDs them"""
+        from src.database import fts
+
+        db_session.add_all([
+            db_models.Paper(title="Coral bleaching events"),
+            db_models.Paper(title="Kelp forest decline"),
+            db_models.Paper(title="Coral and kelp competition")
+        ])
+        db_session.commit()
+
+        assert len(fts.search_paper_ids(db_session, "coral kelp")) == 1
+        assert len(fts.search_paper_ids(db_session, "coral kelp", any_term=True)) == 3
+        assert fts.search_paper_ids(db_session, "!!!", any_term=True) == []
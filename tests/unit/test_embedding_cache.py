@@ -0,0 +1,135 @@
+"""Tests for semantic search embedding caches"""
+
+import numpy as np
+from src.utils.embedding_cache import (
+    EmbeddingCache, QueryResultCache, VectorIndex, content_hash, dequantize, embed_by_length,
+    quantize
+)
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache class"""
+
+    def test_put_and_get(self, tmp_path):
+        """Test vectors round-trip through the store"""
+        cache = EmbeddingCache(tmp_path / "embeddings.db")
+        key = content_hash("Coral reefs")
+        cache.put_many({key: np.array([0.1, 0.2, 0.3])})
+
+        found = cache.get_many([key, content_hash("missing")])
+
+        assert list(found) == [key]
+        assert found[key].dtype == np.float32
+        np.testing.assert_allclose(found[key], [0.1, 0.2, 0.3], atol=0.3 / 127)
+
+    def test_quantize_round_trip(self):
+        """Test int8 quantization keeps vectors within one step of the original"""
+        vector = np.random.default_rng(0).standard_normal(384).astype(np.float32)
+        quantized, scale = quantize(vector)
+
+        assert quantized.dtype == np.int8
+        assert np.abs(quantized).max() == 127
+        np.testing.assert_allclose(dequantize(quantized, scale), vector, atol=scale / 2 + 1e-6)
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test embeddings survive reopening the store"""
+        path = tmp_path / "embeddings.db"
+        EmbeddingCache(path).put_many({"abc": np.ones(4)})
+
+        assert len(EmbeddingCache(path)) == 1
+        assert "abc" in EmbeddingCache(path).get_many(["abc"])
+
+
+class TestQueryResultCache:
+    """Test QueryResultCache class"""
+
+    def test_similar_query_hits(self):
+        """Test a query within the threshold reuses the cached ranking"""
+        cache = QueryResultCache(threshold=0.87)
+        cache.set(np.array([1.0, 0.0]), "scope", 5, [(2, 0.9), (0, 0.5)])
+
+        assert cache.get(np.array([0.95, 0.1]), "scope", 5) == [(2, 0.9), (0, 0.5)]
+        assert cache.get(np.array([0.0, 1.0]), "scope", 5) is None
+
+    def test_scope_and_top_k_must_match(self):
+        """Test rankings are not reused across candidate sets or sizes"""
+        cache = QueryResultCache()
+        cache.set(np.array([1.0, 0.0]), "scope", 5, [(0, 1.0)])
+
+        assert cache.get(np.array([1.0, 0.0]), "other", 5) is None
+        assert cache.get(np.array([1.0, 0.0]), "scope", 10) is None
+
+    def test_lru_eviction(self):
+        """Test the oldest query is evicted when full"""
+        cache = QueryResultCache(maxsize=1)
+        cache.set(np.array([1.0, 0.0]), "scope", 5, [(0, 1.0)])
+        cache.set(np.array([0.0, 1.0]), "scope", 5, [(1, 1.0)])
+
+        assert len(cache) == 1
+        assert cache.get(np.array([1.0, 0.0]), "scope", 5) is None
+
+
+class TestVectorIndex:
+    """Test VectorIndex class"""
+
+    @staticmethod
+    def embed_by_length(calls):
+        """Embedder that records the texts it was asked to encode"""
+        def embed(texts):
+            calls.extend(texts)
+            return [np.array([1.0, len(text)], dtype=np.float32) / np.hypot(1.0, len(text))
+                    for text in texts]
+        return embed
+
+    def test_search_excludes_query_document(self):
+        """Test nearest neighbours are ranked and skip the excluded ID"""
+        index = VectorIndex()
+        index.sync({1: "a", 2: "ab", 3: "abcdefgh"}, self.embed_by_length([]))
+
+        results = index.search(index.vector(1), top_k=5, exclude=1)
+
+        assert [doc_id for doc_id, _ in results] == [2, 3]
+        assert results[0][1] > results[1][1]
+
+    def test_sync_embeds_only_changes(self):
+        """Test unchanged documents are not re-embedded and deleted ones are dropped"""
+        index = VectorIndex()
+        calls = []
+        index.sync({1: "a", 2: "ab"}, self.embed_by_length(calls))
+        index.sync({1: "a", 3: "abc"}, self.embed_by_length(calls))
+
+        assert calls == ["a", "ab", "abc"]
+        assert len(index) == 2
+        assert index.vector(2) is None
+
+    def test_sync_skips_current_version(self):
+        """Test a sync for the version already indexed does no work"""
+        index = VectorIndex()
+        calls = []
+        index.sync({1: "a"}, self.embed_by_length(calls), version="1:2024")
+
+        assert index.is_current("1:2024")
+        assert not index.is_current("2:2024")
+
+        index.sync({1: "a", 2: "ab"}, self.embed_by_length(calls), version="1:2024")
+
+        assert calls == ["a"]
+        assert len(index) == 1
+
+
+class TestEmbedByLength:
+    """Test embed_by_length function"""
+
+    def test_batches_by_length_and_keeps_order(self):
+        """Test batches hold similar lengths and results follow the input order"""
+        texts = ["aaaa", "a", "aaaaaa", "aa", "aaaaa", "aaa"]
+        batches = []
+
+        def embed(batch):
+            batches.append(batch)
+            return [np.array([len(text)], dtype=np.float32) for text in batch]
+
+        vectors = embed_by_length(texts, embed, batch_size=2)
+
+        assert batches == [["a", "aa"], ["aaa", "aaaa"], ["aaaaa", "aaaaaa"]]
+        assert [int(vector[0]) for vector in vectors] == [len(text) for text in texts]
@@ -0,0 +1,44 @@
+"""Tests for search orchestrator"""
+
+import threading
+from unittest.mock import Mock
+from src.models import Paper, Source
+from src.search.orchestrator import SearchOrchestrator
+
+
+class TestGetPaperById:
+    """Test looking up a paper by identifier"""
+
+    def test_candidates_run_concurrently_and_keep_priority(self):
+        """Test every candidate is asked at once and the first hit in priority order wins"""
+        both_called = threading.Barrier(2, timeout=5)
+
+        def lookup(title):
+            def get_paper_by_id(identifier):
+                both_called.wait()
+                return Paper(title=title)
+            return get_paper_by_id
+
+        orchestrator = SearchOrchestrator()
+        orchestrator.providers = {
+            Source.CROSSREF: Mock(get_paper_by_id=lookup("From Crossref")),
+            Source.ARXIV: Mock(get_paper_by_id=lookup("From arXiv"))
+        }
+
+        # A DOI with one dot also looks like an arXiv ID
+        paper = orchestrator.get_paper_by_id("10.1038/nature12373")
+
+        assert paper.title == "From Crossref"
+
+    def test_falls_through_misses_to_hint(self):
+        """Test the source hint answers when the identifier-based guesses miss"""
+        orchestrator = SearchOrchestrator()
+        orchestrator.providers = {
+            Source.PUBMED: Mock(**{"get_paper_by_id.return_value": None}),
+            Source.SEMANTIC_SCHOLAR: Mock(**{"get_paper_by_id.return_value": Paper(title="Found")})
+        }
+
+        paper = orchestrator.get_paper_by_id("35360497", Source.SEMANTIC_SCHOLAR)
+
+        assert paper.title == "Found"
+        orchestrator.providers[Source.PUBMED].get_paper_by_id.assert_called_once_with("35360497")
@@ -0,0 +1,96 @@
+"""Tests for paper service"""
+
+from unittest.mock import patch
+from backend.services.paper_service import resolve_authors, save_papers_bulk
+from src.database import models as db_models
+from src.models import Author, Paper, Source
+
+
+class TestSavePapersBulk:
+    """Test saving batches of search results"""
+
+    def test_new_papers_keep_input_order(self, db_session):
+        """Test new papers are inserted and returned in input order"""
+        papers = [
+            Paper(title="First", doi="10.1/a", authors=[Author(name="Ada")]),
+            Paper(title="Second", pmid="123"),
+            Paper(title="Third", authors=[Author(name="Bob"), Author(name="Ada")])
+        ]
+
+        saved = save_papers_bulk(db_session, papers)
+
+        assert [p.title for p in saved] == ["First", "Second", "Third"]
+        assert [a.name for a in saved[2].authors] == ["Bob", "Ada"]
+        assert db_session.query(db_models.Author).count() == 2
+
+    def test_matches_stored_papers_by_any_identifier(self, db_session):
+        """Test results matching a stored DOI, PMID or arXiv ID update it"""
+        stored = save_papers_bulk(db_session, [
+            Paper(title="By DOI", doi="10.1/a", citations=1, sources=[Source.PUBMED]),
+            Paper(title="By PMID", pmid="123"),
+            Paper(title="By arXiv", arxiv_id="2401.00001")
+        ])
+
+        saved = save_papers_bulk(db_session, [
+            Paper(title="By DOI", doi="10.1/a", citations=5, sources=[Source.ARXIV]),
+            Paper(title="By PMID", pmid="123", abstract="Abstract"),
+            Paper(title="By arXiv", arxiv_id="2401.00001")
+        ])
+
+        assert [p.id for p in saved] == [p.id for p in stored]
+        assert saved[0].citations == 5
+        assert sorted(saved[0].sources) == ["arxiv", "pubmed"]
+        assert saved[1].abstract == "Abstract"
+        assert db_session.query(db_models.Paper).count() == 3
+
+    def test_duplicates_within_batch_are_merged(self, db_session):
+        """Test results sharing an identifier become one paper"""
+        saved = save_papers_bulk(db_session, [
+            Paper(title="Paper", doi="10.1/a", citations=2),
+            Paper(title="Paper", doi="10.1/a", citations=7)
+        ])
+
+        assert saved[0].id == saved[1].id
+        assert saved[0].citations == 7
+
+    def test_doi_stored_concurrently_keeps_batch(self, db_session):
+        """Test a DOI stored by another request after matching merges instead of failing"""
+        stored = save_papers_bulk(db_session, [
+            Paper(title="Paper", doi="10.1/a", authors=[Author(name="Ada")])
+        ])
+
+        # The other request's insert lands after this batch was matched
+        with patch('backend.services.paper_service._find_stored_papers', return_value={}):
+            saved = save_papers_bulk(db_session, [
+                Paper(title="Paper", doi="10.1/a", citations=4,
+                      authors=[Author(name="Ada"), Author(name="Bob")]),
+                Paper(title="Other", doi="10.1/b")
+            ])
+
+        assert saved[0].id == stored[0].id
+        assert saved[0].citations == 4
+        assert sorted(a.name for a in saved[0].authors) == ["Ada", "Bob"]
+        assert db_session.query(db_models.Paper).count() == 2
+
+
+class TestResolveAuthors:
+    """Test batch author resolution"""
+
+    def test_matches_by_orcid_then_name(self, db_session):
+        """Test stored authors are reused and new ones inserted once"""
+        db_session.add(db_models.Author(name="A. Lovelace", orcid="0000-0001"))
+        db_session.add(db_models.Author(name="Bob"))
+        db_session.commit()
+
+        ids = resolve_authors(db_session, [
+            Author(name="Ada Lovelace", orcid="0000-0001"),
+            Author(name="Bob"),
+            Author(name="Carol"),
+            Author(name="Carol")
+        ])
+
+        stored = {a.name: a.id for a in db_session.query(db_models.Author)}
+        assert ids[("orcid", "0000-0001")] == stored["A. Lovelace"]
+        assert ids[("name", "Bob")] == stored["Bob"]
+        assert ids[("name", "Carol")] == stored["Carol"]
+        assert len(stored) == 3
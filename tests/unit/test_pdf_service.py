@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
+from backend.services import pdf_service
 from backend.services.pdf_service import (
     extract_text_from_pdf,
     clean_extracted_text,
@@ -11,6 +12,13 @@ from backend.services.pdf_service import (
 )
 
 
+@pytest.fixture(autouse=True)
+def text_cache_dir(tmp_path, monkeypatch):
+    """Keep the extracted-text cache out of the real cache directory"""
+    monkeypatch.setattr(pdf_service, "TEXT_CACHE_DIR", tmp_path / "pdf_text")
+    return tmp_path / "pdf_text"
+
+
 class TestPDFTextExtraction:
     """Test PDF text extraction"""
 
@@ -127,6 +135,95 @@ class TestPDFTextExtraction:
         assert page_count == 100
         assert len(text) > 1000
 
+    def test_extract_text_max_pages(self, temp_dir):
+        """Test extraction limited to the first pages"""
+        pymupdf = pytest.importorskip("pymupdf")
+
+        doc = pymupdf.open()
+        for i in range(3):
+            doc.new_page().insert_text((72, 72), f"Content of page {i}")
+        pdf_path = temp_dir / "three_pages.pdf"
+        doc.save(pdf_path)
+        doc.close()
+
+        text, page_count = extract_text_from_pdf(str(pdf_path), max_pages=1)
+
+        assert page_count == 3
+        assert "page 0" in text
+        assert "page 1" not in text
+
+    def test_extract_page_range(self, temp_dir):
+        """Test a worker task returns only its slice of pages"""
+        pymupdf = pytest.importorskip("pymupdf")
+
+        doc = pymupdf.open()
+        for i in range(4):
+            doc.new_page().insert_text((72, 72), f"Content of page {i}")
+        pdf_path = temp_dir / "four_pages.pdf"
+        doc.save(pdf_path)
+        doc.close()
+
+        pages = pdf_service._extract_page_range(str(pdf_path), 1, 3)
+
+        assert len(pages) == 2
+        assert "page 1" in pages[0]
+        assert "page 2" in pages[1]
+
+    def test_analyze_pdf_opens_once(self, temp_dir):
+        """Test text, page count and metadata come from a single open"""
+        pymupdf = pytest.importorskip("pymupdf")
+
+        doc = pymupdf.open()
+        doc.new_page().insert_text((72, 72), "Analyzed content")
+        doc.set_metadata({"title": "Coral Reefs"})
+        pdf_path = temp_dir / "paper.pdf"
+        doc.save(pdf_path)
+        doc.close()
+
+        with patch('pymupdf.open', wraps=pymupdf.open) as mock_open:
+            text, page_count, metadata = pdf_service.analyze_pdf(str(pdf_path))
+
+        assert mock_open.call_count == 1
+        assert "Analyzed content" in text
+        assert page_count == 1
+        assert metadata["title"] == "Coral Reefs"
+
+
+class TestTextCache:
+    """Test caching of extracted text"""
+
+    @staticmethod
+    def write_pdf(path, text):
+        pymupdf = pytest.importorskip("pymupdf")
+        doc = pymupdf.open()
+        doc.new_page().insert_text((72, 72), text)
+        doc.save(path)
+        doc.close()
+
+    def test_unchanged_pdf_is_not_parsed_again(self, temp_dir, text_cache_dir):
+        """Test a second extraction is served from the cache"""
+        pdf_path = temp_dir / "paper.pdf"
+        self.write_pdf(pdf_path, "Cached content")
+
+        first = extract_text_from_pdf(str(pdf_path))
+        with patch('backend.services.pdf_service._parse_pdf_text', side_effect=AssertionError):
+            second = extract_text_from_pdf(str(pdf_path))
+
+        assert second == first
+        assert "Cached content" in second[0]
+        assert len(list(text_cache_dir.iterdir())) == 1
+
+    def test_changed_pdf_is_parsed_again(self, temp_dir):
+        """Test replacing the file invalidates the cached text"""
+        pdf_path = temp_dir / "paper.pdf"
+        self.write_pdf(pdf_path, "First version")
+        extract_text_from_pdf(str(pdf_path))
+
+        self.write_pdf(pdf_path, "Second version, longer")
+        text, _ = extract_text_from_pdf(str(pdf_path))
+
+        assert "Second version" in text
+
 
 class TestTextCleaning:
     """Test text cleaning utilities"""
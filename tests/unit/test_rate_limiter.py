@@ -202,3 +202,38 @@ class TestEdgeCases:
         elapsed = time.time() - start
 
         assert elapsed < 1.5  # With tolerance
+
+
+class TestWaitIfNeeded:
+    """Test RateLimiter.wait_if_needed across threads"""
+
+    def test_concurrent_callers_are_spaced(self):
+        """Test threads sharing a key each get their own slot"""
+        import threading
+
+        limiter = RateLimiter(calls_per_second=20)
+        times = []
+
+        def call():
+            limiter.wait_if_needed("host")
+            times.append(time.time())
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        times.sort()
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert min(gaps) >= 0.04
+
+    def test_keys_are_independent(self):
+        """Test different keys don't wait on each other"""
+        limiter = RateLimiter(calls_per_second=1)
+
+        start = time.time()
+        limiter.wait_if_needed("a.example")
+        limiter.wait_if_needed("b.example")
+
+        assert time.time() - start < 0.1
@@ -0,0 +1,43 @@
+"""Tests for the persistent search result cache"""
+
+from unittest.mock import patch
+from src.utils.result_cache import SearchResultCache
+
+
+class TestSearchResultCache:
+    """Test SearchResultCache class"""
+
+    def test_set_and_get(self, tmp_path):
+        """Test payloads round-trip and persist across instances"""
+        key = SearchResultCache.key('{"query": "coral"}')
+        SearchResultCache(tmp_path / "results.db").set(key, b"payload")
+
+        cache = SearchResultCache(tmp_path / "results.db")
+
+        assert cache.get(key) == b"payload"
+        assert cache.get(SearchResultCache.key('{"query": "kelp"}')) is None
+
+    def test_expired_entry_is_dropped(self, tmp_path):
+        """Test entries older than the TTL miss and are removed"""
+        cache = SearchResultCache(tmp_path / "results.db", ttl=60)
+
+        with patch('src.utils.result_cache.time.time', return_value=1000.0):
+            cache.set("key", b"payload")
+        with patch('src.utils.result_cache.time.time', return_value=1061.0):
+            assert cache.get("key") is None
+
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, tmp_path):
+        """Test the least recently read entry is evicted when full"""
+        cache = SearchResultCache(tmp_path / "results.db", maxsize=2)
+
+        with patch('src.utils.result_cache.time.time', side_effect=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0]):
+            cache.set("a", b"1")
+            cache.set("b", b"2")
+            cache.get("a")
+            cache.set("c", b"3")
+
+            assert len(cache) == 2
+            assert cache.get("b") is None
+            assert cache.get("a") == b"1"
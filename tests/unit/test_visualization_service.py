@@ -2,11 +2,14 @@
 
 import pytest
 import json
+from unittest.mock import patch
 from backend.services.visualization_service import (
     get_timeline_data,
     get_citation_network,
     get_topic_clusters,
-    get_author_network
+    get_author_network,
+    get_cached_visualization,
+    refresh_visualizations
 )
 from src.database import models as db_models
 
@@ -252,9 +255,9 @@ class TestTopicClusters:
     def test_clusters_basic(self, db_session):
         """Test basic clustering"""
         papers = [
-            db_models.Paper(title="P1", keywords='["machine learning", "AI"]'),
-            db_models.Paper(title="P2", keywords='["machine learning", "deep learning"]'),
-            db_models.Paper(title="P3", keywords='["healthcare", "medicine"]'),
+            db_models.Paper(title="P1", keywords=["machine learning", "AI"]),
+            db_models.Paper(title="P2", keywords=["machine learning", "deep learning"]),
+            db_models.Paper(title="P3", keywords=["healthcare", "medicine"]),
         ]
         db_session.add_all(papers)
         db_session.commit()
@@ -268,10 +271,10 @@ class TestTopicClusters:
     def test_clusters_minimum_size(self, db_session):
         """Test that clusters have minimum 2 papers"""
         papers = [
-            db_models.Paper(title="P1", keywords='["unique1"]'),
-            db_models.Paper(title="P2", keywords='["unique2"]'),
-            db_models.Paper(title="P3", keywords='["common"]'),
-            db_models.Paper(title="P4", keywords='["common"]'),
+            db_models.Paper(title="P1", keywords=["unique1"]),
+            db_models.Paper(title="P2", keywords=["unique2"]),
+            db_models.Paper(title="P3", keywords=["common"]),
+            db_models.Paper(title="P4", keywords=["common"]),
         ]
         db_session.add_all(papers)
         db_session.commit()
@@ -286,7 +289,7 @@ class TestTopicClusters:
     def test_clusters_no_duplicates(self, db_session):
         """Test that papers appear in only one cluster"""
         papers = [
-            db_models.Paper(title=f"P{i}", keywords='["tag1", "tag2"]')
+            db_models.Paper(title=f"P{i}", keywords=["tag1", "tag2"])
             for i in range(5)
         ]
         db_session.add_all(papers)
@@ -304,9 +307,9 @@ class TestTopicClusters:
     def test_clusters_other_category(self, db_session):
         """Test 'Other' cluster for unclustered papers"""
         papers = [
-            db_models.Paper(title="P1", keywords='["common"]'),
-            db_models.Paper(title="P2", keywords='["common"]'),
-            db_models.Paper(title="P3", keywords='["rare"]'),
+            db_models.Paper(title="P1", keywords=["common"]),
+            db_models.Paper(title="P2", keywords=["common"]),
+            db_models.Paper(title="P3", keywords=["rare"]),
         ]
         db_session.add_all(papers)
         db_session.commit()
@@ -323,7 +326,7 @@ class TestTopicClusters:
         papers = []
         for i in range(50):
             papers.append(
-                db_models.Paper(title=f"P{i}", keywords=f'["keyword{i%20}"]')
+                db_models.Paper(title=f"P{i}", keywords=[f"keyword{i%20}"])
             )
         db_session.add_all(papers)
         db_session.commit()
@@ -337,9 +340,9 @@ class TestTopicClusters:
         """Test handling of papers without keywords"""
         papers = [
             db_models.Paper(title="P1", keywords=None),
-            db_models.Paper(title="P2", keywords='[]'),
-            db_models.Paper(title="P3", keywords='["valid"]'),
-            db_models.Paper(title="P4", keywords='["valid"]'),
+            db_models.Paper(title="P2", keywords=[]),
+            db_models.Paper(title="P3", keywords=["valid"]),
+            db_models.Paper(title="P4", keywords=["valid"]),
         ]
         db_session.add_all(papers)
         db_session.commit()
@@ -352,9 +355,9 @@ class TestTopicClusters:
     def test_clusters_case_insensitive(self, db_session):
         """Test that keywords are case-insensitive"""
         papers = [
-            db_models.Paper(title="P1", keywords='["Machine Learning"]'),
-            db_models.Paper(title="P2", keywords='["machine learning"]'),
-            db_models.Paper(title="P3", keywords='["MACHINE LEARNING"]'),
+            db_models.Paper(title="P1", keywords=["Machine Learning"]),
+            db_models.Paper(title="P2", keywords=["machine learning"]),
+            db_models.Paper(title="P3", keywords=["MACHINE LEARNING"]),
         ]
         db_session.add_all(papers)
         db_session.commit()
@@ -367,9 +370,9 @@ class TestTopicClusters:
     def test_clusters_with_collection_filter(self, db_session):
         """Test clustering filtered by collection"""
         collection = db_models.Collection(name="Test")
-        paper1 = db_models.Paper(title="P1", keywords='["ml"]')
-        paper2 = db_models.Paper(title="P2", keywords='["ml"]')
-        paper3 = db_models.Paper(title="P3", keywords='["other"]')
+        paper1 = db_models.Paper(title="P1", keywords=["ml"])
+        paper2 = db_models.Paper(title="P2", keywords=["ml"])
+        paper3 = db_models.Paper(title="P3", keywords=["other"])
 
         collection.papers.extend([paper1, paper2])
 
@@ -549,3 +552,55 @@ class TestEdgeCases:
         result = get_timeline_data(db_session, collection_id=99999)
 
         assert len(result.data) == 0
+
+
+class TestMaterializedPayloads:
+    """Test visualization payloads stored in the database"""
+
+    def test_payload_stored_on_first_request(self, db_session):
+        """Test first request computes and stores the payload"""
+        db_session.add(db_models.Paper(title="P1", year=2023))
+        db_session.commit()
+
+        payload = get_cached_visualization(db_session, "timeline")
+
+        assert payload["data"][0]["year"] == 2023
+        row = db_session.get(db_models.VisualizationCache, ("timeline", 0))
+        assert row.payload == payload
+
+    def test_payload_served_until_refreshed(self, db_session):
+        """Test writes show up after a refresh, not before"""
+        db_session.add(db_models.Paper(title="P1", year=2023))
+        db_session.commit()
+        get_cached_visualization(db_session, "timeline")
+
+        db_session.add(db_models.Paper(title="P2", year=2024))
+        db_session.commit()
+        assert len(get_cached_visualization(db_session, "timeline")["data"]) == 1
+
+        refresh_visualizations(db_session)
+        assert len(get_cached_visualization(db_session, "timeline")["data"]) == 2
+
+    def test_changed_library_triggers_refresh(self, db_session):
+        """Test a write made outside the API is picked up on the next read"""
+        db_session.add(db_models.Paper(title="P1", year=2023))
+        db_session.commit()
+        get_cached_visualization(db_session, "timeline")
+
+        db_session.add(db_models.Paper(title="P2", year=2024))
+        db_session.commit()
+        get_cached_visualization(db_session, "timeline")  # refreshes inline in memory
+        db_session.expire_all()
+
+        assert len(get_cached_visualization(db_session, "timeline")["data"]) == 2
+
+    def test_refresh_skips_unchanged_payloads(self, db_session):
+        """Test payloads are only recomputed when their papers changed"""
+        db_session.add(db_models.Paper(title="P1", year=2023))
+        db_session.commit()
+        get_cached_visualization(db_session, "timeline")
+
+        with patch('backend.services.visualization_service._compute_payload') as compute:
+            refresh_visualizations(db_session)
+
+        compute.assert_not_called()